@@ -0,0 +1,155 @@
+from PySide6.QtWidgets import QStyledItemDelegate
+from PySide6.QtCore import Qt, QModelIndex, QAbstractListModel, QRect, QSize
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter
+from ..icons import ICONS, tinted_pixmap
+
+STATUS_COLORS = {
+    "success": "#10B981",
+    "info": "#3B82F6",
+    "warning": "#F59E0B",
+    "error": "#EF4444",
+}
+
+ACTIVITY_ROW_HEIGHT = 50
+ACTIVITY_BUBBLE_SIZE = 32
+ACTIVITY_ICON_SIZE = QSize(16, 16)
+ACTIVITY_TEXT_GAP = 12
+STATS_CARD_HEIGHT = 72
+STATS_COLUMNS = 2
+
+
+def _font(pixel_size: int, weight: QFont.Weight = QFont.Normal) -> QFont:
+    font = QFont()
+    font.setPixelSize(pixel_size)
+    font.setWeight(weight)
+    return font
+
+
+class DictListModel(QAbstractListModel):
+    """Read-only list model over plain dict rows; delegates read the row via UserRole"""
+
+    def __init__(self, rows=None, display_key: str = "", parent=None):
+        super().__init__(parent)
+        self._rows = list(rows or [])
+        self._display_key = display_key
+
+    def set_rows(self, rows):
+        """Replace every row"""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+
+        row = self._rows[index.row()]
+        if role == Qt.UserRole:
+            return row
+        elif role == Qt.DisplayRole and self._display_key:
+            return row.get(self._display_key)
+
+        return None
+
+
+class ActivityDelegate(QStyledItemDelegate):
+    """Paints an activity row: tinted status bubble, action line and meta line"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.action_font = _font(13, QFont.Medium)
+        self.meta_font = _font(11)
+        self.action_color = QColor("#111827")
+        self.meta_color = QColor("#6B7280")
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), ACTIVITY_ROW_HEIGHT)
+
+    def paint(self, painter, option, index):
+        activity = index.data(Qt.UserRole)
+        if not activity:
+            return
+
+        rect = option.rect
+        color = QColor(STATUS_COLORS.get(activity["type"], STATUS_COLORS["info"]))
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing, True)
+
+        # Status bubble with the icon tinted in the status colour
+        bubble = QRect(rect.left(), rect.top() + (rect.height() - ACTIVITY_BUBBLE_SIZE) // 2,
+                       ACTIVITY_BUBBLE_SIZE, ACTIVITY_BUBBLE_SIZE)
+        fill = QColor(color)
+        fill.setAlpha(32)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(fill)
+        painter.drawEllipse(bubble)
+
+        icon = tinted_pixmap(ICONS[activity["icon"]], color, ACTIVITY_ICON_SIZE,
+                             painter.device().devicePixelRatioF())
+        painter.drawPixmap(bubble.left() + (ACTIVITY_BUBBLE_SIZE - ACTIVITY_ICON_SIZE.width()) // 2,
+                           bubble.top() + (ACTIVITY_BUBBLE_SIZE - ACTIVITY_ICON_SIZE.height()) // 2,
+                           icon)
+
+        # Two text lines either side of the row's midline
+        text_rect = rect.adjusted(ACTIVITY_BUBBLE_SIZE + ACTIVITY_TEXT_GAP, 0, 0, 0)
+        middle = rect.height() // 2
+
+        painter.setFont(self.action_font)
+        painter.setPen(self.action_color)
+        action = QFontMetrics(self.action_font).elidedText(activity["action"], Qt.ElideRight, text_rect.width())
+        painter.drawText(text_rect.adjusted(0, 0, 0, -middle - 1), Qt.AlignLeft | Qt.AlignBottom, action)
+
+        painter.setFont(self.meta_font)
+        painter.setPen(self.meta_color)
+        meta = QFontMetrics(self.meta_font).elidedText(f"by {activity['user']} • {activity['time']}",
+                                                       Qt.ElideRight, text_rect.width())
+        painter.drawText(text_rect.adjusted(0, middle + 1, 0, 0), Qt.AlignLeft | Qt.AlignTop, meta)
+
+        painter.restore()
+
+
+class StatsCardDelegate(QStyledItemDelegate):
+    """Paints a quick-stat cell: value, label and period stacked in white"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.value_font = _font(20, QFont.Bold)
+        self.label_font = _font(11)
+        self.period_font = _font(9)
+        self.value_color = QColor(255, 255, 255)
+        self.label_color = QColor(255, 255, 255, 204)
+        self.period_color = QColor(255, 255, 255, 153)
+
+    def sizeHint(self, option, index):
+        view = option.widget
+        spacing = view.spacing() if view is not None else 0
+        width = view.viewport().width() if view is not None else option.rect.width()
+        return QSize(max(0, width // STATS_COLUMNS - 2 * spacing), STATS_CARD_HEIGHT)
+
+    def paint(self, painter, option, index):
+        stat = index.data(Qt.UserRole)
+        if not stat:
+            return
+
+        painter.save()
+        painter.setRenderHint(QPainter.TextAntialiasing, True)
+
+        top = option.rect.top()
+        for text, font, color in (
+            (stat["value"], self.value_font, self.value_color),
+            (stat["label"], self.label_font, self.label_color),
+            (stat["period"], self.period_font, self.period_color),
+        ):
+            metrics = QFontMetrics(font)
+            line = QRect(option.rect.left(), top, option.rect.width(), metrics.height())
+            painter.setFont(font)
+            painter.setPen(color)
+            painter.drawText(line, Qt.AlignLeft | Qt.AlignVCenter,
+                             metrics.elidedText(text, Qt.ElideRight, line.width()))
+            top += metrics.height() + 4
+
+        painter.restore()
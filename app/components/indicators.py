@@ -0,0 +1,67 @@
+from PySide6.QtWidgets import QWidget, QSizePolicy
+from PySide6.QtCore import Qt, QSize
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter
+
+
+class Dot(QWidget):
+    """Filled status circle, painted directly instead of through a stylesheet"""
+
+    def __init__(self, color, size: int = 8, parent=None):
+        super().__init__(parent)
+        self._color = QColor(color)
+        self.setFixedSize(size, size)
+
+    def set_color(self, color):
+        self._color = QColor(color)
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._color)
+        painter.drawEllipse(self.rect())
+        painter.end()
+
+
+class PillLabel(QWidget):
+    """Short text on a rounded background: trend pills, grade badges"""
+
+    def __init__(self, text: str, color, background, pixel_size: int = 12,
+                 weight: QFont.Weight = QFont.DemiBold, radius: int = 12,
+                 padding: int = 8, parent=None):
+        super().__init__(parent)
+        self._text = text
+        self._color = QColor(color)
+        self._background = QColor(background)
+        self._radius = radius
+        self._padding = padding
+
+        font = QFont(self.font())
+        font.setPixelSize(pixel_size)
+        font.setWeight(weight)
+        self.setFont(font)
+        self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+
+    def text(self) -> str:
+        return self._text
+
+    def setText(self, text: str):
+        self._text = text
+        self.updateGeometry()
+        self.update()
+
+    def sizeHint(self) -> QSize:
+        metrics = QFontMetrics(self.font())
+        return QSize(metrics.horizontalAdvance(self._text) + 2 * self._padding,
+                     metrics.height() + self._padding)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._background)
+        painter.drawRoundedRect(self.rect(), self._radius, self._radius)
+        painter.setPen(self._color)
+        painter.drawText(self.rect(), Qt.AlignCenter, self._text)
+        painter.end()
@@ -1,14 +1,54 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor
-from ..icons import ICONS, SvgIcon
+from PySide6.QtCore import Qt, QSize, Signal
+from PySide6.QtGui import QColor, QIcon, QPainter
+from ..icons import ICONS, SvgIcon, tinted_pixmap
+from .indicators import Dot
+
+NAV_ICON_SIZE = QSize(18, 18)
+LOCK_ICON_SIZE = QSize(14, 14)
+LOCK_COLOR = QColor("#999999")
+
+
+class NavButton(QPushButton):
+    """Checkable sidebar entry that draws its icon, label and lock itself"""
+    
+    def __init__(self, label: str, icon_key: str, locked: bool, theme, parent=None):
+        super().__init__(label, parent)
+        self.locked = locked
+        self.setObjectName("navButton")
+        self.setCheckable(True)
+        self.setAutoExclusive(True)
+        self.setCursor(Qt.PointingHandCursor)
+        
+        # Checked entries sit on the secondary colour, so swap to a white glyph
+        svg = ICONS.get(icon_key, "")
+        icon = QIcon()
+        icon.addPixmap(tinted_pixmap(svg, theme.primary, NAV_ICON_SIZE), QIcon.Normal, QIcon.Off)
+        icon.addPixmap(tinted_pixmap(svg, QColor("#FFFFFF"), NAV_ICON_SIZE), QIcon.Normal, QIcon.On)
+        self.setIcon(icon)
+        self.setIconSize(NAV_ICON_SIZE)
+    
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.locked:
+            painter = QPainter(self)
+            x = self.width() - LOCK_ICON_SIZE.width() - 15
+            y = (self.height() - LOCK_ICON_SIZE.height()) // 2
+            painter.drawPixmap(x, y, tinted_pixmap(ICONS["Lock"], LOCK_COLOR, LOCK_ICON_SIZE, self.devicePixelRatioF()))
+            painter.end()
+
+
 class Sidebar(QWidget):
+    navigation_changed = Signal(str)
+    
     def __init__(self, theme,parent=None):
         super().__init__(parent)
         self.theme = theme
         self.setup_ui()
         
     def setup_ui(self):
+        # Hold repaints until the whole tree is in place
+        self.setUpdatesEnabled(False)
         self.setFixedWidth(250)
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
@@ -16,34 +56,20 @@ class Sidebar(QWidget):
         
         # Header
         header = QWidget()
-        header.setStyleSheet(f"background-color: {self.theme.primary.name()};")
+        header.setObjectName("sidebarHeader")
         header_layout = QHBoxLayout()
         header_layout.setContentsMargins(15, 15, 15, 15)
         
         icon = QLabel()
         icon.setFixedSize(40, 40)
-        icon.setStyleSheet(f"""
-            background-color: {self.theme.secondary.name()};
-            border-radius: 8px;
-            color: white;
-            font-weight: bold;
-            font-size: 16px;
-            qproperty-alignment: AlignCenter;
-        """)
+        icon.setObjectName("sidebarLogo")
         icon.setText("M")
         
         title = QLabel("Marka")
-        title.setStyleSheet("""
-            font-size: 16px;
-            font-weight: bold;
-            color: white;
-        """)
+        title.setObjectName("sidebarTitle")
         
         subtitle = QLabel("Report Card System")
-        subtitle.setStyleSheet("""
-            font-size: 12px;
-            color: rgba(255, 255, 255, 0.7);
-        """)
+        subtitle.setObjectName("sidebarSubtitle")
         
         title_layout = QVBoxLayout()
         title_layout.addWidget(title)
@@ -62,89 +88,50 @@ class Sidebar(QWidget):
         nav_layout.setSpacing(5)
         
         nav_items = [
-            {"id": "dashboard", "icon": "bar_chart_3", "label": "Dashboard"},
-            {"id": "students", "icon": "users", "label": "Students"},
-            {"id": "subjects", "icon": "book_open", "label": "Subjects"},
-            {"id": "reports", "icon": "file_text", "label": "Reports"},
-            {"id": "analytics", "icon": "trending_up", "label": "Analytics", "locked": True},
-            {"id": "users", "icon": "user_plus", "label": "User Management", "locked": True},
-            {"id": "settings", "icon": "settings", "label": "Settings"},
-            {"id": "license", "icon": "key", "label": "License"},
+            {"id": "dashboard", "icon": "BarChart3", "label": "Dashboard"},
+            {"id": "students", "icon": "Users", "label": "Students"},
+            {"id": "subjects", "icon": "BookOpen", "label": "Subjects"},
+            {"id": "reports", "icon": "FileText", "label": "Reports"},
+            {"id": "analytics", "icon": "TrendingUp", "label": "Analytics", "locked": True},
+            {"id": "users", "icon": "User", "label": "User Management", "locked": True},
+            {"id": "settings", "icon": "Settings", "label": "Settings"},
+            {"id": "license", "icon": "Key", "label": "License"},
         ]
         
+        self.nav_buttons = {}
         for item in nav_items:
-            btn = QPushButton(item["label"])
-            btn.setObjectName(item["id"])
-            btn.setCursor(Qt.PointingHandCursor)
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    text-align: left;
-                    padding: 12px 15px;
-                    border-radius: 8px;
-                    font-size: 14px;
-                    color: {self.theme.primary.name()};
-                }}
-                QPushButton:hover {{
-                    background-color: rgba(0, 0, 0, 0.05);
-                }}
-                QPushButton[pressed="true"] {{
-                    background-color: {self.theme.secondary.name()};
-                    color: white;
-                }}
-            """)
-            
-            icon_widget = SvgIcon(ICONS.get(item["icon"], ""), self.theme.primary)
-            
-            btn_layout = QHBoxLayout()
-            btn_layout.addWidget(icon_widget)
-            btn_layout.addWidget(QLabel(item["label"]))
-            btn_layout.addStretch()
-            
-            if item.get("locked"):
-                lock_icon = SvgIcon(ICONS.get("lock", ""), QColor("#999999"))
-                btn_layout.addWidget(lock_icon)
-            
-            btn.setLayout(btn_layout)
+            btn = NavButton(item["label"], item["icon"], item.get("locked", False), self.theme)
+            btn.clicked.connect(lambda checked, nav_id=item["id"]: self.navigation_changed.emit(nav_id))
+            self.nav_buttons[item["id"]] = btn
             nav_layout.addWidget(btn)
         
+        self.nav_buttons["dashboard"].setChecked(True)
+        
         nav_layout.addStretch()
         nav_widget.setLayout(nav_layout)
         
         # License info
         license_widget = QWidget()
-        license_widget.setStyleSheet(f"""
-            background-color: rgba(0, 0, 0, 0.05);
-            border-radius: 8px;
-            padding: 12px;
-        """)
+        license_widget.setObjectName("licenseCard")
         license_layout = QVBoxLayout()
         
         license_header = QHBoxLayout()
-        shield_icon = SvgIcon(ICONS.get("shield", ""), self.theme.secondary)
+        shield_icon = SvgIcon(ICONS["Shield"], self.theme.secondary)
         license_header.addWidget(shield_icon)
         
         license_title = QLabel("Standard License")
-        license_title.setStyleSheet(f"""
-            font-weight: bold;
-            font-size: 13px;
-            color: {self.theme.primary.name()};
-        """)
+        license_title.setObjectName("licenseTitle")
         license_header.addWidget(license_title)
         license_header.addStretch()
         
         license_layout.addLayout(license_header)
         
         license_expiry = QLabel("Expires: N/A")
-        license_expiry.setStyleSheet("font-size: 11px; color: #666;")
+        license_expiry.setObjectName("licenseExpiry")
         license_layout.addWidget(license_expiry)
         
         status_layout = QHBoxLayout()
-        status_dot = QLabel()
-        status_dot.setFixedSize(8, 8)
-        status_dot.setStyleSheet("""
-            background-color: #10B981;
-            border-radius: 4px;
-        """)
+        status_dot = Dot("#10B981")
         status_layout.addWidget(status_dot)
         status_layout.addWidget(QLabel("Active"))
         status_layout.addStretch()
@@ -155,4 +142,5 @@ class Sidebar(QWidget):
         nav_layout.addWidget(license_widget)
         layout.addWidget(nav_widget)
         
-        self.setLayout(layout)
\ No newline at end of file
+        self.setLayout(layout)
+        self.setUpdatesEnabled(True)
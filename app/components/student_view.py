@@ -60,7 +60,7 @@ class StudentsView(QWidget):
         title.setStyleSheet(f"""
             font-size: 28px;
             font-weight: 600;
-            color: {self.theme.primary.name()};
+            color: {self.theme.primary_hex};
         """)
         
         subtitle = QLabel("Manage student records, performance, and generate reports")
@@ -152,7 +152,7 @@ class StudentsView(QWidget):
         add_btn = Button("Add Student", "Plus")
         add_btn.setStyleSheet(f"""
             QPushButton {{
-                background-color: {self.theme.secondary.name()};
+                background-color: {self.theme.secondary_hex};
                 color: white;
                 border: none;
                 border-radius: 8px;
@@ -640,7 +640,7 @@ class StudentsView(QWidget):
         avatar = QLabel()
         avatar.setFixedSize(40, 40)
         avatar.setStyleSheet(f"""
-            background-color: {self.theme.secondary.name()};
+            background-color: {self.theme.secondary_hex};
             color: white;
             border-radius: 20px;
             font-weight: 600;
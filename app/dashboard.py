@@ -1,17 +1,28 @@
 import os
 import sys
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame, QSplitter, QProgressBar, QGridLayout
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame, QSplitter, QProgressBar, QListView, QAbstractItemView
 from PySide6.QtCore import Qt, QTimer, QSize
-from PySide6.QtGui import QColor
+from PySide6.QtGui import QColor, QFont
 from datetime import datetime
 from .services.data_service import DataService
 from .components.button import Button
+from .components.indicators import Dot, PillLabel
+from .components.dashboard_lists import (
+    DictListModel, ActivityDelegate, StatsCardDelegate, STATUS_COLORS,
+    ACTIVITY_ROW_HEIGHT, STATS_CARD_HEIGHT, STATS_COLUMNS,
+)
 from .icons import ICONS, SvgIcon
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from utils.logger import setup_logging
 
 logger = setup_logging(__name__)
+
+ACTIVITY_VISIBLE_ROWS = 6  # Rows shown before the activity list scrolls
+ACTIVITY_ROW_SPACING = 16
+TREND_UP_COLOR = "#10B981"
+TREND_DOWN_COLOR = "#EF4444"
+LEVEL_COLORS = {"high": "#10B981", "mid": "#F59E0B", "low": "#EF4444"}
 class Dashboard(QWidget):
     """Advanced dashboard with real-time updates and interactive widgets"""
     
@@ -31,6 +42,8 @@ class Dashboard(QWidget):
     
     def setup_ui(self):
         """Setup the dashboard UI"""
+        # Hold repaints until the whole tree is in place
+        self.setUpdatesEnabled(False)
         try:
             layout = QVBoxLayout()
             layout.setContentsMargins(24, 24, 24, 24)
@@ -50,6 +63,8 @@ class Dashboard(QWidget):
             
         except Exception as e:
             logger.error(f"Error setting up dashboard: {e}")
+        finally:
+            self.setUpdatesEnabled(True)
     
     def create_header(self, parent_layout):
         """Create dashboard header"""
@@ -61,15 +76,10 @@ class Dashboard(QWidget):
         welcome_layout = QVBoxLayout()
         
         welcome_title = QLabel("Good Morning, Administrator")
-        welcome_title.setStyleSheet(f"""
-            font-size: 28px;
-            font-weight: 600;
-            color: {self.theme.primary.name()};
-            margin-bottom: 4px;
-        """)
+        welcome_title.setObjectName("welcomeTitle")
         
         welcome_subtitle = QLabel(f"Today is {datetime.now().strftime('%A, %B %d, %Y')}")
-        welcome_subtitle.setStyleSheet("font-size: 16px; color: #6B7280;")
+        welcome_subtitle.setObjectName("welcomeSubtitle")
         
         welcome_layout.addWidget(welcome_title)
         welcome_layout.addWidget(welcome_subtitle)
@@ -87,38 +97,7 @@ class Dashboard(QWidget):
         for action in quick_actions:
             btn = Button(action["text"], action["icon"])
             btn.setFixedHeight(40)
-            
-            if action["primary"]:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: {self.theme.secondary.name()};
-                        color: white;
-                        border: none;
-                        border-radius: 8px;
-                        padding: 0 20px;
-                        font-size: 14px;
-                        font-weight: 500;
-                    }}
-                    QPushButton:hover {{
-                        background-color: {self.theme.secondary.darker(110).name()};
-                    }}
-                """)
-            else:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: white;
-                        color: {self.theme.primary.name()};
-                        border: 1px solid #E5E7EB;
-                        border-radius: 8px;
-                        padding: 0 20px;
-                        font-size: 14px;
-                        font-weight: 500;
-                    }}
-                    QPushButton:hover {{
-                        background-color: #F9FAFB;
-                        border-color: {self.theme.secondary.name()};
-                    }}
-                """)
+            btn.setObjectName("primaryAction" if action["primary"] else "secondaryAction")
             
             actions_layout.addWidget(btn)
         
@@ -191,17 +170,7 @@ class Dashboard(QWidget):
         """Create an individual metric card"""
         card = QFrame()
         card.setFrameStyle(QFrame.Box)
-        card.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 12px;
-                padding: 24px;
-            }
-            QFrame:hover {
-                border-color: #D1D5DB;
-            }
-        """)
+        card.setObjectName("metricCard")
         card.setFixedHeight(140)
         
         layout = QVBoxLayout()
@@ -217,10 +186,10 @@ class Dashboard(QWidget):
         text_layout.setSpacing(4)
         
         title = QLabel(config["title"])
-        title.setStyleSheet("font-size: 14px; color: #6B7280; font-weight: 500;")
+        title.setObjectName("metricTitle")
         
         description = QLabel(config["description"])
-        description.setStyleSheet("font-size: 12px; color: #9CA3AF;")
+        description.setObjectName("metricDescription")
         
         text_layout.addWidget(title)
         text_layout.addWidget(description)
@@ -237,23 +206,12 @@ class Dashboard(QWidget):
         value_layout.setContentsMargins(0, 0, 0, 0)
         
         value = QLabel(config["value"])
-        value.setStyleSheet(f"""
-            font-size: 32px;
-            font-weight: 700;
-            color: {self.theme.primary.name()};
-            line-height: 1;
-        """)
-        
-        trend = QLabel(config["trend"])
-        trend_color = "#10B981" if config["trend_positive"] else "#EF4444"
-        trend.setStyleSheet(f"""
-            font-size: 12px;
-            font-weight: 600;
-            color: {trend_color};
-            background-color: {trend_color}20;
-            padding: 4px 8px;
-            border-radius: 12px;
-        """)
+        value.setObjectName("metricValue")
+        
+        trend_color = QColor(TREND_UP_COLOR if config["trend_positive"] else TREND_DOWN_COLOR)
+        trend_fill = QColor(trend_color)
+        trend_fill.setAlpha(32)
+        trend = PillLabel(config["trend"], trend_color, trend_fill)
         trend.setFixedHeight(24)
         
         value_layout.addWidget(value)
@@ -270,7 +228,7 @@ class Dashboard(QWidget):
     def create_main_content(self, parent_layout):
         """Create main dashboard content"""
         splitter = QSplitter(Qt.Horizontal)
-        splitter.setStyleSheet("QSplitter::handle { background-color: #E5E7EB; width: 2px; }")
+        splitter.setObjectName("dashboardSplitter")
         
         # Left panel - Charts and analytics
         left_panel = self.create_left_panel()
@@ -296,25 +254,16 @@ class Dashboard(QWidget):
         
         # Performance overview chart
         chart_widget = QWidget()
-        chart_widget.setStyleSheet("""
-            background-color: white;
-            border: 1px solid #E5E7EB;
-            border-radius: 12px;
-            padding: 24px;
-        """)
+        chart_widget.setObjectName("panelCard")
         
         chart_layout = QVBoxLayout()
         
         chart_header = QHBoxLayout()
         chart_title = QLabel("Class Performance Overview")
-        chart_title.setStyleSheet(f"""
-            font-size: 20px;
-            font-weight: 600;
-            color: {self.theme.primary.name()};
-        """)
+        chart_title.setObjectName("chartTitle")
         
         chart_subtitle = QLabel("Academic performance across all classes")
-        chart_subtitle.setStyleSheet("font-size: 14px; color: #6B7280;")
+        chart_subtitle.setObjectName("chartSubtitle")
         
         chart_text_layout = QVBoxLayout()
         chart_text_layout.addWidget(chart_title)
@@ -326,21 +275,16 @@ class Dashboard(QWidget):
         # Chart placeholder (in a real app, this would be a proper chart)
         chart_placeholder = QWidget()
         chart_placeholder.setFixedHeight(300)
-        chart_placeholder.setStyleSheet("""
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                stop:0 #EEF2FF, stop:1 #E0E7FF);
-            border-radius: 8px;
-            border: 2px dashed #C7D2FE;
-        """)
+        chart_placeholder.setObjectName("chartPlaceholder")
         
         placeholder_layout = QVBoxLayout()
         placeholder_label = QLabel("📊 Interactive Performance Chart")
         placeholder_label.setAlignment(Qt.AlignCenter)
-        placeholder_label.setStyleSheet("font-size: 16px; color: #6366F1; font-weight: 500;")
+        placeholder_label.setObjectName("placeholderLabel")
         
         placeholder_desc = QLabel("Real-time analytics dashboard\nwould be displayed here")
         placeholder_desc.setAlignment(Qt.AlignCenter)
-        placeholder_desc.setStyleSheet("font-size: 12px; color: #9CA3AF;")
+        placeholder_desc.setObjectName("placeholderDescription")
         
         placeholder_layout.addStretch()
         placeholder_layout.addWidget(placeholder_label)
@@ -365,12 +309,7 @@ class Dashboard(QWidget):
     def create_class_performance_widget(self):
         """Create class performance widget"""
         widget = QWidget()
-        widget.setStyleSheet("""
-            background-color: white;
-            border: 1px solid #E5E7EB;
-            border-radius: 12px;
-            padding: 24px;
-        """)
+        widget.setObjectName("panelCard")
         
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
@@ -378,11 +317,7 @@ class Dashboard(QWidget):
         
         # Header
         header = QLabel("Class Performance Breakdown")
-        header.setStyleSheet(f"""
-            font-size: 18px;
-            font-weight: 600;
-            color: {self.theme.primary.name()};
-        """)
+        header.setObjectName("panelTitle")
         layout.addWidget(header)
         
         # Class list
@@ -404,11 +339,7 @@ class Dashboard(QWidget):
     def create_class_item(self, class_data):
         """Create individual class performance item"""
         item = QWidget()
-        item.setStyleSheet("""
-            background-color: #F9FAFB;
-            border-radius: 8px;
-            padding: 16px;
-        """)
+        item.setObjectName("classItem")
         item.setFixedHeight(70)
         
         layout = QHBoxLayout()
@@ -420,10 +351,10 @@ class Dashboard(QWidget):
         info_layout.setSpacing(4)
         
         class_name = QLabel(class_data["name"])
-        class_name.setStyleSheet("font-size: 16px; font-weight: 600; color: #111827;")
+        class_name.setObjectName("className")
         
         student_count = QLabel(f"{class_data['students']} students")
-        student_count.setStyleSheet("font-size: 12px; color: #6B7280;")
+        student_count.setObjectName("studentCount")
         
         info_layout.addWidget(class_name)
         info_layout.addWidget(student_count)
@@ -433,7 +364,7 @@ class Dashboard(QWidget):
         progress_layout.setSpacing(4)
         
         progress_label = QLabel(f"Average: {class_data['average']:.1f}%")
-        progress_label.setStyleSheet("font-size: 12px; color: #374151;")
+        progress_label.setObjectName("progressLabel")
         
         progress_bar = QProgressBar()
         progress_bar.setRange(0, 100)
@@ -443,38 +374,22 @@ class Dashboard(QWidget):
         
         # Color based on performance
         if class_data['average'] >= 85:
-            color = "#10B981"
+            level = "high"
         elif class_data['average'] >= 70:
-            color = "#F59E0B"
+            level = "mid"
         else:
-            color = "#EF4444"
-        
-        progress_bar.setStyleSheet(f"""
-            QProgressBar {{
-                border: none;
-                border-radius: 3px;
-                background-color: #E5E7EB;
-            }}
-            QProgressBar::chunk {{
-                border-radius: 3px;
-                background-color: {color};
-            }}
-        """)
+            level = "low"
+        
+        progress_bar.setObjectName("classProgress")
+        progress_bar.setProperty("level", level)
         
         progress_layout.addWidget(progress_label)
         progress_layout.addWidget(progress_bar)
         
         # Grade badge
-        grade_badge = QLabel(class_data["grade"])
-        grade_badge.setAlignment(Qt.AlignCenter)
+        grade_badge = PillLabel(class_data["grade"], Qt.white, LEVEL_COLORS[level],
+                                pixel_size=14, weight=QFont.Bold, radius=18)
         grade_badge.setFixedSize(36, 36)
-        grade_badge.setStyleSheet(f"""
-            background-color: {color};
-            color: white;
-            border-radius: 18px;
-            font-size: 14px;
-            font-weight: 700;
-        """)
         
         layout.addLayout(info_layout)
         layout.addLayout(progress_layout)
@@ -509,12 +424,7 @@ class Dashboard(QWidget):
     def create_activity_widget(self):
         """Create recent activity widget"""
         widget = QWidget()
-        widget.setStyleSheet("""
-            background-color: white;
-            border: 1px solid #E5E7EB;
-            border-radius: 12px;
-            padding: 20px;
-        """)
+        widget.setObjectName("sideCard")
         
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
@@ -523,18 +433,10 @@ class Dashboard(QWidget):
         # Header
         header_layout = QHBoxLayout()
         title = QLabel("Recent Activity")
-        title.setStyleSheet(f"""
-            font-size: 16px;
-            font-weight: 600;
-            color: {self.theme.primary.name()};
-        """)
+        title.setObjectName("cardTitle")
         
         view_all = QLabel("View All")
-        view_all.setStyleSheet("""
-            font-size: 12px;
-            color: #6366F1;
-            font-weight: 500;
-        """)
+        view_all.setObjectName("viewAllLink")
         view_all.setCursor(Qt.PointingHandCursor)
         
         header_layout.addWidget(title)
@@ -575,75 +477,28 @@ class Dashboard(QWidget):
             }
         ]
         
-        for activity in activities:
-            activity_item = self.create_activity_item(activity)
-            layout.addWidget(activity_item)
+        # Rows are painted by the delegate; only visible ones cost anything
+        self.activity_model = DictListModel(activities, "action", self)
+        activity_list = QListView()
+        activity_list.setObjectName("activityList")
+        activity_list.setModel(self.activity_model)
+        activity_list.setItemDelegate(ActivityDelegate(activity_list))
+        activity_list.setSelectionMode(QAbstractItemView.NoSelection)
+        activity_list.setFocusPolicy(Qt.NoFocus)
+        activity_list.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        activity_list.setUniformItemSizes(True)
+        activity_list.setSpacing(ACTIVITY_ROW_SPACING // 2)
+        visible_rows = min(len(activities), ACTIVITY_VISIBLE_ROWS)
+        activity_list.setFixedHeight(visible_rows * (ACTIVITY_ROW_HEIGHT + ACTIVITY_ROW_SPACING))
+        layout.addWidget(activity_list)
         
         widget.setLayout(layout)
         return widget
     
-    def create_activity_item(self, activity):
-        """Create individual activity item"""
-        item = QWidget()
-        item.setFixedHeight(50)
-        
-        layout = QHBoxLayout()
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(12)
-        
-        # Icon with status color
-        status_colors = {
-            "success": "#10B981",
-            "info": "#3B82F6",
-            "warning": "#F59E0B",
-            "error": "#EF4444"
-        }
-        
-        icon_container = QWidget()
-        icon_container.setFixedSize(32, 32)
-        icon_container.setStyleSheet(f"""
-            background-color: {status_colors[activity['type']]}20;
-            border-radius: 16px;
-        """)
-        
-        icon_layout = QHBoxLayout()
-        icon_layout.setContentsMargins(0, 0, 0, 0)
-        
-        icon = SvgIcon(ICONS[activity["icon"]], QColor(status_colors[activity['type']]), QSize(16, 16))
-        icon_layout.addWidget(icon)
-        icon_layout.setAlignment(Qt.AlignCenter)
-        
-        icon_container.setLayout(icon_layout)
-        
-        # Activity details
-        details_layout = QVBoxLayout()
-        details_layout.setSpacing(2)
-        
-        action_label = QLabel(activity["action"])
-        action_label.setStyleSheet("font-size: 13px; font-weight: 500; color: #111827;")
-        
-        meta_info = QLabel(f"by {activity['user']} • {activity['time']}")
-        meta_info.setStyleSheet("font-size: 11px; color: #6B7280;")
-        
-        details_layout.addWidget(action_label)
-        details_layout.addWidget(meta_info)
-        
-        layout.addWidget(icon_container)
-        layout.addLayout(details_layout)
-        layout.addStretch()
-        
-        item.setLayout(layout)
-        return item
-    
     def create_notifications_widget(self):
         """Create system notifications widget"""
         widget = QWidget()
-        widget.setStyleSheet("""
-            background-color: white;
-            border: 1px solid #E5E7EB;
-            border-radius: 12px;
-            padding: 20px;
-        """)
+        widget.setObjectName("sideCard")
         
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
@@ -651,11 +506,7 @@ class Dashboard(QWidget):
         
         # Header
         title = QLabel("System Alerts")
-        title.setStyleSheet(f"""
-            font-size: 16px;
-            font-weight: 600;
-            color: {self.theme.primary.name()};
-        """)
+        title.setObjectName("cardTitle")
         layout.addWidget(title)
         
         # Notifications
@@ -687,45 +538,22 @@ class Dashboard(QWidget):
     def create_notification_item(self, notification):
         """Create individual notification item"""
         item = QWidget()
-        item.setStyleSheet("""
-            background-color: #F9FAFB;
-            border-radius: 8px;
-            padding: 12px;
-        """)
+        item.setObjectName("notificationItem")
         
         layout = QHBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(8)
         
         # Status indicator
-        indicator = QLabel()
-        indicator.setFixedSize(8, 8)
-        indicator_color = "#F59E0B" if notification["type"] == "warning" else "#3B82F6"
-        indicator.setStyleSheet(f"""
-            background-color: {indicator_color};
-            border-radius: 4px;
-        """)
+        indicator = Dot(STATUS_COLORS["warning"] if notification["type"] == "warning" else STATUS_COLORS["info"])
         
         # Message
         message = QLabel(notification["message"])
-        message.setStyleSheet("font-size: 12px; color: #374151;")
+        message.setObjectName("notificationMessage")
         
         # Action button
         action_btn = QPushButton(notification["action"])
-        action_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: 1px solid #D1D5DB;
-                border-radius: 4px;
-                padding: 4px 8px;
-                font-size: 10px;
-                color: #6B7280;
-            }
-            QPushButton:hover {
-                background-color: #F3F4F6;
-                border-color: #9CA3AF;
-            }
-        """)
+        action_btn.setObjectName("notificationAction")
         action_btn.setCursor(Qt.PointingHandCursor)
         
         layout.addWidget(indicator)
@@ -739,12 +567,7 @@ class Dashboard(QWidget):
     def create_quick_stats_widget(self):
         """Create quick statistics widget"""
         widget = QWidget()
-        widget.setStyleSheet("""
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                stop:0 #667EEA, stop:1 #764BA2);
-            border-radius: 12px;
-            padding: 20px;
-        """)
+        widget.setObjectName("quickStats")
         
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
@@ -752,13 +575,10 @@ class Dashboard(QWidget):
         
         # Header
         title = QLabel("Quick Stats")
-        title.setStyleSheet("font-size: 16px; font-weight: 600; color: white;")
+        title.setObjectName("quickStatsTitle")
         layout.addWidget(title)
         
         # Stats grid
-        stats_grid = QGridLayout()
-        stats_grid.setSpacing(12)
-        
         stats = [
             {"label": "Reports Generated", "value": "1,247", "period": "This Month"},
             {"label": "Average Grade", "value": "B+", "period": "Current Term"},
@@ -766,28 +586,23 @@ class Dashboard(QWidget):
             {"label": "Active Teachers", "value": "28", "period": "Online Now"}
         ]
         
-        for i, stat in enumerate(stats):
-            stat_widget = QWidget()
-            stat_layout = QVBoxLayout()
-            stat_layout.setSpacing(4)
-            
-            value_label = QLabel(stat["value"])
-            value_label.setStyleSheet("font-size: 20px; font-weight: 700; color: white;")
-            
-            label_text = QLabel(stat["label"])
-            label_text.setStyleSheet("font-size: 11px; color: rgba(255, 255, 255, 0.8);")
-            
-            period_text = QLabel(stat["period"])
-            period_text.setStyleSheet("font-size: 9px; color: rgba(255, 255, 255, 0.6);")
-            
-            stat_layout.addWidget(value_label)
-            stat_layout.addWidget(label_text)
-            stat_layout.addWidget(period_text)
-            
-            stat_widget.setLayout(stat_layout)
-            stats_grid.addWidget(stat_widget, i // 2, i % 2)
-        
-        layout.addLayout(stats_grid)
+        self.stats_model = DictListModel(stats, "value", self)
+        stats_list = QListView()
+        stats_list.setObjectName("quickStatsList")
+        stats_list.setModel(self.stats_model)
+        stats_list.setItemDelegate(StatsCardDelegate(stats_list))
+        stats_list.setViewMode(QListView.IconMode)
+        stats_list.setMovement(QListView.Static)
+        stats_list.setResizeMode(QListView.Adjust)
+        stats_list.setWrapping(True)
+        stats_list.setSpacing(6)
+        stats_list.setSelectionMode(QAbstractItemView.NoSelection)
+        stats_list.setFocusPolicy(Qt.NoFocus)
+        stats_list.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        stats_list.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        stats_rows = (len(stats) + STATS_COLUMNS - 1) // STATS_COLUMNS
+        stats_list.setFixedHeight(stats_rows * (STATS_CARD_HEIGHT + 12))
+        layout.addWidget(stats_list)
         widget.setLayout(layout)
         return widget
     
@@ -1,7 +1,8 @@
 from PySide6.QtWidgets import QWidget
-from PySide6.QtGui import QColor, QPainter, QPixmap
+from PySide6.QtGui import QColor, QImage, QPainter, QPixmap, QPixmapCache
 from PySide6.QtCore import QSize,Qt
 from PySide6.QtSvg import QSvgRenderer
+from types import MappingProxyType
 from typing import Optional
 import sys
 import os
@@ -48,62 +49,89 @@ ICONS = {
     "HelpCircle": """<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><circle cx="12" cy="12" r="10"></circle><path d="M9.09 9a3 3 0 0 1 5.83 1c0 2-3 3-3 3"></path><line x1="12" y1="17" x2="12.01" y2="17"></line></svg>""",
 }
 
+# Encoded once at import so renderers never re-encode the literals
+ICON_BYTES = MappingProxyType({name: svg.encode('utf-8') for name, svg in ICONS.items()})
+
+# Parsed renderers shared by every SvgIcon, keyed by SVG source. A renderer
+# is colour-independent, so one parse serves all tints of the same icon.
+_RENDERER_CACHE: dict[str, QSvgRenderer] = {}
+
+
+def prime_icons() -> None:
+    """Parse every bundled icon up front; call once the QApplication exists"""
+    for name, svg in ICONS.items():
+        if svg in _RENDERER_CACHE:
+            continue
+        renderer = QSvgRenderer()
+        if not renderer.load(ICON_BYTES[name]):
+            logger.warning(f"Failed to parse icon: {name}")
+        _RENDERER_CACHE[svg] = renderer
+
+
+def _shared_renderer(svg_string: str) -> QSvgRenderer:
+    """Return the shared renderer for svg_string, parsing it on first use"""
+    renderer = _RENDERER_CACHE.get(svg_string)
+    if renderer is None:
+        renderer = QSvgRenderer()
+        renderer.load(svg_string.encode('utf-8'))
+        _RENDERER_CACHE[svg_string] = renderer
+    return renderer
+
+
+def tinted_pixmap(svg_string: str, color: QColor, size: QSize, dpr: float = 1.0) -> QPixmap:
+    """Return the icon tinted with color at size, rasterizing it only on a cache miss"""
+    renderer = _shared_renderer(svg_string)
+    key = f"svgicon|{id(renderer)}|{color.name(QColor.HexArgb)}|{size.width()}x{size.height()}@{dpr}"
+    pixmap = QPixmap()
+    if QPixmapCache.find(key, pixmap):
+        return pixmap
+    
+    # Tint on a premultiplied ARGB image: SourceIn needs a real alpha
+    # channel, which platform pixmaps and the widget surface don't promise
+    image = QImage(size * dpr, QImage.Format_ARGB32_Premultiplied)
+    image.fill(0)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing, True)
+    painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
+    
+    if renderer.isValid():
+        renderer.render(painter)
+        painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
+        painter.fillRect(image.rect(), color)
+    
+    painter.end()
+    pixmap = QPixmap.fromImage(image)
+    pixmap.setDevicePixelRatio(dpr)
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
+
 
 class SvgIcon(QWidget):
     """Enhanced SVG Icon widget with caching and animations"""
     
-    _cache = {}  # Class-level cache for SVG renderers
-    
     def __init__(self, svg_string: str, color: Optional[QColor] = None, size: QSize = QSize(24, 24), parent=None):
         super().__init__(parent)
         self.svg_string = svg_string
         self.color = color or QColor("#000000")
         self.icon_size = size
-        
-        # Use cached renderer if available
-        cache_key = (svg_string, color.name() if color else None)
-        if cache_key in self._cache:
-            self.renderer = self._cache[cache_key]
-        else:
-            self.renderer = QSvgRenderer()
-            self.renderer.load(svg_string.encode('utf-8'))
-            self._cache[cache_key] = self.renderer
+        self.renderer = _shared_renderer(svg_string)
         
         self.setFixedSize(size)
         self.setAttribute(Qt.WA_TranslucentBackground)
-        
+    
     def paintEvent(self, event):
         try:
+            pixmap = tinted_pixmap(self.svg_string, self.color, self.size(), self.devicePixelRatioF())
             painter = QPainter(self)
-            painter.setRenderHint(QPainter.Antialiasing, True)
-            painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
-            
-            if self.renderer.isValid():
-                self.renderer.render(painter)
-                
-                if self.color:
-                    painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
-                    painter.fillRect(self.rect(), self.color)
+            painter.drawPixmap(0, 0, pixmap)
+            painter.end()
         except Exception as e:
             logger.error(f"Error painting SVG icon: {e}")
     
     def get_pixmap(self, size: QSize) -> QPixmap:
         """Generate a pixmap from the SVG"""
         try:
-            pixmap = QPixmap(size)
-            pixmap.fill(Qt.transparent)
-            painter = QPainter(pixmap)
-            painter.setRenderHint(QPainter.Antialiasing, True)
-            painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
-            
-            if self.renderer.isValid():
-                self.renderer.render(painter)
-                if self.color:
-                    painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
-                    painter.fillRect(pixmap.rect(), self.color)
-            
-            painter.end()
-            return pixmap
+            return tinted_pixmap(self.svg_string, self.color, size)
         except Exception as e:
             logger.error(f"Error generating pixmap: {e}")
-            return QPixmap()
\ No newline at end of file
+            return QPixmap()
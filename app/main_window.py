@@ -3,7 +3,7 @@ import os
 from datetime import datetime
 
 
-from PySide6.QtWidgets import ( QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+from PySide6.QtWidgets import ( QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QStackedWidget, QTableWidget, QTableWidgetItem, QLineEdit,
     QComboBox, QMessageBox, QScrollArea,
     QFrame, QProgressBar, QToolButton,  QSplitter,
@@ -13,7 +13,7 @@ from PySide6.QtWidgets import ( QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
 )
 from PySide6.QtGui import (
     QIcon, QColor, QAction, QShortcut,
-    QKeySequence, 
+    QKeySequence, QPixmapCache,
 )
 from PySide6.QtCore import (
     Qt, QSize, QTimer, Signal, QPropertyAnimation,
@@ -26,7 +26,7 @@ from .models.data_models import (
 )
 from .icons import ICONS, SvgIcon
 from utils.logger import setup_logging
-from .theme import Theme
+from .theme import THEME
 from .components.notification_manager import NotificationManager
 from .components.button import Button
 from .components.sidebar import Sidebar
@@ -36,6 +36,14 @@ from .components.student_view import StudentsView
 
 logger = setup_logging(__name__)
 
+PIXMAP_CACHE_LIMIT_KB = 4096  # Floor for every tinted icon at every size in use
+
+# Sections shown as "coming soon" placeholders until their modules land
+PLACEHOLDER_SECTIONS = (
+    "teachers", "subjects", "classes", "reports", "templates",
+    "bulk_reports", "analytics", "users", "settings", "backup", "license"
+)
+
 
 class MainWindow(QMainWindow):
     
@@ -53,10 +61,16 @@ class MainWindow(QMainWindow):
 
         super().__init__()
         
+        # The cache is shared with Qt's style engine, so only ever raise it
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), PIXMAP_CACHE_LIMIT_KB))
+        
         # Initialize core services
         self.data_service = DataService()
         self.notification_manager = NotificationManager(self)
-        self.theme = Theme()
+        self.theme = THEME
+        
+        # One parse of the sidebar/dashboard styles for the whole application
+        QApplication.instance().setStyleSheet(self.theme.stylesheet())
         
         # Settings
         self.settings = QSettings("Marka", "ReportCardSystem")
@@ -110,18 +124,11 @@ class MainWindow(QMainWindow):
             
             # Create main content stack
             self.content_stack = QStackedWidget()
-            self.content_stack.setStyleSheet("background-color: #F8FAFC;")
-            
-            # Create views
-            self.dashboard_view = Dashboard(self.data_service, self.theme, self)
-            self.students_view = StudentsView(self.data_service, self.theme, self)
+            self.content_stack.setObjectName("contentStack")
             
-            # Add views to stack
-            self.content_stack.addWidget(self.dashboard_view)
-            self.content_stack.addWidget(self.students_view)
-            
-            # Create placeholder views for other sections
-            self.create_placeholder_views()
+            # Views are built on first navigation; only the dashboard is shown at startup
+            self.register_views()
+            self.dashboard_view = self.show_view("dashboard")
             
             content_layout.addWidget(self.content_stack)
             self.content_area.setLayout(content_layout)
@@ -184,7 +191,7 @@ class MainWindow(QMainWindow):
         self.breadcrumb.setStyleSheet(f"""
             font-size: 20px;
             font-weight: 600;
-            color: {self.theme.primary.name()};
+            color: {self.theme.primary_hex};
         """)
         
         left_layout.addWidget(self.menu_toggle)
@@ -286,7 +293,7 @@ class MainWindow(QMainWindow):
         user_avatar = QLabel()
         user_avatar.setFixedSize(28, 28)
         user_avatar.setStyleSheet(f"""
-            background-color: {self.theme.secondary.name()};
+            background-color: {self.theme.secondary_hex};
             color: white;
             border-radius: 14px;
             font-weight: 600;
@@ -386,16 +393,28 @@ class MainWindow(QMainWindow):
         self.user_menu_btn.setMenu(user_menu)
         self.user_menu_btn.setPopupMode(QToolButton.InstantPopup)
     
-    def create_placeholder_views(self):
-        """Create placeholder views for sections not yet implemented"""
-        placeholder_sections = [
-            "teachers", "subjects", "classes", "reports", "templates",
-            "bulk_reports", "analytics", "users", "settings", "backup", "license"
-        ]
-        
-        for section in placeholder_sections:
-            placeholder = self.create_placeholder_view(section)
-            self.content_stack.addWidget(placeholder)
+    def register_views(self):
+        """Register a factory for every section; views are built on first use"""
+        self.built_views = {}
+        self.view_factories = {
+            "dashboard": lambda: Dashboard(self.data_service, self.theme, self),
+            "students": lambda: StudentsView(self.data_service, self.theme, self),
+        }
+        
+        # Placeholder views for sections not yet implemented
+        for section in PLACEHOLDER_SECTIONS:
+            self.view_factories[section] = lambda section=section: self.create_placeholder_view(section)
+    
+    def show_view(self, section_id: str):
+        """Build the section's view if needed and bring it to the front"""
+        view = self.built_views.get(section_id)
+        if view is None:
+            view = self.view_factories[section_id]()
+            self.built_views[section_id] = view
+            self.content_stack.addWidget(view)
+        
+        self.content_stack.setCurrentWidget(view)
+        return view
     
     def create_placeholder_view(self, section_name: str):
         """Create a placeholder view for unimplemented sections"""
@@ -543,26 +562,8 @@ class MainWindow(QMainWindow):
     def navigate_to_section(self, section_id: str):
         """Navigate to a specific section"""
         try:
-            # Map section IDs to stack indices
-            section_mapping = {
-                "dashboard": 0,
-                "students": 1,
-                "teachers": 2,
-                "subjects": 3,
-                "classes": 4,
-                "reports": 5,
-                "templates": 6,
-                "bulk_reports": 7,
-                "analytics": 8,
-                "users": 9,
-                "settings": 10,
-                "backup": 11,
-                "license": 12
-            }
-            
-            if section_id in section_mapping:
-                index = section_mapping[section_id]
-                self.content_stack.setCurrentIndex(index)
+            if section_id in self.view_factories:
+                self.show_view(section_id)
                 
                 # Update breadcrumb
                 section_titles = {
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from PySide6.QtGui import QPalette, QColor
 
 class Theme:
@@ -16,6 +18,15 @@ class Theme:
         self.success = QColor("#10B981")
         self.warning = QColor("#F59E0B")
         
+        # Hex forms for stylesheet f-strings, so callers skip QColor.name()
+        self.primary_hex = self.primary.name()
+        self.secondary_hex = self.secondary.name()
+        self.accent_hex = self.accent.name()
+        self.background_hex = self.background.name()
+        self.error_hex = self.error.name()
+        self.success_hex = self.success.name()
+        self.warning_hex = self.warning.name()
+        
     def apply_to_widget(self, widget):
         """
         Applies the theme to the given widget.
@@ -49,3 +60,270 @@ class Theme:
         palette.setColor(QPalette.Highlight, self.secondary)
         palette.setColor(QPalette.HighlightedText, QColor("#FFFFFF"))
         widget.setPalette(palette)
+    
+    def stylesheet(self) -> str:
+        """
+        Return the application-wide stylesheet for the sidebar and dashboard.
+
+        Widgets opt in through their object name, and colour variants are
+        selected with dynamic properties such as ``level``, so Qt parses
+        this sheet once instead of once per widget.
+        """
+        return build_stylesheet(
+            self.primary_hex,
+            self.secondary_hex,
+            self.secondary.darker(110).name(),
+        )
+
+
+@lru_cache(maxsize=16)
+def build_stylesheet(primary: str, secondary: str, secondary_hover: str) -> str:
+    """Render the application stylesheet for a theme's colours, once per palette"""
+    return f"""
+        /* Main window */
+        QStackedWidget#contentStack {{
+            background-color: #F8FAFC;
+        }}
+        
+        /* Sidebar */
+        QWidget#sidebarHeader {{
+            background-color: {primary};
+        }}
+        QLabel#sidebarLogo {{
+            background-color: {secondary};
+            border-radius: 8px;
+            color: white;
+            font-weight: bold;
+            font-size: 16px;
+            qproperty-alignment: AlignCenter;
+        }}
+        QLabel#sidebarTitle {{
+            font-size: 16px;
+            font-weight: bold;
+            color: white;
+        }}
+        QLabel#sidebarSubtitle {{
+            font-size: 12px;
+            color: rgba(255, 255, 255, 0.7);
+        }}
+        QPushButton#navButton {{
+            text-align: left;
+            padding: 12px 15px;
+            border-radius: 8px;
+            font-size: 14px;
+            color: {primary};
+        }}
+        QPushButton#navButton:hover {{
+            background-color: rgba(0, 0, 0, 0.05);
+        }}
+        QPushButton#navButton:checked {{
+            background-color: {secondary};
+            color: white;
+        }}
+        QWidget#licenseCard {{
+            background-color: rgba(0, 0, 0, 0.05);
+            border-radius: 8px;
+            padding: 12px;
+        }}
+        QLabel#licenseTitle {{
+            font-weight: bold;
+            font-size: 13px;
+            color: {primary};
+        }}
+        QLabel#licenseExpiry {{
+            font-size: 11px;
+            color: #666;
+        }}
+        
+        /* Dashboard header */
+        QLabel#welcomeTitle {{
+            font-size: 28px;
+            font-weight: 600;
+            color: {primary};
+            margin-bottom: 4px;
+        }}
+        QLabel#welcomeSubtitle {{
+            font-size: 16px;
+            color: #6B7280;
+        }}
+        QPushButton#primaryAction, QPushButton#secondaryAction {{
+            border-radius: 8px;
+            padding: 0 20px;
+            font-size: 14px;
+            font-weight: 500;
+        }}
+        QPushButton#primaryAction {{
+            background-color: {secondary};
+            color: white;
+            border: none;
+        }}
+        QPushButton#primaryAction:hover {{
+            background-color: {secondary_hover};
+        }}
+        QPushButton#secondaryAction {{
+            background-color: white;
+            color: {primary};
+            border: 1px solid #E5E7EB;
+        }}
+        QPushButton#secondaryAction:hover {{
+            background-color: #F9FAFB;
+            border-color: {secondary};
+        }}
+        
+        /* Metric cards */
+        QFrame#metricCard {{
+            background-color: white;
+            border: 1px solid #E5E7EB;
+            border-radius: 12px;
+            padding: 24px;
+        }}
+        QFrame#metricCard:hover {{
+            border-color: #D1D5DB;
+        }}
+        QLabel#metricTitle {{
+            font-size: 14px;
+            color: #6B7280;
+            font-weight: 500;
+        }}
+        QLabel#metricDescription {{
+            font-size: 12px;
+            color: #9CA3AF;
+        }}
+        QLabel#metricValue {{
+            font-size: 32px;
+            font-weight: 700;
+            color: {primary};
+        }}
+        
+        /* Panels */
+        QSplitter#dashboardSplitter::handle {{
+            background-color: #E5E7EB;
+            width: 2px;
+        }}
+        QWidget#panelCard, QWidget#sideCard {{
+            background-color: white;
+            border: 1px solid #E5E7EB;
+            border-radius: 12px;
+        }}
+        QWidget#panelCard {{
+            padding: 24px;
+        }}
+        QWidget#sideCard {{
+            padding: 20px;
+        }}
+        QLabel#chartTitle {{
+            font-size: 20px;
+            font-weight: 600;
+            color: {primary};
+        }}
+        QLabel#chartSubtitle {{
+            font-size: 14px;
+            color: #6B7280;
+        }}
+        QWidget#chartPlaceholder {{
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                stop:0 #EEF2FF, stop:1 #E0E7FF);
+            border-radius: 8px;
+            border: 2px dashed #C7D2FE;
+        }}
+        QLabel#placeholderLabel {{
+            font-size: 16px;
+            color: #6366F1;
+            font-weight: 500;
+        }}
+        QLabel#placeholderDescription {{
+            font-size: 12px;
+            color: #9CA3AF;
+        }}
+        QLabel#panelTitle {{
+            font-size: 18px;
+            font-weight: 600;
+            color: {primary};
+        }}
+        QLabel#cardTitle {{
+            font-size: 16px;
+            font-weight: 600;
+            color: {primary};
+        }}
+        
+        /* Class performance */
+        QWidget#classItem {{
+            background-color: #F9FAFB;
+            border-radius: 8px;
+            padding: 16px;
+        }}
+        QLabel#className {{
+            font-size: 16px;
+            font-weight: 600;
+            color: #111827;
+        }}
+        QLabel#studentCount {{
+            font-size: 12px;
+            color: #6B7280;
+        }}
+        QLabel#progressLabel {{
+            font-size: 12px;
+            color: #374151;
+        }}
+        QProgressBar#classProgress {{
+            border: none;
+            border-radius: 3px;
+            background-color: #E5E7EB;
+        }}
+        QProgressBar#classProgress::chunk {{
+            border-radius: 3px;
+        }}
+        QProgressBar#classProgress[level="high"]::chunk {{ background-color: #10B981; }}
+        QProgressBar#classProgress[level="mid"]::chunk {{ background-color: #F59E0B; }}
+        QProgressBar#classProgress[level="low"]::chunk {{ background-color: #EF4444; }}
+        
+        /* Activity and alerts */
+        QLabel#viewAllLink {{
+            font-size: 12px;
+            color: #6366F1;
+            font-weight: 500;
+        }}
+        QListView#activityList, QListView#quickStatsList {{
+            background: transparent;
+            border: none;
+            padding: 0;
+        }}
+        QWidget#notificationItem {{
+            background-color: #F9FAFB;
+            border-radius: 8px;
+            padding: 12px;
+        }}
+        QLabel#notificationMessage {{
+            font-size: 12px;
+            color: #374151;
+        }}
+        QPushButton#notificationAction {{
+            background-color: transparent;
+            border: 1px solid #D1D5DB;
+            border-radius: 4px;
+            padding: 4px 8px;
+            font-size: 10px;
+            color: #6B7280;
+        }}
+        QPushButton#notificationAction:hover {{
+            background-color: #F3F4F6;
+            border-color: #9CA3AF;
+        }}
+        
+        /* Quick stats */
+        QWidget#quickStats {{
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                stop:0 #667EEA, stop:1 #764BA2);
+            border-radius: 12px;
+            padding: 20px;
+        }}
+        QLabel#quickStatsTitle {{
+            font-size: 16px;
+            font-weight: 600;
+            color: white;
+        }}
+    """
+
+
+# Shared application theme; views take this instead of building their own
+THEME = Theme()
@@ -1,17 +1,49 @@
 import os
+import re
 import json
+import base64
+import math
+import time
 import logging
 import hashlib
 import uuid
-import jwt
-import requests
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional, Dict, Any, Union
+from types import MappingProxyType
 from PySide6.QtCore import QObject, Signal, QTimer
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric import rsa, padding
-from cryptography.hazmat.primitives import hashes
+
+# License types and their features. Features are frozensets so that
+# has_feature() is a constant-time membership test.
+LICENSE_TYPES = MappingProxyType({
+    'STANDARD': MappingProxyType({
+        'name': 'Standard',
+        'features': frozenset({'basic_reporting', 'student_management', 'grade_entry'}),
+        'limits': MappingProxyType({'students': 1000, 'custom_templates': 2, 'cloud_sync': False})
+    }),
+    'PRO': MappingProxyType({
+        'name': 'Pro',
+        'features': frozenset({'basic_reporting', 'student_management', 'grade_entry',
+                               'advanced_analytics', 'bulk_operations'}),
+        'limits': MappingProxyType({'students': 5000, 'custom_templates': 10, 'cloud_sync': False})
+    }),
+    'ENTERPRISE': MappingProxyType({
+        'name': 'Enterprise',
+        'features': frozenset({'basic_reporting', 'student_management', 'grade_entry',
+                               'advanced_analytics', 'bulk_operations', 'cloud_sync',
+                               'multi_user', 'api_access'}),
+        'limits': MappingProxyType({'students': -1, 'custom_templates': -1, 'cloud_sync': True})
+    }),
+    'LIFETIME': MappingProxyType({
+        'name': 'Lifetime',
+        'features': frozenset({'basic_reporting', 'student_management', 'grade_entry',
+                               'advanced_analytics', 'bulk_operations', 'cloud_sync',
+                               'multi_user', 'api_access', 'priority_support'}),
+        'limits': MappingProxyType({'students': -1, 'custom_templates': -1, 'cloud_sync': True})
+    })
+})
+
+TRIAL_FEATURES = frozenset({'basic_reporting', 'student_management'})
 
 class LicenseManager(QObject):
     """
@@ -27,34 +59,8 @@ class LicenseManager(QObject):
         self.user_data_dir = Path(app.get_user_data_dir())
         self.license_file = self.user_data_dir / '.marka_license'
         
-        # License types and their features
-        self.license_types = {
-            'STANDARD': {
-                'name': 'Standard',
-                'features': ['basic_reporting', 'student_management', 'grade_entry'],
-                'limits': {'students': 1000, 'custom_templates': 2, 'cloud_sync': False}
-            },
-            'PRO': {
-                'name': 'Pro',
-                'features': ['basic_reporting', 'student_management', 'grade_entry', 
-                           'advanced_analytics', 'bulk_operations'],
-                'limits': {'students': 5000, 'custom_templates': 10, 'cloud_sync': False}
-            },
-            'ENTERPRISE': {
-                'name': 'Enterprise',
-                'features': ['basic_reporting', 'student_management', 'grade_entry', 
-                           'advanced_analytics', 'bulk_operations', 'cloud_sync', 
-                           'multi_user', 'api_access'],
-                'limits': {'students': -1, 'custom_templates': -1, 'cloud_sync': True}
-            },
-            'LIFETIME': {
-                'name': 'Lifetime',
-                'features': ['basic_reporting', 'student_management', 'grade_entry', 
-                           'advanced_analytics', 'bulk_operations', 'cloud_sync', 
-                           'multi_user', 'api_access', 'priority_support'],
-                'limits': {'students': -1, 'custom_templates': -1, 'cloud_sync': True}
-            }
-        }
+        # License types and their features (shared, read-only)
+        self.license_types = LICENSE_TYPES
         
         # Server configuration
         self.api_endpoint = 'https://api.marka.codewithlyee.com/license'
@@ -63,6 +69,8 @@ class LicenseManager(QObject):
         
         # Current state
         self.current_license = None
+        self._expiry_ts = None  # Unix timestamp of current_license expiry
+        self._dirty_since_save = False  # In-memory license changes not yet on disk
         self.machine_id = self._get_machine_id()
         
         self.initialize()
@@ -80,9 +88,11 @@ class LicenseManager(QObject):
     
     def _get_machine_id(self) -> str:
         """Generate a unique machine ID for hardware fingerprinting."""
+        # Derived live on every start: a cached copy could be carried to
+        # another machine along with the license. The formula must not change,
+        # since activated licenses are bound to its output. uuid.getnode()
+        # memoizes the interface probe, so this is cheap after the first call.
         try:
-            # This is a simplified approach - in production you might want to use
-            # a more robust method that combines multiple hardware identifiers
             return hashlib.sha256(str(uuid.getnode()).encode()).hexdigest()
         except:
             # Fallback to a random ID if we can't get the machine ID
@@ -102,6 +112,8 @@ QIDAQAB
 -----END PUBLIC KEY-----"""
         
         try:
+            # Imported lazily so cryptography's OpenSSL bindings load off the startup path
+            from cryptography.hazmat.primitives import serialization
             self.public_key = serialization.load_pem_public_key(public_key_pem.encode())
         except Exception as e:
             self.logger.error(f"Failed to load public key: {e}")
@@ -122,6 +134,8 @@ QIDAQAB
                 self.logger.warning("Invalid license signature detected")
                 return
             
+            license_data = self._unpack_license(license_data)
+            self._expiry_ts = self._parse_expiry(license_data.get('expiry'))
             self.current_license = license_data
             self.logger.info("License loaded successfully", extra={
                 'type': license_data.get('type'),
@@ -137,13 +151,25 @@ QIDAQAB
     
     def _save_license(self, license_data: dict) -> None:
         """Save license data to file."""
+        tmp_file = self.license_file.with_suffix('.tmp')
         try:
-            with open(self.license_file, 'w') as f:
-                json.dump(license_data, f, indent=2)
-            self.license_file.chmod(0o600)  # Restrict permissions
+            # Write to a temp file created with restricted permissions, then
+            # atomically swap it in so a crash never leaves a torn license
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                os.write(fd, json.dumps(license_data, indent=2).encode())
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, self.license_file)
+            self._dirty_since_save = False
             self.logger.info("License saved successfully")
         except Exception as e:
             self.logger.error(f"Failed to save license: {e}")
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
             raise
     
     def activate_license(self, license_key: str) -> dict:
@@ -179,8 +205,11 @@ QIDAQAB
                 raise ValueError("Received invalid license from server")
             
             # Save and load the new license
+            activation_data = self._unpack_license(activation_data)
+            expiry_ts = self._parse_expiry(activation_data.get('expiry'))
             self._save_license(activation_data)
             self.current_license = activation_data
+            self._expiry_ts = expiry_ts
             
             self.logger.info("License activated successfully", extra={
                 'type': activation_data.get('type'),
@@ -220,8 +249,9 @@ QIDAQAB
             if now - last_validation > validation_interval:
                 server_valid = self._validate_with_server()
                 if server_valid:
+                    # Only the timestamp changed; persist it lazily on cleanup
                     self.current_license['lastValidation'] = now
-                    self._save_license(self.current_license)
+                    self._dirty_since_save = True
                 else:
                     self.logger.warning("Server validation failed for license")
                     return False
@@ -238,8 +268,7 @@ QIDAQAB
             return False
         
         # Check expiry
-        expiry = self.current_license.get('expiry')
-        if expiry != 'never' and datetime.utcnow() > datetime.fromisoformat(expiry):
+        if time.time() > self._expiry_ts:
             self.logger.info("License has expired")
             return False
         
@@ -255,24 +284,43 @@ QIDAQAB
         
         return True
     
+    def _parse_expiry(self, expiry: Optional[str]) -> float:
+        """Convert a license expiry string to a Unix timestamp (inf for 'never')."""
+        if not expiry:
+            # A license without an expiry is treated as already expired
+            return 0.0
+        if expiry == 'never':
+            return math.inf
+        
+        expiry_dt = datetime.fromisoformat(expiry)
+        if expiry_dt.tzinfo is None:
+            # Expiry dates are issued in UTC
+            expiry_dt = expiry_dt.replace(tzinfo=timezone.utc)
+        return expiry_dt.timestamp()
+    
     def _verify_license_signature(self, license_data: dict) -> bool:
         """Verify the signature of license data."""
         try:
             if not license_data.get('signature') or not self.public_key:
                 return False
             
-            # Create data string for verification (excluding signature)
-            data_to_verify = {k: v for k, v in license_data.items() if k != 'signature'}
-            data_str = json.dumps(data_to_verify, sort_keys=True)
+            from cryptography.hazmat.primitives import hashes
+            from cryptography.hazmat.primitives.asymmetric import padding
+            
+            pss = padding.PSS(
+                mgf=padding.MGF1(hashes.SHA256()),
+                salt_length=padding.PSS.MAX_LENGTH
+            )
+            
+            if not license_data.get('payload'):
+                return self._verify_legacy_signature(license_data, pss, hashes.SHA256())
             
-            # Verify signature
+            # The server signs the exact payload bytes, so no re-serialization
+            # is needed to reproduce the signed message
             self.public_key.verify(
-                license_data['signature'].encode(),
-                data_str.encode(),
-                padding.PSS(
-                    mgf=padding.MGF1(hashes.SHA256()),
-                    salt_length=padding.PSS.MAX_LENGTH
-                ),
+                base64.b64decode(license_data['signature']),
+                base64.b64decode(license_data['payload']),
+                pss,
                 hashes.SHA256()
             )
             
@@ -282,6 +330,48 @@ QIDAQAB
             self.logger.error(f"Signature verification error: {e}")
             return False
     
+    def _verify_legacy_signature(self, license_data: dict, pss, algorithm) -> bool:
+        """
+        Verify a license saved before signed payloads were introduced.
+        
+        These files are signed over the sorted JSON of every other field, and
+        the signature was read either as raw text or as base64.
+        """
+        from cryptography.exceptions import InvalidSignature
+        
+        data_to_verify = {k: v for k, v in license_data.items() if k != 'signature'}
+        data_str = json.dumps(data_to_verify, sort_keys=True).encode()
+        
+        signature = license_data['signature']
+        candidates = [signature.encode()]
+        try:
+            candidates.append(base64.b64decode(signature, validate=True))
+        except ValueError:
+            pass
+        
+        for candidate in candidates:
+            try:
+                self.public_key.verify(candidate, data_str, pss, algorithm)
+                return True
+            except InvalidSignature:
+                continue
+        
+        self.logger.error("Signature verification error: legacy license signature mismatch")
+        return False
+    
+    def _unpack_license(self, license_data: dict) -> dict:
+        """
+        Merge the signed payload fields into the license data.
+        
+        Signed fields take precedence over any plaintext copies; local-only
+        fields such as lastValidation are kept as-is. Legacy licenses have no
+        payload and are signed as a whole, so they are returned unchanged.
+        """
+        if not license_data.get('payload'):
+            return license_data
+        signed_fields = json.loads(base64.b64decode(license_data['payload']))
+        return {**license_data, **signed_fields}
+    
     def _validate_license_key_format(self, license_key: str) -> bool:
         """Validate the format of a license key."""
         # Expected format: MARKA-XXXXX-XXXXX-XXXXX-XXXXX
@@ -302,6 +392,8 @@ QIDAQAB
         Raises:
             Exception: If the request fails
         """
+        import requests
+        
         try:
             response = requests.post(
                 f"{self.api_endpoint}/{action}",
@@ -328,15 +420,58 @@ QIDAQAB
             else:
                 raise e
     
+    def _refresh_with_server(self, renew: bool = False) -> dict:
+        """
+        Validate the current license and pick up any new expiry in one request.
+        
+        Args:
+            renew: Whether to request a renewal of the license
+            
+        Returns:
+            dict: {
+                'valid': bool,
+                'payload': str or None,
+                'signature': str or None,
+                'lastValidation': int
+            }
+            
+        Raises:
+            ValueError: If the server sends a license that fails verification
+        """
+        response = self._contact_license_server('refresh', {
+            'licenseId': self.current_license['id'],
+            'machineId': self.machine_id,
+            'checksum': self._calculate_license_checksum(),
+            'renew': renew
+        })
+        
+        if response.get('valid', False):
+            # A new expiry only counts when it arrives as a freshly signed
+            # license; a bare field would be overridden by the old signed
+            # payload on the next load
+            if response.get('payload'):
+                if not self._verify_license_signature(response):
+                    raise ValueError("Received invalid license from server")
+                renewed = self._unpack_license({
+                    **self.current_license,
+                    'payload': response['payload'],
+                    'signature': response['signature']
+                })
+                self._expiry_ts = self._parse_expiry(renewed.get('expiry'))
+                self.current_license = renewed
+            elif response.get('newExpiry'):
+                self.logger.warning("Ignoring unsigned expiry from license server")
+            self.current_license['lastValidation'] = response.get(
+                'lastValidation', datetime.utcnow().timestamp() * 1000
+            )
+            self._dirty_since_save = True
+        
+        return response
+    
     def _validate_with_server(self) -> bool:
         """Validate the current license with the server."""
         try:
-            response = self._contact_license_server('validate', {
-                'licenseId': self.current_license['id'],
-                'machineId': self.machine_id,
-                'checksum': self._calculate_license_checksum()
-            })
-            
+            response = self._refresh_with_server()
             return response.get('valid', False)
             
         except Exception as e:
@@ -364,7 +499,7 @@ QIDAQAB
             return {
                 'type': 'TRIAL',
                 'status': 'trial',
-                'features': ['basic_reporting', 'student_management'],
+                'features': sorted(TRIAL_FEATURES),
                 'limits': {'students': 50, 'custom_templates': 1, 'cloud_sync': False},
                 'expiry': None,
                 'daysRemaining': None,
@@ -372,19 +507,16 @@ QIDAQAB
             }
         
         license_type = self.license_types.get(self.current_license.get('type', {}))
-        now = datetime.utcnow()
-        expiry = None if self.current_license.get('expiry') == 'never' else datetime.fromisoformat(self.current_license['expiry'])
-        
         days_remaining = None
-        if expiry:
-            days_remaining = max(0, (expiry - now).days)
+        if self._expiry_ts != math.inf:
+            days_remaining = max(0, int((self._expiry_ts - time.time()) // 86400))
         
         return {
             'type': self.current_license.get('type'),
             'name': license_type.get('name'),
             'status': 'active' if self._is_license_valid() else 'invalid',
-            'features': license_type.get('features', []),
-            'limits': license_type.get('limits', {}),
+            'features': sorted(license_type.get('features', ())),
+            'limits': dict(license_type.get('limits', {})),
             'expiry': self.current_license.get('expiry'),
             'daysRemaining': days_remaining,
             'isValid': self._is_license_valid(),
@@ -395,8 +527,11 @@ QIDAQAB
     
     def has_feature(self, feature_name: str) -> bool:
         """Check if the current license has a specific feature."""
-        license_info = self.get_license_info()
-        return feature_name in license_info.get('features', [])
+        if not self.current_license:
+            return feature_name in TRIAL_FEATURES
+        
+        license_type = LICENSE_TYPES.get(self.current_license.get('type'))
+        return license_type is not None and feature_name in license_type['features']
     
     def check_limit(self, limit_name: str, current_value: int) -> dict:
         """
@@ -438,6 +573,8 @@ QIDAQAB
                 pass
             
             self.current_license = None
+            self._expiry_ts = None
+            self._dirty_since_save = False
             self.logger.info("License deactivated successfully")
             
             # Notify about license status change
@@ -474,24 +611,22 @@ QIDAQAB
             if not self.current_license:
                 raise ValueError("No license to renew")
             
-            response = self._contact_license_server('renew', {
-                'licenseId': self.current_license['id'],
-                'machineId': self.machine_id
-            })
+            # Validation and renewal share a single round-trip
+            response = self._refresh_with_server(renew=True)
+            if not response.get('valid', False) or not response.get('payload'):
+                raise ValueError("License renewal was not granted")
             
-            # Update license with new expiry
-            self.current_license['expiry'] = response['newExpiry']
-            self.current_license['lastValidation'] = datetime.utcnow().timestamp() * 1000
             self._save_license(self.current_license)
+            new_expiry = self.current_license.get('expiry')
             
             self.logger.info("License renewed successfully", extra={
-                'newExpiry': response['newExpiry']
+                'newExpiry': new_expiry
             })
             
             # Notify about license status change
             self.license_status_changed.emit(self.get_license_info())
             
-            return {'success': True, 'newExpiry': response['newExpiry']}
+            return {'success': True, 'newExpiry': new_expiry}
             
         except Exception as e:
             self.logger.error(f"License renewal failed: {e}")
@@ -514,10 +649,23 @@ QIDAQAB
         except Exception as e:
             self.logger.error(f"Periodic license validation error: {e}")
     
+    def _flush_license(self) -> None:
+        """Persist pending in-memory license changes, if any."""
+        if not self._dirty_since_save or not self.current_license:
+            return
+        
+        try:
+            self._save_license(self.current_license)
+        except Exception as e:
+            self.logger.warning(f"Failed to flush license changes: {e}")
+    
     def cleanup(self) -> None:
         """Clean up the license manager."""
         if hasattr(self, 'validation_timer'):
             self.validation_timer.stop()
         
+        self._flush_license()
+        
         self.current_license = None
+        self._expiry_ts = None
         self.logger.info("LicenseManager cleanup completed")
\ No newline at end of file
@@ -1,14 +1,26 @@
 import sys
 from PySide6.QtWidgets import QApplication, QMessageBox
 from PySide6.QtCore import QTimer
-from qt_material import apply_stylesheet
 from app.main_window import MainWindow
+from app.icons import prime_icons
 from app.models.data_models import NotificationType
 from utils.logger import setup_logging
 
 logger = setup_logging(__name__)
 
 
+def _apply_theme(app):
+    """Apply the material design theme once the first frame is up."""
+    try:
+        from qt_material import apply_stylesheet
+        app_styles = app.styleSheet()
+        apply_stylesheet(app, theme='light_blue.xml')
+        # qt_material replaces the sheet; keep the app's own rules on top
+        app.setStyleSheet(app.styleSheet() + app_styles)
+    except Exception as e:
+        logger.warning(f"Failed to apply material theme: {e}")
+
+
 def main():
     """Main application entry point"""
     try:
@@ -18,16 +30,16 @@ def main():
         app.setApplicationVersion("1.0.0")
         app.setOrganizationName("Marka Educational Solutions")
         
-        # Apply material design theme
-        try:
-            apply_stylesheet(app, theme='light_blue.xml')
-        except Exception as e:
-            logger.warning(f"Failed to apply material theme: {e}")
+        # Parse the icon set before any widget asks for it
+        prime_icons()
         
         # Create and show main window
         window = MainWindow()
         window.show()
         
+        # Apply material design theme after the window is shown
+        QTimer.singleShot(0, lambda: _apply_theme(app))
+        
         # Show welcome notification after a short delay
         QTimer.singleShot(1000, lambda: window.notification_manager.show(
             "Welcome to Marka Report Card System Enterprise Edition!",
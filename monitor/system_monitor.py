@@ -1,17 +1,76 @@
 import os
+import sys
 import platform
+import functools
 import time
 import logging
+import shlex
 import subprocess
+import heapq
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
-from threading import Thread, Event
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from threading import Thread, Event, Lock
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from array import array
+from types import MappingProxyType
 import psutil
-import GPUtil
-from dataclasses import dataclass
+from dataclasses import dataclass, field, asdict
 from enum import Enum
 
+PARTITIONS_CACHE_TTL = 60  # Seconds between disk partition re-enumerations
+DISK_USAGE_CACHE_TTL = 2.0  # Seconds to reuse per-partition usage figures
+DISK_USAGE_TIMEOUT = 1.0  # Seconds to wait on statvfs before skipping a mount
+IS_LINUX = sys.platform.startswith('linux')
+SYSLOG_PATH = '/var/log/syslog'
+LOG_READ_CHUNK = 64 * 1024
+GPU_CACHE_TTL = 5  # Seconds to reuse a GPU probe (GPUtil shells out to nvidia-smi)
+TEMPS_CACHE_TTL = 2  # Seconds to reuse a temperature sensor reading
+PROC_STAT_FDS_CEILING = 128  # Upper bound on persistent /proc/<pid>/stat fds
+MARKA_COMM_TOKENS = (b'marka', b'Marka', b'MARKA')  # Matched against raw /proc comm bytes
+
+def _proc_stat_fd_budget() -> int:
+    """
+    Number of /proc/<pid>/stat fds to keep open across cycles.
+    
+    A quarter of the soft RLIMIT_NOFILE, capped at PROC_STAT_FDS_CEILING,
+    so the cache never starves the database and sockets of descriptors.
+    """
+    try:
+        import resource
+        soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    except (ImportError, OSError, ValueError):
+        return 0
+    if soft == resource.RLIM_INFINITY:
+        return PROC_STAT_FDS_CEILING
+    return max(0, min(PROC_STAT_FDS_CEILING, soft // 4))
+
+MAX_PROC_STAT_FDS = _proc_stat_fd_budget()  # Persistent /proc/<pid>/stat fds kept open across cycles
+
+@functools.cache
+def _platform_snapshot() -> MappingProxyType:
+    """
+    Collect platform.* details once per process.
+    
+    Several of these read /proc/cpuinfo or the interpreter binary, and none
+    of them change while the app is running.
+    """
+    return MappingProxyType({
+        key: sys.intern(value) for key, value in {
+            'system': platform.system(),
+            'release': platform.release(),
+            'version': platform.version(),
+            'machine': platform.machine(),
+            'processor': platform.processor(),
+            'architecture': platform.architecture()[0],
+            'node': platform.node()
+        }.items()
+    })
+
+def _iso_timestamp(ts: float) -> str:
+    """Format an epoch timestamp as a local ISO 8601 string (seconds precision)."""
+    return time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(ts))
+
 class AlertLevel(Enum):
     INFO = "info"
     WARNING = "warning"
@@ -24,9 +83,84 @@ class Alert:
     message: str
     timestamp: str
 
+@dataclass(slots=True)
+class CpuMetrics:
+    usage: float = 0.0
+    user: float = 0.0
+    system: float = 0.0
+    idle: float = 0.0
+
+@dataclass(slots=True)
+class MemoryMetrics:
+    total: int
+    available: int
+    used: int
+    free: int
+    percent: float
+    usage: float
+    swap_total: int
+    swap_used: int
+    swap_free: int
+    swap_percent: float
+
+@dataclass(slots=True)
+class DiskMetrics:
+    usage: float
+    partitions: List[Dict]
+    read_bytes: int = 0
+    write_bytes: int = 0
+    read_count: int = 0
+    write_count: int = 0
+
+@dataclass(slots=True)
+class ProcessInfo:
+    pid: int
+    name: str
+    cpu: float
+    memory: float
+
+@dataclass(slots=True)
+class ProcessMetrics:
+    total: int
+    marka: int
+    list: List[ProcessInfo] = field(default_factory=list)
+
+@dataclass(slots=True)
+class PerformanceMetrics:
+    cpu: CpuMetrics
+    memory: MemoryMetrics
+    disk: DiskMetrics
+    processes: ProcessMetrics
+    timestamp: str
+    
+    def to_dict(self) -> Dict:
+        """Convert to plain dicts for serialization at API boundaries."""
+        return asdict(self)
+
 class SystemMonitor:
     """Monitors system resources and performance metrics."""
     
+    _instance = None
+    _instance_lock = Lock()
+    
+    @classmethod
+    def instance(cls, options: Optional[Dict] = None) -> 'SystemMonitor':
+        """
+        Get the shared SystemMonitor, creating it on first use.
+        
+        Subsystems should use this rather than constructing their own monitor
+        so only one thread scans processes and keeps history.
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(options)
+            elif options and options != cls._instance._requested_options:
+                cls._instance.logger.warning(
+                    'SystemMonitor.instance() called with different options; '
+                    'using the existing monitor'
+                )
+            return cls._instance
+            
     def __init__(self, options: Optional[Dict] = None):
         """
         Initialize the SystemMonitor with configuration options.
@@ -39,6 +173,7 @@ class SystemMonitor:
                 - memory_threshold: Memory usage percentage threshold for alerts
                 - disk_threshold: Disk usage percentage threshold for alerts
         """
+        self._requested_options = dict(options or {})
         self.options = {
             'monitoring_interval': 5,
             'max_history': 60,
@@ -50,15 +185,59 @@ class SystemMonitor:
         
         self.monitoring_thread = None
         self.stop_event = Event()
+        # Per metric: preallocated (timestamps, values) ring buffers plus a
+        # one-element list holding the total number of samples written
+        size = self.options['max_history']
         self.metrics_history = {
-            'cpu': deque(maxlen=self.options['max_history']),
-            'memory': deque(maxlen=self.options['max_history']),
-            'disk': deque(maxlen=self.options['max_history'])
+            metric: (array('d', [0.0]) * size, array('d', [0.0]) * size, [0])
+            for metric in ('cpu', 'memory', 'disk')
         }
         self.alerts = deque(maxlen=100)  # Keep last 100 alerts
+        
+        # (metrics key, options threshold key, alert type, alert label)
+        self._threshold_specs = (
+            ('cpu', 'cpu_threshold', 'cpu', 'CPU'),
+            ('memory', 'memory_threshold', 'memory', 'memory'),
+            ('disk', 'disk_threshold', 'disk', 'disk')
+        )
+        self._hist_lock = Lock()  # Guards metrics_history and alerts
+        self._collect_lock = Lock()  # Serializes collection: CPU/process deltas and cached fds
         self.system_info = None
+        
+        # Caches for data that rarely or never changes
+        self._partitions_cache = []
+        self._partitions_cache_ts = None
+        self._part_cache = []
+        self._part_cache_ts = None
+        self._disk_executor = None
+        self._pool = None  # Runs the metric collectors concurrently
+        self._static_cpu_info = None
+        self._proc_cache: Dict[int, psutil.Process] = {}
+        self._gpu_cache = []
+        self._gpu_cache_ts = None
+        self._gpu_unavailable = False
+        self._temps_cache = None
+        self._temps_cache_ts = None
+        self._core_indices = None  # Positions of 'Core N' entries under coretemp
+        
+        # Previous (utime + stime) ticks per pid for the Linux /proc path
+        self._prev_proc_times: Dict[int, int] = {}
+        self._prev_proc_ts = None
+        self._proc_stat_fds: Dict[int, int] = {}
+        
+        # Persistent /proc/stat and /proc/meminfo fds for the Linux fast path
+        self._procfs_fds: Dict[str, int] = {}
+        self._prev_cpu_snap = None
+        self._mem_total = None
+        self._subscribers: List[Callable[[PerformanceMetrics], None]] = []
         self.logger = logging.getLogger('marka.system_monitor')
         
+        if SystemMonitor._instance is not None:
+            self.logger.warning(
+                'Creating an additional SystemMonitor; use SystemMonitor.instance() '
+                'to share one monitoring thread'
+            )
+        
     def start(self) -> None:
         """Start the system monitoring."""
         if self.monitoring_thread and self.monitoring_thread.is_alive():
@@ -68,6 +247,10 @@ class SystemMonitor:
         # Get initial system info
         self.system_info = self.get_system_info()
         
+        # Prime the non-blocking CPU counters so the first sample is valid
+        with self._collect_lock:
+            self._get_cpu_metrics()
+        
         # Start monitoring thread
         self.stop_event.clear()
         self.monitoring_thread = Thread(
@@ -86,71 +269,125 @@ class SystemMonitor:
             
         self.stop_event.set()
         self.monitoring_thread.join(timeout=5)
+        if self.monitoring_thread.is_alive():
+            # The loop is still mid-cycle and may be reading the cached fds;
+            # it exits on its own once the cycle ends
+            self.logger.warning('Monitoring thread did not stop in time; leaving its resources open')
+            return
+            
+        with self._collect_lock:
+            self._close_proc_stat_fds()
+            self._close_procfs_fds()
+            if self._disk_executor:
+                self._disk_executor.shutdown(wait=False)
+                self._disk_executor = None
+            if self._pool:
+                self._pool.shutdown(wait=False)
+                self._pool = None
         self.logger.info('System monitoring stopped')
         
     def _monitoring_loop(self) -> None:
-        """Main monitoring loop."""
+        """
+        Main monitoring loop.
+        
+        Cycles are scheduled against a monotonic deadline so collection time
+        does not add drift, and waiting on stop_event lets stop() interrupt
+        the pause immediately.
+        """
+        interval = self.options['monitoring_interval']
+        next_deadline = time.monotonic() + interval
+        
         while not self.stop_event.is_set():
             try:
-                metrics = self.get_performance_metrics()
+                now = time.time()
+                now_iso = _iso_timestamp(now)
+                metrics = self._collect_metrics(now_iso)
                 
                 # Store metrics in history
-                self._store_metric('cpu', metrics['cpu']['usage'])
-                self._store_metric('memory', metrics['memory']['usage'])
-                self._store_metric('disk', metrics['disk']['usage'])
+                self._store_metric('cpu', metrics.cpu.usage, now)
+                self._store_metric('memory', metrics.memory.usage, now)
+                self._store_metric('disk', metrics.disk.usage, now)
                 
                 # Check for threshold alerts
-                self._check_thresholds(metrics)
+                self._check_thresholds(metrics, now_iso)
+                
+                # Fan out to subscribers
+                for callback in list(self._subscribers):
+                    try:
+                        callback(metrics)
+                    except Exception as e:
+                        self.logger.error(f'Metrics subscriber failed: {str(e)}')
                 
             except Exception as e:
                 self.logger.error(f'Error in monitoring loop: {str(e)}')
                 
-            time.sleep(self.options['monitoring_interval'])
+            remaining = next_deadline - time.monotonic()
+            if remaining <= 0:
+                # Overran the interval; restart the schedule rather than
+                # firing a burst of catch-up cycles
+                next_deadline = time.monotonic() + interval
+                continue
+                
+            if self.stop_event.wait(remaining):
+                break
+            next_deadline += interval
+            
+    def subscribe(self, callback: Callable[[PerformanceMetrics], None]) -> None:
+        """Call callback with the metrics of every monitoring cycle."""
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
             
-    def _store_metric(self, metric_type: str, value: float) -> None:
-        """Store a metric in history."""
-        self.metrics_history[metric_type].append({
-            'timestamp': datetime.now().isoformat(),
-            'value': value
-        })
+    def unsubscribe(self, callback: Callable[[PerformanceMetrics], None]) -> None:
+        """Stop sending metrics to callback."""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+            
+    def _store_metric(self, metric_type: str, value: float,
+                      timestamp: Optional[float] = None) -> None:
+        """Store a metric in history (timestamp as epoch seconds)."""
+        timestamps, values, count = self.metrics_history[metric_type]
+        with self._hist_lock:
+            i = count[0] % len(values)
+            timestamps[i] = time.time() if timestamp is None else timestamp
+            values[i] = value
+            count[0] += 1
+            
+    def _read_history(self, metric_type: str) -> List[Dict]:
+        """Materialize one metric's ring buffer, oldest sample first."""
+        timestamps, values, count = self.metrics_history[metric_type]
+        with self._hist_lock:
+            size = len(values)
+            if count[0] <= size:
+                ts, vals = timestamps[:count[0]], values[:count[0]]
+            else:
+                start = count[0] % size
+                ts = timestamps[start:] + timestamps[:start]
+                vals = values[start:] + values[:start]
+                
+        return [{
+            'timestamp': _iso_timestamp(t),
+            'value': v
+        } for t, v in zip(ts, vals)]
         
-    def _check_thresholds(self, metrics: Dict) -> None:
+    def _check_thresholds(self, metrics: PerformanceMetrics, timestamp: Optional[str] = None) -> None:
         """Check metrics against configured thresholds."""
-        timestamp = datetime.now().isoformat()
-        
-        # CPU threshold check
-        if metrics['cpu']['usage'] > self.options['cpu_threshold']:
-            alert = Alert(
-                type='cpu',
-                level=AlertLevel.WARNING,
-                message=f'High CPU usage: {metrics["cpu"]["usage"]:.1f}%',
-                timestamp=timestamp
-            )
-            self._add_alert(alert)
-            
-        # Memory threshold check
-        if metrics['memory']['usage'] > self.options['memory_threshold']:
-            alert = Alert(
-                type='memory',
-                level=AlertLevel.WARNING,
-                message=f'High memory usage: {metrics["memory"]["usage"]:.1f}%',
-                timestamp=timestamp
-            )
-            self._add_alert(alert)
-            
-        # Disk threshold check
-        if metrics['disk']['usage'] > self.options['disk_threshold']:
-            alert = Alert(
-                type='disk',
-                level=AlertLevel.WARNING,
-                message=f'High disk usage: {metrics["disk"]["usage"]:.1f}%',
-                timestamp=timestamp
-            )
-            self._add_alert(alert)
-            
+        if timestamp is None:
+            timestamp = datetime.now().isoformat()
+        
+        for key, threshold_key, alert_type, label in self._threshold_specs:
+            usage = getattr(metrics, key).usage
+            if usage > self.options[threshold_key]:
+                self._add_alert(Alert(
+                    type=alert_type,
+                    level=AlertLevel.WARNING,
+                    message=f'High {label} usage: {usage:.1f}%',
+                    timestamp=timestamp
+                ))
+                
     def _add_alert(self, alert: Alert) -> None:
         """Add an alert to the alerts queue."""
-        self.alerts.append(alert)
+        with self._hist_lock:
+            self.alerts.append(alert)
         self.logger.warning(f'Alert: {alert.message}')
         
     def get_system_info(self) -> Dict:
@@ -166,7 +403,7 @@ class SystemMonitor:
                 'memory': memory_info,
                 'disk': disk_info,
                 'os': os_info,
-                'hostname': platform.node(),
+                'hostname': _platform_snapshot()['node'],
                 'uptime': int(time.time() - psutil.boot_time())
             }
         except Exception as e:
@@ -174,16 +411,21 @@ class SystemMonitor:
             raise
             
     def _get_cpu_info(self) -> Dict:
-        """Get CPU information."""
+        """Get CPU information (computed once)."""
+        if self._static_cpu_info is not None:
+            return self._static_cpu_info
+            
         cpu_freq = psutil.cpu_freq()
-        return {
+        snapshot = _platform_snapshot()
+        self._static_cpu_info = {
             'physical_cores': psutil.cpu_count(logical=False),
             'logical_cores': psutil.cpu_count(logical=True),
             'max_frequency': cpu_freq.max if cpu_freq else None,
             'min_frequency': cpu_freq.min if cpu_freq else None,
-            'architecture': platform.machine(),
-            'brand': platform.processor()
+            'architecture': snapshot['machine'],
+            'brand': snapshot['processor']
         }
+        return self._static_cpu_info
         
     def _get_memory_info(self) -> Dict:
         """Get memory information."""
@@ -196,153 +438,438 @@ class SystemMonitor:
         
     def _get_disk_info(self) -> List[Dict]:
         """Get disk information."""
-        disks = []
-        for partition in psutil.disk_partitions(all=False):
-            try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                disks.append({
-                    'device': partition.device,
-                    'mountpoint': partition.mountpoint,
-                    'fstype': partition.fstype,
-                    'total': usage.total,
-                    'used': usage.used,
-                    'free': usage.free,
-                    'percent': usage.percent
-                })
-            except Exception:
-                continue
-        return disks
+        return [dict(partition) for partition in self._collect_partitions()]
         
     def _get_os_info(self) -> Dict:
         """Get OS information."""
+        snapshot = _platform_snapshot()
         return {
-            'system': platform.system(),
-            'release': platform.release(),
-            'version': platform.version(),
-            'architecture': platform.architecture()[0]
+            'system': snapshot['system'],
+            'release': snapshot['release'],
+            'version': snapshot['version'],
+            'architecture': snapshot['architecture']
         }
         
+    def _get_partitions(self) -> List:
+        """Get mounted disk partitions, re-enumerated at most once a minute."""
+        now = time.monotonic()
+        if (self._partitions_cache_ts is None
+                or now - self._partitions_cache_ts > PARTITIONS_CACHE_TTL):
+            self._partitions_cache = psutil.disk_partitions(all=False)
+            self._partitions_cache_ts = now
+        return self._partitions_cache
+        
+    def _collect_partitions(self, ttl: float = DISK_USAGE_CACHE_TTL) -> List[Dict]:
+        """
+        Get usage for every mounted partition.
+        
+        disk_usage() runs on a worker pool so a hung (e.g. network) mount is
+        skipped after DISK_USAGE_TIMEOUT instead of stalling the caller.
+        Results are shared between get_system_info and the monitoring loop.
+        """
+        now = time.monotonic()
+        if self._part_cache_ts is not None and now - self._part_cache_ts < ttl:
+            return self._part_cache
+            
+        if self._disk_executor is None:
+            self._disk_executor = ThreadPoolExecutor(
+                max_workers=4,
+                thread_name_prefix='DiskUsage'
+            )
+            
+        futures = [
+            (partition, self._disk_executor.submit(psutil.disk_usage, partition.mountpoint))
+            for partition in self._get_partitions()
+        ]
+        deadline = time.monotonic() + DISK_USAGE_TIMEOUT
+        
+        partitions = []
+        for partition, future in futures:
+            try:
+                usage = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeoutError:
+                self.logger.warning(f'Timed out reading disk usage for {partition.mountpoint}')
+                continue
+            except Exception:
+                # The mount may have gone away; re-enumerate next cycle
+                self._partitions_cache_ts = None
+                continue
+                
+            partitions.append({
+                'device': partition.device,
+                'mountpoint': partition.mountpoint,
+                'fstype': partition.fstype,
+                'total': usage.total,
+                'used': usage.used,
+                'free': usage.free,
+                'percent': usage.percent
+            })
+            
+        self._part_cache = partitions
+        self._part_cache_ts = now
+        return partitions
+        
     def get_performance_metrics(self) -> Dict:
         """Get current performance metrics."""
-        try:
-            cpu_metrics = self._get_cpu_metrics()
-            memory_metrics = self._get_memory_metrics()
-            disk_metrics = self._get_disk_metrics()
-            process_metrics = self._get_process_metrics()
+        return self._collect_metrics().to_dict()
+        
+    def _collect_metrics(self, timestamp: Optional[str] = None) -> PerformanceMetrics:
+        """
+        Collect current performance metrics as typed records.
+        
+        Args:
+            timestamp: Pre-formatted cycle timestamp; defaults to now
             
-            return {
-                'cpu': cpu_metrics,
-                'memory': memory_metrics,
-                'disk': disk_metrics,
-                'processes': process_metrics,
-                'timestamp': datetime.now().isoformat()
-            }
+        Returns:
+            PerformanceMetrics for the monitoring loop, thresholds and subscribers
+            
+        The four collectors run concurrently, so a cycle takes as long as the
+        slowest one. Each collector only touches its own state, but CPU and
+        process usage are deltas against the previous call and share cached
+        fds, so concurrent callers are serialized on a lock.
+        """
+        try:
+            with self._collect_lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=4,
+                        thread_name_prefix='sysmon'
+                    )
+                    
+                futures = {
+                    'cpu': self._pool.submit(self._get_cpu_metrics),
+                    'memory': self._pool.submit(self._get_memory_metrics),
+                    'disk': self._pool.submit(self._get_disk_metrics),
+                    'processes': self._pool.submit(self._get_process_metrics)
+                }
+                return PerformanceMetrics(
+                    timestamp=timestamp or datetime.now().isoformat(),
+                    **{key: future.result() for key, future in futures.items()}
+                )
         except Exception as e:
             self.logger.error(f'Failed to get performance metrics: {str(e)}')
             raise
             
-    def _get_cpu_metrics(self) -> Dict:
-        """Get CPU metrics."""
-        cpu_percent = psutil.cpu_percent(interval=1)
-        cpu_times = psutil.cpu_times_percent(interval=1)
+    def _read_procfs(self, path: str) -> bytes:
+        """Read a procfs file through a file descriptor kept open across cycles."""
+        fd = self._procfs_fds.get(path)
+        if fd is None:
+            fd = self._procfs_fds[path] = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+        return os.pread(fd, 8192, 0)
         
-        return {
-            'usage': cpu_percent,
-            'user': cpu_times.user,
-            'system': cpu_times.system,
-            'idle': cpu_times.idle
-        }
+    def _close_procfs_fds(self) -> None:
+        """Close the persistent procfs file descriptors."""
+        for fd in self._procfs_fds.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._procfs_fds.clear()
         
-    def _get_memory_metrics(self) -> Dict:
+    def _get_cpu_metrics(self) -> CpuMetrics:
+        """
+        Get CPU metrics.
+        
+        Values are non-blocking deltas since the previous call, which in the
+        monitoring loop is one monitoring_interval.
+        """
+        if IS_LINUX:
+            try:
+                return self._get_cpu_metrics_proc()
+            except (OSError, ValueError) as e:
+                self.logger.warning(f'Falling back to psutil for CPU metrics: {e}')
+                
+        cpu_percent = psutil.cpu_percent(interval=None)
+        cpu_times = psutil.cpu_times_percent(interval=None)
+        
+        return CpuMetrics(
+            usage=cpu_percent,
+            user=cpu_times.user,
+            system=cpu_times.system,
+            idle=cpu_times.idle
+        )
+        
+    def _get_cpu_metrics_proc(self) -> CpuMetrics:
+        """Get CPU metrics on Linux from the aggregate line of /proc/stat."""
+        line = self._read_procfs('/proc/stat').split(b'\n', 1)[0]
+        # user nice system idle iowait irq softirq steal
+        snap = tuple(int(v) for v in line.split()[1:9])
+        prev = self._prev_cpu_snap or (0,) * len(snap)
+        self._prev_cpu_snap = snap
+        
+        delta = [cur - old for cur, old in zip(snap, prev)]
+        total = sum(delta)
+        if total <= 0:
+            return CpuMetrics()
+            
+        user, _, system, idle, iowait = delta[:5]
+        return CpuMetrics(
+            usage=round((total - idle - iowait) / total * 100, 1),
+            user=round(user / total * 100, 1),
+            system=round(system / total * 100, 1),
+            idle=round(idle / total * 100, 1)
+        )
+        
+    def _get_memory_metrics(self) -> MemoryMetrics:
         """Get memory metrics."""
+        if IS_LINUX:
+            try:
+                return self._get_memory_metrics_proc()
+            except (OSError, KeyError, ValueError) as e:
+                self.logger.warning(f'Falling back to psutil for memory metrics: {e}')
+                
         mem = psutil.virtual_memory()
         swap = psutil.swap_memory()
         
-        return {
-            'total': mem.total,
-            'available': mem.available,
-            'used': mem.used,
-            'free': mem.free,
-            'percent': mem.percent,
-            'swap_total': swap.total,
-            'swap_used': swap.used,
-            'swap_free': swap.free,
-            'swap_percent': swap.percent
-        }
+        return MemoryMetrics(
+            total=mem.total,
+            available=mem.available,
+            used=mem.used,
+            free=mem.free,
+            percent=mem.percent,
+            usage=mem.percent,
+            swap_total=swap.total,
+            swap_used=swap.used,
+            swap_free=swap.free,
+            swap_percent=swap.percent
+        )
+        
+    def _get_memory_metrics_proc(self) -> MemoryMetrics:
+        """Get memory metrics on Linux from /proc/meminfo (values in kB)."""
+        info = {}
+        for line in self._read_procfs('/proc/meminfo').splitlines():
+            key, _, rest = line.partition(b':')
+            info[key] = int(rest.split()[0]) * 1024
+            
+        total = info[b'MemTotal']
+        free = info[b'MemFree']
+        available = info[b'MemAvailable']
+        cached = info[b'Cached'] + info.get(b'SReclaimable', 0)
+        used = total - free - info[b'Buffers'] - cached
+        if used < 0:
+            used = total - free
+        percent = round((total - available) / total * 100, 1) if total else 0.0
+        
+        swap_total = info[b'SwapTotal']
+        swap_free = info[b'SwapFree']
+        swap_used = swap_total - swap_free
+        
+        return MemoryMetrics(
+            total=total,
+            available=available,
+            used=used,
+            free=free,
+            percent=percent,
+            usage=percent,
+            swap_total=swap_total,
+            swap_used=swap_used,
+            swap_free=swap_free,
+            swap_percent=round(swap_used / swap_total * 100, 1) if swap_total else 0.0
+        )
         
-    def _get_disk_metrics(self) -> Dict:
+    def _get_disk_metrics(self) -> DiskMetrics:
         """Get disk metrics."""
         disk_io = psutil.disk_io_counters()
-        partitions = []
+        partitions = [{
+            'device': p['device'],
+            'mountpoint': p['mountpoint'],
+            'total': p['total'],
+            'used': p['used'],
+            'free': p['free'],
+            'percent': p['percent']
+        } for p in self._collect_partitions()]
+        
+        return DiskMetrics(
+            usage=max((p['percent'] for p in partitions), default=0.0),
+            partitions=partitions,
+            read_bytes=disk_io.read_bytes if disk_io else 0,
+            write_bytes=disk_io.write_bytes if disk_io else 0,
+            read_count=disk_io.read_count if disk_io else 0,
+            write_count=disk_io.write_count if disk_io else 0
+        )
         
-        for partition in psutil.disk_partitions(all=False):
+    def _get_process_metrics(self) -> ProcessMetrics:
+        """Get process metrics."""
+        if IS_LINUX:
             try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                partitions.append({
-                    'device': partition.device,
-                    'mountpoint': partition.mountpoint,
-                    'total': usage.total,
-                    'used': usage.used,
-                    'free': usage.free,
-                    'percent': usage.percent
-                })
-            except Exception:
-                continue
+                return self._get_process_metrics_proc()
+            except OSError as e:
+                self.logger.warning(f'Falling back to psutil for process metrics: {e}')
+        return self._get_process_metrics_psutil()
+        
+    def _get_process_metrics_proc(self) -> ProcessMetrics:
+        """
+        Get process metrics on Linux by reading /proc/<pid>/stat directly.
+        
+        One scandir of /proc lists the pids and each stat file is read and
+        parsed in a single pass; CPU usage is the tick delta since the
+        previous cycle.
+        """
+        if self._mem_total is None:
+            self._mem_total = psutil.virtual_memory().total
+            self._clk_tck = os.sysconf('SC_CLK_TCK')
+            self._page_size = os.sysconf('SC_PAGE_SIZE')
+            
+        now = time.monotonic()
+        elapsed = now - self._prev_proc_ts if self._prev_proc_ts else 0
+        prev_times = self._prev_proc_times
+        cur_times = {}
+        top = []  # Min-heap of (tick delta, pid, comm, rss) for the busiest 50
+        total = 0
+        marka_count = 0
+        
+        with os.scandir('/proc') as entries:
+            pids = {int(entry.name) for entry in entries if entry.name.isdigit()}
+            
+        fds = self._proc_stat_fds
+        for pid in fds.keys() - pids:
+            os.close(fds.pop(pid))
+            
+        for pid in pids:
+            buf = self._read_proc_stat(pid)
+            if not buf:
+                continue  # Process exited since the scan
                 
-        return {
-            'partitions': partitions,
-            'read_bytes': disk_io.read_bytes if disk_io else 0,
-            'write_bytes': disk_io.write_bytes if disk_io else 0,
-            'read_count': disk_io.read_count if disk_io else 0,
-            'write_count': disk_io.write_count if disk_io else 0
-        }
+            # comm may itself contain spaces or parentheses, so split around
+            # the outermost pair; the fields after it start at field 3 (state)
+            lparen = buf.find(b'(')
+            rparen = buf.rfind(b')')
+            comm = buf[lparen + 1:rparen]
+            fields = buf[rparen + 2:].split()
+            ticks = int(fields[11]) + int(fields[12])  # utime + stime
+            cur_times[pid] = ticks
+            total += 1
+            
+            if any(token in comm for token in MARKA_COMM_TOKENS):
+                marka_count += 1
+                
+            # Idle processes (no new ticks) never displace a heap entry, so
+            # nothing is built for them
+            delta = ticks - prev_times.get(pid, ticks)
+            if len(top) < 50:
+                heapq.heappush(top, (delta, pid, comm, fields[21]))
+            elif delta > top[0][0]:
+                heapq.heapreplace(top, (delta, pid, comm, fields[21]))
+                
+        self._prev_proc_times = cur_times
+        self._prev_proc_ts = now
+        
+        tick_scale = 100 / self._clk_tck / elapsed if elapsed else 0.0
+        mem_scale = self._page_size / self._mem_total * 100
+        processes = [ProcessInfo(
+            pid=pid,
+            name=comm.decode('utf-8', 'replace'),
+            cpu=delta * tick_scale,
+            memory=int(rss) * mem_scale
+        ) for delta, pid, comm, rss in sorted(top, reverse=True)]  # Top 50 by CPU
+        
+        return ProcessMetrics(
+            total=total,
+            marka=marka_count,
+            list=processes
+        )
+        
+    def _read_proc_stat(self, pid: int) -> Optional[bytes]:
+        """
+        Read /proc/<pid>/stat.
+        
+        The file is kept open across cycles (up to MAX_PROC_STAT_FDS) so a
+        steady-state read is a single pread() instead of open/read/close.
+        """
+        fds = self._proc_stat_fds
+        fd = fds.get(pid)
+        try:
+            if fd is None:
+                fd = os.open(f'/proc/{pid}/stat', os.O_RDONLY | os.O_CLOEXEC)
+                if len(fds) < MAX_PROC_STAT_FDS:
+                    fds[pid] = fd
+                else:
+                    try:
+                        return os.read(fd, 4096)
+                    finally:
+                        os.close(fd)
+            return os.pread(fd, 4096, 0)
+        except OSError:
+            # The process is gone (or the pid was reused under an old fd)
+            if fds.pop(pid, None) is not None:
+                os.close(fd)
+            return None
+            
+    def _close_proc_stat_fds(self) -> None:
+        """Close the cached /proc/<pid>/stat file descriptors."""
+        for fd in self._proc_stat_fds.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._proc_stat_fds.clear()
+        
+    def _get_process_metrics_psutil(self) -> ProcessMetrics:
+        """
+        Get process metrics through psutil.
+        
+        Process handles are kept across cycles so that cpu_percent() is a
+        cheap non-blocking delta and the process name is only read once.
+        """
+        pids = set(psutil.pids())
+        
+        # Drop exited processes and pick up new ones
+        for pid in self._proc_cache.keys() - pids:
+            del self._proc_cache[pid]
+        for pid in pids - self._proc_cache.keys():
+            try:
+                self._proc_cache[pid] = psutil.Process(pid)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
         
-    def _get_process_metrics(self) -> Dict:
-        """Get process metrics."""
         processes = []
         marka_count = 0
         
-        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
+        for pid, proc in list(self._proc_cache.items()):
             try:
-                process_info = proc.info
-                if 'marka' in process_info['name'].lower():
+                name = proc.name()
+                if 'marka' in name.lower():
                     marka_count += 1
                     
-                processes.append({
-                    'pid': process_info['pid'],
-                    'name': process_info['name'],
-                    'cpu': process_info['cpu_percent'],
-                    'memory': process_info['memory_percent']
-                })
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                processes.append(ProcessInfo(
+                    pid=pid,
+                    name=name,
+                    cpu=proc.cpu_percent(None),
+                    memory=proc.memory_percent()
+                ))
+            except psutil.NoSuchProcess:
+                self._proc_cache.pop(pid, None)
+            except psutil.AccessDenied:
                 continue
                 
-        return {
-            'total': len(processes),
-            'marka': marka_count,
-            'list': processes[:50]  # Return first 50 processes
-        }
+        return ProcessMetrics(
+            total=len(processes),
+            marka=marka_count,
+            list=heapq.nlargest(50, processes, key=lambda p: p.cpu)  # Top 50 by CPU
+        )
         
     def get_network_info(self) -> Dict:
         """Get network information."""
         try:
             interfaces = []
             io_counters = psutil.net_io_counters(pernic=True)
-            
+            try:
+                addrs_map = psutil.net_if_addrs()
+            except Exception:
+                addrs_map = {}
+                
+            total_sent = 0
+            total_recv = 0
             for name, stats in io_counters.items():
-                addresses = []
-                try:
-                    addrs = psutil.net_if_addrs().get(name, [])
-                    for addr in addrs:
-                        addresses.append({
-                            'family': addr.family.name,
-                            'address': addr.address,
-                            'netmask': addr.netmask,
-                            'broadcast': addr.broadcast
-                        })
-                except Exception:
-                    pass
+                addresses = [{
+                    'family': addr.family.name,
+                    'address': addr.address,
+                    'netmask': addr.netmask,
+                    'broadcast': addr.broadcast
+                } for addr in addrs_map.get(name, ())]
                     
+                total_sent += stats.bytes_sent
+                total_recv += stats.bytes_recv
                 interfaces.append({
                     'name': name,
                     'addresses': addresses,
@@ -354,8 +881,8 @@ class SystemMonitor:
                 
             return {
                 'interfaces': interfaces,
-                'total_bytes_sent': sum(i.bytes_sent for i in io_counters.values()),
-                'total_bytes_recv': sum(i.bytes_recv for i in io_counters.values())
+                'total_bytes_sent': total_sent,
+                'total_bytes_recv': total_recv
             }
         except Exception as e:
             self.logger.error(f'Failed to get network info: {str(e)}')
@@ -390,19 +917,28 @@ class SystemMonitor:
             
     def get_temperature_info(self) -> Dict:
         """Get temperature information."""
+        now = time.monotonic()
+        if self._temps_cache_ts is not None and now - self._temps_cache_ts < TEMPS_CACHE_TTL:
+            return self._temps_cache
+            
         try:
-            temps = psutil.sensors_temperatures()
-            core_temps = []
-            
-            if 'coretemp' in temps:
-                for entry in temps['coretemp']:
-                    if 'Core' in entry.label:
-                        core_temps.append(entry.current)
-                        
-            return {
+            entries = psutil.sensors_temperatures().get('coretemp', [])
+            
+            # Sensor labels are fixed for the life of the boot, so find the
+            # per-core entries once and index straight into later readings
+            indices = self._core_indices
+            if indices is None or (indices and indices[-1] >= len(entries)):
+                self._core_indices = [
+                    i for i, entry in enumerate(entries) if 'Core' in entry.label
+                ]
+            core_temps = [entries[i].current for i in self._core_indices]
+            
+            self._temps_cache = {
                 'core_temps': core_temps,
                 'max_temp': max(core_temps) if core_temps else None
             }
+            self._temps_cache_ts = now
+            return self._temps_cache
         except Exception as e:
             self.logger.error(f'Failed to get temperature info: {str(e)}')
             return {
@@ -411,10 +947,24 @@ class SystemMonitor:
             }
             
     def get_gpu_info(self) -> List[Dict]:
-        """Get GPU information."""
+        """Get GPU information (cached for GPU_CACHE_TTL seconds)."""
+        if self._gpu_unavailable:
+            return []
+            
+        now = time.monotonic()
+        if self._gpu_cache_ts is not None and now - self._gpu_cache_ts < GPU_CACHE_TTL:
+            return self._gpu_cache
+            
         try:
-            gpus = GPUtil.getGPUs()
-            return [{
+            from GPUtil import getGPUs
+        except ImportError:
+            self._gpu_unavailable = True
+            self.logger.info('GPUtil not installed; GPU info unavailable')
+            return []
+            
+        try:
+            gpus = getGPUs()
+            self._gpu_cache = [{
                 'id': gpu.id,
                 'name': gpu.name,
                 'load': gpu.load * 100,
@@ -423,6 +973,8 @@ class SystemMonitor:
                 'memory_free': gpu.memoryFree,
                 'temperature': gpu.temperature
             } for gpu in gpus]
+            self._gpu_cache_ts = now
+            return self._gpu_cache
         except Exception as e:
             self.logger.error(f'Failed to get GPU info: {str(e)}')
             return []
@@ -430,25 +982,38 @@ class SystemMonitor:
     def get_load_history(self) -> Dict:
         """Get historical load metrics."""
         return {
-            'cpu': list(self.metrics_history['cpu']),
-            'memory': list(self.metrics_history['memory']),
-            'disk': list(self.metrics_history['disk'])
+            'cpu': self._read_history('cpu'),
+            'memory': self._read_history('memory'),
+            'disk': self._read_history('disk')
         }
         
     def get_active_alerts(self) -> List[Dict]:
         """Get active alerts."""
-        return [alert.__dict__ for alert in self.alerts]
+        with self._hist_lock:
+            alerts = list(self.alerts)
+        return [alert.__dict__ for alert in alerts]
         
     def clear_alerts(self) -> None:
         """Clear all alerts."""
-        self.alerts.clear()
+        with self._hist_lock:
+            self.alerts.clear()
         
-    def run_command(self, command: str) -> Tuple[str, str]:
-        """Run a system command and return output."""
+    def run_command(self, command: Union[List[str], str]) -> Tuple[str, str]:
+        """
+        Run a system command and return output.
+        
+        The command is executed directly, without a shell. On POSIX a string
+        is split with shlex; on Windows it is handed to CreateProcess as-is so
+        backslashes in paths survive. Pass an argument list to avoid any
+        quoting issues.
+        """
+        if isinstance(command, str) and os.name != 'nt':
+            args = shlex.split(command)
+        else:
+            args = command
         try:
             result = subprocess.run(
-                command,
-                shell=True,
+                args,
                 check=True,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
@@ -458,17 +1023,36 @@ class SystemMonitor:
         except subprocess.CalledProcessError as e:
             self.logger.error(f'Command failed: {command} - {str(e)}')
             return e.stdout, e.stderr
+        except OSError as e:
+            # Missing or non-executable programs fail here now there is no shell
+            self.logger.error(f'Command failed: {command} - {str(e)}')
+            return '', str(e)
             
+    def _tail_file(self, path: str, lines: int) -> List[str]:
+        """Return the last lines of a file, reading backwards from the end."""
+        with open(path, 'rb') as f:
+            pos = f.seek(0, os.SEEK_END)
+            data = b''
+            # One extra newline so the first kept line is complete
+            while pos > 0 and data.count(b'\n') <= lines:
+                step = min(LOG_READ_CHUNK, pos)
+                pos -= step
+                f.seek(pos)
+                data = f.read(step) + data
+                
+        return [line.decode('utf-8', 'replace') for line in data.splitlines()[-lines:]]
+        
     def get_system_logs(self, lines: int = 100) -> List[str]:
         """Get system logs."""
         try:
-            if platform.system() == 'Windows':
-                command = f'powershell -command "Get-EventLog -LogName Application -Newest {lines} | Format-Table -AutoSize"'
-            else:
-                command = f'tail -n {lines} /var/log/syslog'
+            if _platform_snapshot()['system'] == 'Windows':
+                stdout, _ = self.run_command([
+                    'powershell', '-command',
+                    f'Get-EventLog -LogName Application -Newest {int(lines)} | Format-Table -AutoSize'
+                ])
+                return stdout.splitlines()
                 
-            stdout, _ = self.run_command(command)
-            return stdout.splitlines()
+            return self._tail_file(SYSLOG_PATH, lines)
         except Exception as e:
             self.logger.error(f'Failed to get system logs: {str(e)}')
-            return []
\ No newline at end of file
+            return []
@@ -1,11 +1,19 @@
 import os
+import re
 import json
+import functools
+from bisect import bisect_right
+import sqlite3
 import logging
-from datetime import datetime
+import multiprocessing
+import threading
+from datetime import date, datetime
 from pathlib import Path
-from typing import Optional, Dict, List, Any, Union
+from types import MappingProxyType
+from typing import Optional, Dict, List, Any, Union, BinaryIO, Mapping
 import qrcode
 from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -15,9 +23,158 @@ from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from PySide6.QtCore import QStandardPaths
 from PIL import Image as PILImage
+from PyPDF2 import PdfWriter
 import bcrypt
 from cryptography.fernet import Fernet
 import hashlib
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+
+# Any character that is not alphanumeric (str.isalnum semantics, Unicode-aware)
+UNSAFE_FILENAME_CHARS = re.compile(r'[\W_]')
+PDF_WRITE_BUFFER = 1024 * 1024  # Lets most reports reach disk in a single write
+SQL_MAX_VARIABLES = 900  # Stay under SQLite's bound-parameter limit on older builds
+TEMPLATE_CACHE_SIZE = 64  # Most recently used templates kept by a generator
+
+# Grade boundaries: bisect_right(thresholds, score) indexes the matching label
+PLE_THRESHOLDS = (40, 50, 60, 70, 80, 90)
+PLE_LETTERS = ('P7', 'C6', 'C5', 'C4', 'C3', 'D2', 'D1')
+UCE_THRESHOLDS = (45, 55, 65, 75, 85)
+UCE_LETTERS = ('F', 'E', 'D', 'C', 'B', 'A')
+UACE_POINTS = (0, 2, 3, 4, 5, 6)  # Points per UCE_LETTERS index
+REMARK_THRESHOLDS = (45, 55, 65, 75, 85)
+REMARKS = ('Needs Improvement', 'Fair', 'Satisfactory', 'Good', 'Very Good', 'Excellent')
+
+# Scores run 0-100 and every boundary is a whole number, so the label index
+# for any score can be read from a 101-entry table at int(score)
+PLE_INDEX = bytes(bisect_right(PLE_THRESHOLDS, score) for score in range(101))
+UCE_INDEX = bytes(bisect_right(UCE_THRESHOLDS, score) for score in range(101))
+REMARK_INDEX = bytes(bisect_right(REMARK_THRESHOLDS, score) for score in range(101))
+UACE_POINTS_BY_SCORE = bytes(UACE_POINTS[index] for index in UCE_INDEX)
+
+# Grade distributions count base letters (PLE 'C6' and 'C3' both count as 'C');
+# UCE letters are already single letters, so UCE_INDEX doubles as their slot
+PLE_BASE_LETTERS = ('P', 'C', 'D')
+PLE_BASE_INDEX = bytes(PLE_BASE_LETTERS.index(PLE_LETTERS[index][0]) for index in PLE_INDEX)
+
+DEFAULT_ATTENDANCE = {'present_days': 0, 'absent_days': 0, 'attendance_percentage': 100}
+
+# Built-in report templates; read-only and shared, copied only on request
+PLE_TEMPLATE = MappingProxyType({
+    'name': 'PLE Standard Template',
+    'type': 'PLE',
+    'grading_system': 'division',
+    'subjects': ('English', 'Mathematics', 'Science', 'Social Studies'),
+    'show_aggregate': True,
+    'show_division': True
+})
+UCE_TEMPLATE = MappingProxyType({
+    'name': 'UCE Standard Template',
+    'type': 'UCE',
+    'grading_system': 'letter',
+    'subjects': ('English', 'Mathematics', 'Physics', 'Chemistry', 'Biology', 'History', 'Geography'),
+    'show_aggregate': False,
+    'show_division': False
+})
+UACE_TEMPLATE = MappingProxyType({
+    'name': 'UACE Standard Template',
+    'type': 'UACE',
+    'grading_system': 'points',
+    'subjects': (),  # Variable based on combination
+    'show_points': True,
+    'show_university_eligibility': True
+})
+
+# Conduct and attendance for a chunk of students; {ids} takes one (?) per id.
+# Comparisons are 0/1 in SQLite, so SUM counts statuses in a single scan.
+STUDENT_CONTEXT_SQL = (
+    "WITH ids(student_id) AS (VALUES {ids}), "
+    "a AS ("
+    "SELECT student_id, "
+    "SUM(status = 'Present') as present_days, "
+    "SUM(status = 'Absent') as absent_days, "
+    "COUNT(*) as total_days "
+    "FROM attendance "
+    "WHERE student_id IN (SELECT student_id FROM ids) AND term = ? AND academic_year = ? "
+    "GROUP BY student_id) "
+    "SELECT ids.student_id as ctx_student_id, a.present_days as ctx_present_days, "
+    "a.absent_days as ctx_absent_days, a.total_days as ctx_total_days, c.* "
+    "FROM ids "
+    "LEFT JOIN conduct c ON c.student_id = ids.student_id AND c.term = ? AND c.academic_year = ? "
+    "LEFT JOIN a ON a.student_id = ids.student_id"
+)
+
+
+class _WorkerDatabase:
+    """Read-only database handle used by report worker processes."""
+
+    def __init__(self, db_path: str):
+        # as_uri() percent-escapes '?', '#' and '%' and handles Windows drive paths
+        self.conn = sqlite3.connect(Path(db_path).resolve().as_uri() + '?mode=ro', uri=True)
+        self.conn.row_factory = sqlite3.Row
+
+    def execute_query(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        """Execute a SQL query and return rows as dictionaries."""
+        cursor = self.conn.cursor()
+        cursor.execute(sql, params)
+        return [dict(row) for row in cursor.fetchall()]
+
+
+# Per-process generator set up by _init_render_worker
+_worker_generator = None
+
+# Font names registered with ReportLab; registration is process-wide, so it
+# happens once and every generator reuses the result
+_registered_fonts = None
+_font_lock = threading.Lock()
+
+
+def _init_render_worker(db_path: str, output_dir: str, school_info: Dict[str, Any],
+                        batch_date: datetime):
+    """Initialize a report worker process with its own database handle."""
+    global _worker_generator
+    _worker_generator = ReportGenerator(_WorkerDatabase(db_path), output_dir=output_dir)
+    # Settings may be encrypted with the parent's key, so use its resolved copy
+    _worker_generator._school_info_cache = school_info
+    _worker_generator.set_batch_date(batch_date)
+
+
+def _render_one(job: tuple) -> Dict[str, Any]:
+    """Render a single student's report in a worker process."""
+    return _worker_generator.render_student_report(*job)
+
+
+def _sv(settings: Dict[str, Any], key: str, default: Any = None) -> Any:
+    """Return a setting's value, or default when the setting is missing."""
+    entry = settings.get(key)
+    return entry.get('value', default) if entry else default
+
+
+def _grading_scale(class_level: str) -> tuple:
+    """Return the (thresholds, letters) grading scale for a class level."""
+    if class_level == 'P7':
+        return PLE_THRESHOLDS, PLE_LETTERS  # PLE grading system
+    return UCE_THRESHOLDS, UCE_LETTERS  # UCE/UACE grading system
+
+
+def _distribution_scale(class_level: str) -> tuple:
+    """Return the (score-to-slot table, base letters) used for grade distributions."""
+    if class_level == 'P7':
+        return PLE_BASE_INDEX, PLE_BASE_LETTERS
+    return UCE_INDEX, UCE_LETTERS
+
+
+def _grade_index_table(class_level: str) -> bytes:
+    """Return the score-to-label-index table for a class level's grading scale."""
+    return PLE_INDEX if class_level == 'P7' else UCE_INDEX
+
+
+@functools.lru_cache(maxsize=2048)
+def _grade_letter(score: float, class_level: str) -> str:
+    """Return the grade letter for a score; scores and levels repeat heavily."""
+    thresholds, letters = _grading_scale(class_level)
+    return letters[bisect_right(thresholds, score)]
+
 
 class ReportGenerator:
     """
@@ -26,11 +183,32 @@ class ReportGenerator:
     and bulk report generation.
     """
     
-    def __init__(self, database_manager):
+    # Candidate classes sit national exams and get their own templates
+    _TEMPLATE_MAP = {'P7': 'PLE', 'S4': 'UCE', 'S6': 'UACE'}
+    
+    # ReportLab's sample stylesheet is read-only here, so all generators share one
+    _sample_styles = None
+    # Built paragraph styles, shared by generators with the same fonts and colors
+    _styles_by_config = {}
+    
+    def __init__(self, database_manager, output_dir: Optional[Union[str, Path]] = None):
         self.db = database_manager
-        self.output_dir = None
-        self.template_cache = {}
-        self.fonts = {}
+        self.output_dir = Path(output_dir) if output_dir else None
+        self._output_dir_str = None  # Resolved once so filenames join as plain strings
+        self.template_cache = OrderedDict()  # LRU, bounded by TEMPLATE_CACHE_SIZE
+        self._school_info_cache = None
+        self._batch_date_str = None  # Filename date shared by a bulk run
+        self._batch_footer_date = None  # Footer date shared by a bulk run
+        self._styles_cache = None
+        self._grade_colors = None
+        self._table_styles = None
+        # Invariant header/comments/footer flowables, one cache per thread:
+        # ReportLab sets flowable.canv while drawing, so threads can't share them
+        self._section_cache = threading.local()
+        self._context_prefetch = {}  # (student_id, term, academic_year) -> context, batch-scoped
+        self._qr = None
+        self._qr_lock = threading.Lock()
+        self._fonts = None  # Registered on first use, see fonts
         self.colors = {
             'primary': colors.HexColor('#1D3557'),
             'secondary': colors.HexColor('#2A9D8F'),
@@ -49,53 +227,88 @@ class ReportGenerator:
         """Initialize the report generator."""
         try:
             # Set output directory
-            data_dir = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
-            self.output_dir = Path(data_dir) / 'reports'
+            if self.output_dir is None:
+                data_dir = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+                self.output_dir = Path(data_dir) / 'reports'
             os.makedirs(self.output_dir, exist_ok=True)
-
-            # Load fonts
-            self.load_fonts()
-
-            # Load default templates
-            self.load_templates()
+            self._output_dir_str = str(self.output_dir) + os.sep
+            
+            # Fonts and templates are loaded on first use
+            
+            # QR settings are fixed, so one encoder is reset and reused per report
+            self._qr = qrcode.QRCode(
+                version=1,
+                error_correction=qrcode.constants.ERROR_CORRECT_L,
+                box_size=10,
+                border=4,
+            )
+            self._qr_fill = '#' + self.colors['primary'].hexval()[2:]
 
             self.logger.info('ReportGenerator initialized successfully')
         except Exception as e:
             self.logger.error(f'Failed to initialize ReportGenerator: {str(e)}')
             raise
 
+    @property
+    def fonts(self) -> Dict[str, str]:
+        """Font names for PDF generation, registering the fonts on first access."""
+        if self._fonts is None:
+            self.load_fonts()
+        return self._fonts
+
     def load_fonts(self):
-        """Load fonts for PDF generation."""
-        try:
-            # Register default fonts
-            pdfmetrics.registerFont(TTFont('Roboto', 'Roboto-Regular.ttf'))
-            pdfmetrics.registerFont(TTFont('Roboto-Bold', 'Roboto-Bold.ttf'))
-            pdfmetrics.registerFont(TTFont('Roboto-Italic', 'Roboto-Italic.ttf'))
-            pdfmetrics.registerFont(TTFont('Roboto-Light', 'Roboto-Light.ttf'))
-            
-            self.fonts = {
-                'regular': 'Roboto',
-                'bold': 'Roboto-Bold',
-                'italic': 'Roboto-Italic',
-                'light': 'Roboto-Light'
-            }
-        except Exception as e:
-            self.logger.warning(f'Failed to load custom fonts: {str(e)}')
-            # Fall back to standard fonts
-            self.fonts = {
-                'regular': 'Helvetica',
-                'bold': 'Helvetica-Bold',
-                'italic': 'Helvetica-Oblique',
-                'light': 'Helvetica'
-            }
+        """Load fonts for PDF generation (registered once per process)."""
+        global _registered_fonts
+        with _font_lock:
+            if _registered_fonts is None:
+                try:
+                    # Register default fonts
+                    pdfmetrics.registerFont(TTFont('Roboto', 'Roboto-Regular.ttf'))
+                    pdfmetrics.registerFont(TTFont('Roboto-Bold', 'Roboto-Bold.ttf'))
+                    pdfmetrics.registerFont(TTFont('Roboto-Italic', 'Roboto-Italic.ttf'))
+                    pdfmetrics.registerFont(TTFont('Roboto-Light', 'Roboto-Light.ttf'))
+                    
+                    _registered_fonts = {
+                        'regular': 'Roboto',
+                        'bold': 'Roboto-Bold',
+                        'italic': 'Roboto-Italic',
+                        'light': 'Roboto-Light'
+                    }
+                except Exception as e:
+                    self.logger.warning(f'Failed to load custom fonts: {str(e)}')
+                    # Fall back to standard fonts
+                    _registered_fonts = {
+                        'regular': 'Helvetica',
+                        'bold': 'Helvetica-Bold',
+                        'italic': 'Helvetica-Oblique',
+                        'light': 'Helvetica'
+                    }
+        self._fonts = _registered_fonts
 
     def load_templates(self):
-        """Load default report templates."""
-        self.template_cache['PLE_STANDARD'] = self.create_ple_template()
-        self.template_cache['UCE_STANDARD'] = self.create_uce_template()
-        self.template_cache['UACE_STANDARD'] = self.create_uace_template()
+        """Load all default report templates up front."""
+        for template_key in ('PLE_STANDARD', 'UCE_STANDARD', 'UACE_STANDARD'):
+            self.get_template(template_key)
 
-    def generate_pdf(self, report_data: Dict[str, Any]) -> str:
+    def get_template(self, template_key: str) -> Optional[Mapping[str, Any]]:
+        """Get a report template (read-only), caching it on first use."""
+        template = self.template_cache.get(template_key)
+        if template is not None:
+            self.template_cache.move_to_end(template_key)
+            return template
+        template = {
+            'PLE_STANDARD': PLE_TEMPLATE,
+            'UCE_STANDARD': UCE_TEMPLATE,
+            'UACE_STANDARD': UACE_TEMPLATE
+        }.get(template_key)
+        if template is not None:
+            self.template_cache[template_key] = template
+            if len(self.template_cache) > TEMPLATE_CACHE_SIZE:
+                self.template_cache.popitem(last=False)
+        return template
+
+    def generate_pdf(self, report_data: Dict[str, Any],
+                     output: Optional[BinaryIO] = None) -> Union[str, BinaryIO]:
         """
         Generate a PDF report based on the given report data.
         
@@ -107,9 +320,10 @@ class ReportGenerator:
                 - academic_year: Academic year
                 - template: Template name (optional)
                 - options: Additional options (optional)
+            output: Binary stream to render into instead of a file (optional)
                 
         Returns:
-            Path to the generated PDF file
+            Path to the generated PDF file, or output when one was given
         """
         try:
             self.validate_report_data(report_data)
@@ -121,39 +335,45 @@ class ReportGenerator:
             # Determine template
             template_type = self.get_template_type(student['class_level'])
             template_key = f"{template_type}_STANDARD"
-            template = self.template_cache.get(template_key)
+            template = self.get_template(template_key)
             
             if not template:
                 raise ValueError(f"No template found for {template_key}")
             
-            # Generate filename
-            filename = self.generate_filename(student, term, academic_year)
-            filepath = self.output_dir / filename
-            
-            # Create PDF document
-            doc = SimpleDocTemplate(
-                str(filepath),
-                pagesize=A4,
-                leftMargin=20*mm,
-                rightMargin=20*mm,
-                topMargin=20*mm,
-                bottomMargin=20*mm
-            )
-            
             # Build story (content elements)
             story = []
             self.build_report_content(story, report_data, template)
             
-            # Generate PDF
-            doc.build(story)
+            if output is not None:
+                self._build_document(output, story)
+                return output
+            
+            # Generate filename
+            filepath = self._output_dir_str + self.generate_filename(student, term, academic_year)
+            
+            # Generate PDF through a large buffered writer
+            with open(filepath, 'wb', buffering=PDF_WRITE_BUFFER) as fh:
+                self._build_document(fh, story)
             
             self.logger.info(f'Generated PDF report: {filepath}')
-            return str(filepath)
+            return filepath
             
         except Exception as e:
             self.logger.error(f'Failed to generate PDF: {str(e)}')
             raise
 
+    def _build_document(self, output: BinaryIO, story: List):
+        """Lay out a report story as an A4 PDF into a binary stream."""
+        doc = SimpleDocTemplate(
+            output,
+            pagesize=A4,
+            leftMargin=20*mm,
+            rightMargin=20*mm,
+            topMargin=20*mm,
+            bottomMargin=20*mm
+        )
+        doc.build(story)
+
     def generate_bulk_reports(self, criteria: Dict[str, Any]) -> Dict[str, Any]:
         """
         Generate reports for multiple students based on criteria.
@@ -165,7 +385,8 @@ class ReportGenerator:
                 - academic_year: Academic year
                 - template: Template name (optional)
                 - output_format: 'individual' or 'combined' (default: 'individual')
-                - options: Additional options (optional)
+                - options: Additional options (optional); set 'in_process' to
+                  render on threads instead of worker processes
                 
         Returns:
             Dictionary with summary of generation results
@@ -183,63 +404,193 @@ class ReportGenerator:
             if not students:
                 raise ValueError('No students found matching criteria')
             
+            # Settings don't change mid-batch; read them once for the whole run
+            self._school_info_cache = None
+            self._school_info_cache = self.get_school_info()
+            batch_date = datetime.now()
+            self.set_batch_date(batch_date)
+            
             results = []
-            batch_size = 10  # Process in batches to manage memory
+            batch_size = 10  # Jobs handed to a worker at a time
+            options = criteria.get('options', {})
+            # Fetch every student's grades, conduct and attendance up front
+            # instead of running queries per report
+            student_ids = [student['id'] for student in students]
+            grades_by_student = self.prefetch_grades(student_ids, term, academic_year)
+            context_by_student = self.get_student_context(student_ids, term, academic_year)
+            combined = output_format == 'combined'
+            jobs = [
+                (student, term, academic_year, template, options,
+                 grades_by_student[student['id']], context_by_student[student['id']], combined)
+                for student in students
+            ]
+            total_batches = (len(students) - 1) // batch_size + 1
             
-            for i in range(0, len(students), batch_size):
-                batch = students[i:i + batch_size]
-                batch_results = []
-                
-                for student in batch:
-                    try:
-                        # Get student grades
-                        grades = self.db.execute_query(
-                            "SELECT g.*, s.name as subject_name FROM grades g "
-                            "JOIN subjects s ON g.subject_id = s.id "
-                            "WHERE g.student_id = ? AND g.term = ? AND g.academic_year = ?",
-                            (student['id'], term, academic_year)
-                        )
-                        
-                        # Generate report
-                        filepath = self.generate_pdf({
-                            'student': student,
-                            'grades': grades,
-                            'term': term,
-                            'academic_year': academic_year,
-                            'template': template,
-                            'options': criteria.get('options', {})
-                        })
-                        
-                        batch_results.append({
-                            'success': True,
-                            'student': student['name'],
-                            'filepath': filepath
-                        })
-                    except Exception as e:
-                        self.logger.error(f"Failed to generate report for {student['name']}: {str(e)}")
-                        batch_results.append({
-                            'success': False,
-                            'student': student['name'],
-                            'error': str(e)
-                        })
-                
-                results.extend(batch_results)
-                self.logger.info(f"Processed batch {i//batch_size + 1}/{(len(students)-1)//batch_size + 1}")
+            db_path = getattr(self.db, 'db_path', None)
+            if options.get('in_process') or not db_path:
+                executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+                results_iter = executor.map(lambda job: self.render_student_report(*job), jobs)
+            else:
+                # ReportLab rendering is CPU-bound, so spread it across processes
+                # Spawn, not fork: forking a process with Qt threads running
+                # can deadlock the child on locks those threads held
+                executor = ProcessPoolExecutor(
+                    max_workers=os.cpu_count(),
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_render_worker,
+                    initargs=(str(db_path), str(self.output_dir), self._school_info_cache, batch_date)
+                )
+                results_iter = executor.map(_render_one, jobs, chunksize=batch_size)
+            
+            # Combined output is merged in memory as reports arrive, in order
+            writer = PdfWriter() if combined else None
+            
+            successful = failed = 0
+            with executor:
+                for result in results_iter:
+                    if writer is not None and result['success']:
+                        writer.append(BytesIO(result.pop('pdf')))
+                    results.append(result)
+                    if result['success']:
+                        successful += 1
+                    else:
+                        failed += 1
+                    if len(results) % batch_size == 0 or len(results) == len(jobs):
+                        self.logger.info(f"Processed batch {(len(results) - 1) // batch_size + 1}/{total_batches}")
             
             # Create summary
             summary = {
                 'total': len(students),
-                'successful': sum(1 for r in results if r['success']),
-                'failed': sum(1 for r in results if not r['success']),
+                'successful': successful,
+                'failed': failed,
                 'results': results
             }
             
+            if writer is not None and successful:
+                stem = UNSAFE_FILENAME_CHARS.sub('_', f"{class_level}_{term}_{academic_year}")
+                filepath = self.output_dir / f"{stem}_{self._batch_date_str}_combined.pdf"
+                with open(filepath, 'wb', buffering=PDF_WRITE_BUFFER) as fh:
+                    writer.write(fh)
+                summary['filepath'] = str(filepath)
+                self.logger.info(f'Generated combined PDF report: {filepath}')
+            
             self.logger.info(f"Bulk report generation completed: {summary['successful']}/{summary['total']} successful")
             return summary
             
         except Exception as e:
             self.logger.error(f'Bulk report generation failed: {str(e)}')
             raise
+        finally:
+            self._school_info_cache = None
+            self.set_batch_date(None)
+
+    def set_batch_date(self, batch_date: Optional[datetime]):
+        """Fix the date stamped on reports for a bulk run (None to use today)."""
+        if batch_date is None:
+            self._batch_date_str = self._batch_footer_date = None
+        else:
+            self._batch_date_str = batch_date.strftime('%Y%m%d')
+            self._batch_footer_date = batch_date.strftime('%Y-%m-%d')
+
+    def prefetch_grades(self, student_ids: List[int], term: str,
+                        academic_year: str) -> Dict[int, List[Dict[str, Any]]]:
+        """Get grades for many students at once, grouped by student id."""
+        grades_by_student = defaultdict(list)
+        for i in range(0, len(student_ids), SQL_MAX_VARIABLES):
+            ids = student_ids[i:i + SQL_MAX_VARIABLES]
+            rows = self.db.execute_query(
+                "SELECT g.*, s.name as subject_name FROM grades g "
+                "JOIN subjects s ON g.subject_id = s.id "
+                f"WHERE g.student_id IN ({','.join('?' * len(ids))}) "
+                "AND g.term = ? AND g.academic_year = ?",
+                (*ids, term, academic_year)
+            )
+            for row in rows:
+                grades_by_student[row['student_id']].append(row)
+        return grades_by_student
+
+    def get_student_context(self, student_ids: List[int], term: str,
+                            academic_year: str) -> Dict[int, Dict[str, Dict[str, Any]]]:
+        """
+        Get conduct and attendance for many students in one query per chunk.
+        
+        Returns:
+            Dictionary mapping each student id to its 'conduct' and 'attendance' data
+        """
+        context = {}
+        for i in range(0, len(student_ids), SQL_MAX_VARIABLES):
+            ids = student_ids[i:i + SQL_MAX_VARIABLES]
+            rows = self.db.execute_query(
+                STUDENT_CONTEXT_SQL.format(ids=','.join(['(?)'] * len(ids))),
+                (*ids, term, academic_year, term, academic_year)
+            )
+            for row in rows:
+                student_id = row['ctx_student_id']
+                # Conduct is the full conduct row; the ctx_ columns are ours
+                conduct = {}
+                if row['id'] is not None:
+                    conduct = {key: value for key, value in row.items() if not key.startswith('ctx_')}
+                attendance = dict(DEFAULT_ATTENDANCE)
+                if row['ctx_total_days']:
+                    attendance = {
+                        'present_days': row['ctx_present_days'],
+                        'absent_days': row['ctx_absent_days'],
+                        'attendance_percentage': round(row['ctx_present_days'] * 100 / row['ctx_total_days'], 1)
+                    }
+                context[student_id] = {'conduct': conduct, 'attendance': attendance}
+        return context
+
+    def render_student_report(self, student: Dict[str, Any], term: str, academic_year: str,
+                              template: str, options: Dict[str, Any],
+                              grades: Optional[List[Dict[str, Any]]] = None,
+                              context: Optional[Dict[str, Dict[str, Any]]] = None,
+                              combined: bool = False) -> Dict[str, Any]:
+        """
+        Generate one student's report and return its result entry.
+        
+        With combined set the PDF is rendered in memory and returned as bytes
+        under 'pdf' for merging, instead of being written to its own file.
+        """
+        try:
+            # Get student grades unless they were prefetched
+            if grades is None:
+                grades = self.db.execute_query(
+                    "SELECT g.*, s.name as subject_name FROM grades g "
+                    "JOIN subjects s ON g.subject_id = s.id "
+                    "WHERE g.student_id = ? AND g.term = ? AND g.academic_year = ?",
+                    (student['id'], term, academic_year)
+                )
+            
+            report_data = {
+                'student': student,
+                'grades': grades,
+                'term': term,
+                'academic_year': academic_year,
+                'template': template,
+                'options': options,
+                'context': context
+            }
+            
+            if combined:
+                return {
+                    'success': True,
+                    'student': student['name'],
+                    'pdf': self.generate_pdf(report_data, output=BytesIO()).getvalue()
+                }
+            
+            # Generate report
+            return {
+                'success': True,
+                'student': student['name'],
+                'filepath': self.generate_pdf(report_data)
+            }
+        except Exception as e:
+            self.logger.error(f"Failed to generate report for {student['name']}: {str(e)}")
+            return {
+                'success': False,
+                'student': student['name'],
+                'error': str(e)
+            }
 
     def build_report_content(self, story: List, report_data: Dict[str, Any], template: Dict[str, Any]):
         """Build the content of the report."""
@@ -265,7 +616,7 @@ class ReportGenerator:
         self.add_performance_summary(story, student, grades, template)
         
         # Add conduct and attendance
-        self.add_conduct_attendance(story, student, term, academic_year)
+        self.add_conduct_attendance(story, student, term, academic_year, report_data.get('context'))
         
         # Add comments section
         self.add_comments_section(story)
@@ -286,7 +637,26 @@ class ReportGenerator:
             except Exception as e:
                 self.logger.warning(f"Failed to add school logo: {str(e)}")
         
-        # School information
+        # The rest of the header only depends on school info, so it is built
+        # once per thread and the same flowables are reused for every report
+        key = ('header', school_info['name'], school_info['address'],
+               school_info['phone'], school_info['email'])
+        story.extend(self._cached_section(key, lambda section: self._build_header(section, school_info)))
+
+    def _cached_section(self, key: tuple, build) -> List:
+        """Get the flowables for an invariant report section, building them once per thread."""
+        cache = getattr(self._section_cache, 'sections', None)
+        if cache is None:
+            cache = self._section_cache.sections = {}
+        flowables = cache.get(key)
+        if flowables is None:
+            flowables = []
+            build(flowables)
+            cache[key] = flowables
+        return flowables
+
+    def _build_header(self, story: List, school_info: Dict[str, Any]):
+        """Build the school details, title and divider of the report header."""
         styles = self.get_styles()
         
         # School name
@@ -342,17 +712,7 @@ class ReportGenerator:
         student_table = Table(
             student_data,
             colWidths=[40*mm, 60*mm],
-            style=[
-                ('BACKGROUND', (0,0), (-1,-1), self.colors['background']),
-                ('BOX', (0,0), (-1,-1), 1, self.colors['secondary']),
-                ('FONT', (0,0), (-1,-1), self.fonts['regular']),
-                ('FONTSIZE', (0,0), (-1,-1), 10),
-                ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-                ('ALIGN', (0,0), (0,-1), 'RIGHT'),
-                ('ALIGN', (1,0), (1,-1), 'LEFT'),
-                ('BOTTOMPADDING', (0,0), (-1,-1), 5),
-                ('TOPPADDING', (0,0), (-1,-1), 5)
-            ]
+            style=self.get_table_styles()['info_box']
         )
         
         story.append(student_table)
@@ -362,16 +722,18 @@ class ReportGenerator:
         """Add grades table to the report."""
         styles = self.get_styles()
         
-        # Process grades
+        # Process grades, resolving the grading scale once for the table
+        _, letters = self.get_grading_scale(student['class_level'])
+        index_table = _grade_index_table(student['class_level'])
         processed_grades = []
         for grade in grades:
-            grade_letter = self.calculate_grade_letter(grade['score'], student['class_level'])
+            score = grade['score']
             processed_grades.append([
                 grade['subject_name'],
-                str(grade['score']),
-                grade_letter,
+                str(score),
+                letters[index_table[int(score)]],
                 '',  # Position would be calculated
-                self.get_grade_remark(grade['score'])
+                REMARKS[REMARK_INDEX[int(score)]]
             ])
         
         # Table header
@@ -380,26 +742,16 @@ class ReportGenerator:
         # Build table data
         table_data = [header] + processed_grades
         
+        # Start from the shared style and add only the grade-color command
+        grades_style = TableStyle(parent=self.get_table_styles()['grades'])
+        if processed_grades:
+            grades_style.add('TEXTCOLOR', (2,1), (2,-1), self.get_grade_color(processed_grades[0][2]))
+        
         # Create table
         grades_table = Table(
             table_data,
             colWidths=[70*mm, 25*mm, 25*mm, 25*mm, 45*mm],
-            style=[
-                ('BACKGROUND', (0,0), (-1,0), self.colors['secondary']),
-                ('TEXTCOLOR', (0,0), (-1,0), colors.white),
-                ('ALIGN', (0,0), (-1,0), 'CENTER'),
-                ('FONT', (0,0), (-1,0), self.fonts['bold']),
-                ('FONTSIZE', (0,0), (-1,0), 10),
-                ('BOTTOMPADDING', (0,0), (-1,0), 8),
-                ('BACKGROUND', (0,1), (-1,-1), colors.white),
-                ('GRID', (0,0), (-1,-1), 1, colors.lightgrey),
-                ('FONT', (0,1), (-1,-1), self.fonts['regular']),
-                ('FONTSIZE', (0,1), (-1,-1), 9),
-                ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-                ('ALIGN', (1,1), (2,-1), 'CENTER'),
-                ('TEXTCOLOR', (2,1), (2,-1), self.get_grade_color(processed_grades[0][2])),
-                ('ROWBACKGROUNDS', (0,1), (-1,-1), [self.colors['background'], colors.white])
-            ]
+            style=grades_style
         )
         
         story.append(Paragraph("ACADEMIC PERFORMANCE", styles['Heading3']))
@@ -429,17 +781,7 @@ class ReportGenerator:
         summary_table = Table(
             summary_data,
             colWidths=[50*mm, 30*mm],
-            style=[
-                ('BACKGROUND', (0,0), (-1,-1), self.colors['background']),
-                ('BOX', (0,0), (-1,-1), 1, self.colors['secondary']),
-                ('FONT', (0,0), (-1,-1), self.fonts['regular']),
-                ('FONTSIZE', (0,0), (-1,-1), 10),
-                ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-                ('ALIGN', (0,0), (0,-1), 'RIGHT'),
-                ('ALIGN', (1,0), (1,-1), 'LEFT'),
-                ('BOTTOMPADDING', (0,0), (-1,-1), 5),
-                ('TOPPADDING', (0,0), (-1,-1), 5)
-            ]
+            style=self.get_table_styles()['info_box']
         )
         
         story.append(Paragraph("PERFORMANCE SUMMARY", styles['Heading3']))
@@ -461,25 +803,22 @@ class ReportGenerator:
         two_col_table = Table(
             [[elements[0], elements[-1]]],
             colWidths=[100*mm, 70*mm],
-            style=[
-                ('VALIGN', (0,0), (-1,-1), 'TOP'),
-                ('ALIGN', (0,0), (0,0), 'LEFT'),
-                ('ALIGN', (1,0), (1,0), 'RIGHT')
-            ]
+            style=self.get_table_styles()['two_column']
         )
         
         story.append(two_col_table)
         story.append(Spacer(1, 10*mm))
 
-    def add_conduct_attendance(self, story: List, student: Dict[str, Any], term: str, academic_year: str):
+    def add_conduct_attendance(self, story: List, student: Dict[str, Any], term: str, academic_year: str,
+                               context: Optional[Dict[str, Dict[str, Any]]] = None):
         """Add conduct and attendance section."""
         styles = self.get_styles()
         
-        # Get conduct data
-        conduct_data = self.get_conduct_data(student['id'], term, academic_year)
-        
-        # Get attendance data
-        attendance_data = self.get_attendance_data(student['id'], term, academic_year)
+        # Get conduct and attendance data unless they were prefetched
+        if context is None:
+            context = self._get_student_context(student['id'], term, academic_year)
+        conduct_data = context['conduct']
+        attendance_data = context['attendance']
         
         # Create two-column layout
         elements = []
@@ -494,17 +833,7 @@ class ReportGenerator:
         conduct_table = Table(
             conduct_items,
             colWidths=[50*mm, 30*mm],
-            style=[
-                ('BACKGROUND', (0,0), (-1,-1), self.colors['background']),
-                ('BOX', (0,0), (-1,-1), 1, self.colors['secondary']),
-                ('FONT', (0,0), (-1,-1), self.fonts['regular']),
-                ('FONTSIZE', (0,0), (-1,-1), 10),
-                ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-                ('ALIGN', (0,0), (0,-1), 'RIGHT'),
-                ('ALIGN', (1,0), (1,-1), 'LEFT'),
-                ('BOTTOMPADDING', (0,0), (-1,-1), 5),
-                ('TOPPADDING', (0,0), (-1,-1), 5)
-            ]
+            style=self.get_table_styles()['info_box']
         )
         
         # Attendance box
@@ -517,17 +846,7 @@ class ReportGenerator:
         attendance_table = Table(
             attendance_items,
             colWidths=[50*mm, 30*mm],
-            style=[
-                ('BACKGROUND', (0,0), (-1,-1), self.colors['background']),
-                ('BOX', (0,0), (-1,-1), 1, self.colors['secondary']),
-                ('FONT', (0,0), (-1,-1), self.fonts['regular']),
-                ('FONTSIZE', (0,0), (-1,-1), 10),
-                ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-                ('ALIGN', (0,0), (0,-1), 'RIGHT'),
-                ('ALIGN', (1,0), (1,-1), 'LEFT'),
-                ('BOTTOMPADDING', (0,0), (-1,-1), 5),
-                ('TOPPADDING', (0,0), (-1,-1), 5)
-            ]
+            style=self.get_table_styles()['info_box']
         )
         
         # Add section title
@@ -544,11 +863,7 @@ class ReportGenerator:
                 attendance_table
             ]],
             colWidths=[80*mm, 80*mm],
-            style=[
-                ('VALIGN', (0,0), (-1,-1), 'TOP'),
-                ('ALIGN', (0,0), (-1,-1), 'CENTER'),
-                ('BOTTOMPADDING', (0,0), (-1,-1), 10)
-            ]
+            style=self.get_table_styles()['two_column_centered']
         )
         
         story.append(two_col_table)
@@ -556,6 +871,10 @@ class ReportGenerator:
 
     def add_comments_section(self, story: List):
         """Add comments section to the report."""
+        story.extend(self._cached_section(('comments',), self._build_comments_section))
+
+    def _build_comments_section(self, story: List):
+        """Build the comments title and ruled box."""
         styles = self.get_styles()
         
         # Comments title
@@ -580,6 +899,17 @@ class ReportGenerator:
 
     def add_report_footer(self, story: List, school_info: Dict[str, Any]):
         """Add report footer with signatures."""
+        key = ('footer', school_info.get('motto'))
+        story.extend(self._cached_section(key, lambda section: self._build_footer(section, school_info)))
+        
+        # Generation info
+        story.append(Paragraph(
+            f"Generated on {self._batch_footer_date or datetime.now().strftime('%Y-%m-%d')} by Marka Report Generator",
+            self.get_styles()['FooterSmall']
+        ))
+
+    def _build_footer(self, story: List, school_info: Dict[str, Any]):
+        """Build the signature lines and school motto."""
         styles = self.get_styles()
         
         # Signature lines
@@ -610,12 +940,6 @@ class ReportGenerator:
                 styles['FooterText']
             ))
             story.append(Spacer(1, 5*mm))
-        
-        # Generation info
-        story.append(Paragraph(
-            f"Generated on {datetime.now().strftime('%Y-%m-%d')} by Marka Report Generator",
-            styles['FooterSmall']
-        ))
 
     def add_qr_code(self, story: List, student: Dict[str, Any], term: str, academic_year: str):
         """Add QR code for verification."""
@@ -632,21 +956,15 @@ class ReportGenerator:
             }
             
             # Generate QR code
-            qr = qrcode.QRCode(
-                version=1,
-                error_correction=qrcode.constants.ERROR_CORRECT_L,
-                box_size=10,
-                border=4,
-            )
-            qr.add_data(json.dumps(verification_data))
-            qr.make(fit=True)
-            
-            # Create image
-            qr_img = qr.make_image(fill_color=self.colors['primary'].hex[1:], back_color="white")
-            
-            # Convert to bytes
             img_bytes = BytesIO()
-            qr_img.save(img_bytes, format='PNG')
+            with self._qr_lock:
+                self._qr.clear()
+                self._qr.add_data(json.dumps(verification_data, separators=(',', ':')))
+                self._qr.make(fit=True)
+                
+                # Create image and convert to bytes
+                qr_img = self._qr.make_image(fill_color=self._qr_fill, back_color="white")
+                qr_img.save(img_bytes, format='PNG')
             img_bytes.seek(0)
             
             # Add to story
@@ -686,28 +1004,28 @@ class ReportGenerator:
 
     def get_template_type(self, class_level: str) -> str:
         """Determine template type based on class level."""
-        if class_level == 'P7': return 'PLE'
-        if class_level == 'S4': return 'UCE'
-        if class_level == 'S6': return 'UACE'
-        return 'STANDARD'
+        return self._TEMPLATE_MAP.get(class_level, 'STANDARD')
 
-    def generate_filename(self, student: Dict[str, Any], term: str, academic_year: str) -> str:
+    def generate_filename(self, student: Dict[str, Any], term: str, academic_year: str,
+                          date_str: Optional[str] = None) -> str:
         """Generate a unique filename for the report."""
-        sanitized_name = ''.join(c if c.isalnum() else '_' for c in student['name'])
-        timestamp = datetime.now().strftime('%Y%m%d')
+        sanitized_name = UNSAFE_FILENAME_CHARS.sub('_', student['name'])
+        timestamp = date_str or self._batch_date_str or datetime.now().strftime('%Y%m%d')
         return f"{sanitized_name}_{student['student_id']}_{term}_{academic_year}_{timestamp}.pdf"
 
     def get_school_info(self) -> Dict[str, Any]:
         """Get school information from database or defaults."""
+        if self._school_info_cache is not None:
+            return self._school_info_cache
         try:
             settings = self.db.get_all_settings()
             return {
-                'name': settings.get('school_name', {}).get('value', 'Sample School'),
-                'address': settings.get('school_address', {}).get('value', 'School Address'),
-                'phone': settings.get('school_phone', {}).get('value', '+256 XXX XXXXXX'),
-                'email': settings.get('school_email', {}).get('value', 'info@school.edu'),
-                'motto': settings.get('school_motto', {}).get('value', 'Excellence in Education'),
-                'logo': settings.get('school_logo', {}).get('value')
+                'name': _sv(settings, 'school_name', 'Sample School'),
+                'address': _sv(settings, 'school_address', 'School Address'),
+                'phone': _sv(settings, 'school_phone', '+256 XXX XXXXXX'),
+                'email': _sv(settings, 'school_email', 'info@school.edu'),
+                'motto': _sv(settings, 'school_motto', 'Excellence in Education'),
+                'logo': _sv(settings, 'school_logo')
             }
         except Exception as e:
             self.logger.error(f"Failed to get school info: {str(e)}")
@@ -720,29 +1038,23 @@ class ReportGenerator:
                 'logo': None
             }
 
+    def get_grading_scale(self, class_level: str) -> tuple:
+        """Get the (thresholds, letters) grading scale for a class level."""
+        return _grading_scale(class_level)
+
     def calculate_grade_letter(self, score: float, class_level: str) -> str:
         """Calculate grade letter based on score and class level."""
-        if class_level == 'P7':
-            # PLE grading system
-            if score >= 90: return 'D1'
-            if score >= 80: return 'D2'
-            if score >= 70: return 'C3'
-            if score >= 60: return 'C4'
-            if score >= 50: return 'C5'
-            if score >= 40: return 'C6'
-            return 'P7'
-        else:
-            # UCE/UACE grading system
-            if score >= 85: return 'A'
-            if score >= 75: return 'B'
-            if score >= 65: return 'C'
-            if score >= 55: return 'D'
-            if score >= 45: return 'E'
-            return 'F'
+        return _grade_letter(score, class_level)
 
     def get_grade_color(self, grade: str) -> colors.Color:
         """Get color for a grade letter."""
-        grade_colors = {
+        if self._grade_colors is None:
+            self._grade_colors = self._build_grade_colors()
+        return self._grade_colors.get(grade, self.colors['text'])
+
+    def _build_grade_colors(self) -> Dict[str, colors.Color]:
+        """Build the grade letter to color map."""
+        return {
             'A': self.colors['success'],
             'B': colors.HexColor('#3B82F6'),
             'C': self.colors['warning'],
@@ -757,75 +1069,89 @@ class ReportGenerator:
             'C6': self.colors['warning'],
             'P7': self.colors['error']
         }
-        return grade_colors.get(grade, self.colors['text'])
 
-    def get_grade_remark(self, score: float) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def get_grade_remark(score: float) -> str:
         """Get remark for a score."""
-        if score >= 85: return 'Excellent'
-        if score >= 75: return 'Very Good'
-        if score >= 65: return 'Good'
-        if score >= 55: return 'Satisfactory'
-        if score >= 45: return 'Fair'
-        return 'Needs Improvement'
+        return REMARKS[bisect_right(REMARK_THRESHOLDS, score)]
 
     def calculate_performance_summary(self, grades: List[Dict[str, Any]], class_level: str) -> Dict[str, Any]:
         """Calculate performance summary statistics."""
+        slot_table, base_letters = _distribution_scale(class_level)
+        _, letters = self.get_grading_scale(class_level)
         total_subjects = len(grades)
-        total_score = sum(grade['score'] for grade in grades)
-        average_score = round(total_score / total_subjects) if total_subjects > 0 else 0
+        total_score = 0
         
-        # Calculate grade distribution
-        grade_distribution = {}
+        # One pass sums scores and counts grades in fixed base-letter slots;
+        # the distribution, UACE points and overall grade all come from
+        # those totals, so the grades are never walked again
+        index_counts = [0] * len(base_letters)
         for grade in grades:
-            letter = self.calculate_grade_letter(grade['score'], class_level)
-            base_letter = letter[0] if len(letter) > 1 else letter
-            grade_distribution[base_letter] = grade_distribution.get(base_letter, 0) + 1
+            score = grade['score']
+            total_score += score
+            index_counts[slot_table[int(score)]] += 1
+        
+        grade_distribution = {
+            letter: count for letter, count in zip(base_letters, index_counts) if count
+        }
+        
+        average_score = round(total_score / total_subjects) if total_subjects > 0 else 0
+        total_points = None
+        if class_level == 'S6':
+            total_points = sum(points * count for points, count in zip(UACE_POINTS, index_counts))
         
         return {
             'total_subjects': total_subjects,
             'average_score': average_score,
-            'overall_grade': self.calculate_grade_letter(average_score, class_level),
+            'overall_grade': letters[_grade_index_table(class_level)[average_score]],
             'grade_distribution': grade_distribution,
             'class_position': None,  # Would need class-wide data
-            'total_points': self.calculate_uace_points(grades) if class_level == 'S6' else None
+            'total_points': total_points
         }
 
     def calculate_uace_points(self, grades: List[Dict[str, Any]]) -> int:
         """Calculate UACE points."""
-        points_map = {'A': 6, 'B': 5, 'C': 4, 'D': 3, 'E': 2, 'O': 1, 'F': 0}
-        total_points = 0
-        for grade in grades:
-            total_points += points_map.get(self.calculate_grade_letter(grade['score'], 'S6'), 0)
-        return total_points
+        # Map each score straight to points, skipping grade indices and letters
+        return sum(UACE_POINTS_BY_SCORE[int(grade['score'])] for grade in grades)
 
-    def get_conduct_data(self, student_id: int, term: str, academic_year: str) -> Dict[str, Any]:
-        """Get conduct data for a student."""
+    @contextmanager
+    def prefetch_student_context(self, student_ids: List[int], term: str, academic_year: str):
+        """
+        Load conduct and attendance for many students for the length of a batch.
+        
+        Use as ``with generator.prefetch_student_context(ids, term, year):``;
+        the prefetched data is dropped on exit so later lookups see fresh edits.
+        """
+        keys = []
+        for student_id, context in self.get_student_context(student_ids, term, academic_year).items():
+            key = (student_id, term, academic_year)
+            self._context_prefetch[key] = context
+            keys.append(key)
         try:
-            conduct = self.db.execute_query(
-                "SELECT * FROM conduct WHERE student_id = ? AND term = ? AND academic_year = ?",
-                (student_id, term, academic_year)
-            )
-            return conduct[0] if conduct else {}
+            yield
+        finally:
+            for key in keys:
+                self._context_prefetch.pop(key, None)
+
+    def _get_student_context(self, student_id: int, term: str, academic_year: str) -> Dict[str, Dict[str, Any]]:
+        """Get one student's conduct and attendance data, falling back to defaults."""
+        context = self._context_prefetch.get((student_id, term, academic_year))
+        if context is not None:
+            return context
+        try:
+            return self.get_student_context([student_id], term, academic_year)[student_id]
         except Exception as e:
-            self.logger.error(f"Failed to get conduct data: {str(e)}")
-            return {}
+            self.logger.error(f"Failed to get conduct and attendance data: {str(e)}")
+            return {'conduct': {}, 'attendance': dict(DEFAULT_ATTENDANCE)}
+
+    def get_conduct_data(self, student_id: int, term: str, academic_year: str) -> Dict[str, Any]:
+        """Get conduct data for a student."""
+        return self._get_student_context(student_id, term, academic_year)['conduct']
 
     def get_attendance_data(self, student_id: int, term: str, academic_year: str) -> Dict[str, Any]:
         """Get attendance data for a student."""
-        try:
-            attendance = self.db.execute_query(
-                "SELECT "
-                "COUNT(CASE WHEN status = 'Present' THEN 1 END) as present_days, "
-                "COUNT(CASE WHEN status = 'Absent' THEN 1 END) as absent_days, "
-                "ROUND(COUNT(CASE WHEN status = 'Present' THEN 1 END) * 100.0 / COUNT(*), 1) as attendance_percentage "
-                "FROM attendance "
-                "WHERE student_id = ? AND term = ? AND academic_year = ?",
-                (student_id, term, academic_year)
-            )
-            return attendance[0] if attendance else {'present_days': 0, 'absent_days': 0, 'attendance_percentage': 100}
-        except Exception as e:
-            self.logger.error(f"Failed to get attendance data: {str(e)}")
-            return {'present_days': 0, 'absent_days': 0, 'attendance_percentage': 100}
+        return self._get_student_context(student_id, term, academic_year)['attendance']
 
     def create_grade_chart(self, grade_distribution: Dict[str, int]) -> Optional[Image]:
         """Create a simple grade distribution chart."""
@@ -839,12 +1165,72 @@ class ReportGenerator:
 
     def generate_verification_hash(self, student: Dict[str, Any], term: str, academic_year: str) -> str:
         """Generate verification hash for QR code."""
-        data = f"{student['student_id']}:{term}:{academic_year}:{datetime.now().date()}"
-        return hashlib.sha256(data.encode()).hexdigest()[:16]
+        # Only 64 bits are shown, so ask BLAKE2b for exactly that; bulk runs
+        # reuse their fixed date instead of reading the clock per report
+        today = self._batch_footer_date or date.today().isoformat()
+        data = f"{student['student_id']}:{term}:{academic_year}:{today}".encode()
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+    def get_table_styles(self) -> Dict[str, TableStyle]:
+        """Get the shared table styles (built once per generator)."""
+        if self._table_styles is None:
+            self._table_styles = {
+                # Label/value boxes: student info, summary, conduct, attendance
+                'info_box': TableStyle([
+                    ('BACKGROUND', (0,0), (-1,-1), self.colors['background']),
+                    ('BOX', (0,0), (-1,-1), 1, self.colors['secondary']),
+                    ('FONT', (0,0), (-1,-1), self.fonts['regular']),
+                    ('FONTSIZE', (0,0), (-1,-1), 10),
+                    ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+                    ('ALIGN', (0,0), (0,-1), 'RIGHT'),
+                    ('ALIGN', (1,0), (1,-1), 'LEFT'),
+                    ('BOTTOMPADDING', (0,0), (-1,-1), 5),
+                    ('TOPPADDING', (0,0), (-1,-1), 5)
+                ]),
+                'grades': TableStyle([
+                    ('BACKGROUND', (0,0), (-1,0), self.colors['secondary']),
+                    ('TEXTCOLOR', (0,0), (-1,0), colors.white),
+                    ('ALIGN', (0,0), (-1,0), 'CENTER'),
+                    ('FONT', (0,0), (-1,0), self.fonts['bold']),
+                    ('FONTSIZE', (0,0), (-1,0), 10),
+                    ('BOTTOMPADDING', (0,0), (-1,0), 8),
+                    ('BACKGROUND', (0,1), (-1,-1), colors.white),
+                    ('GRID', (0,0), (-1,-1), 1, colors.lightgrey),
+                    ('FONT', (0,1), (-1,-1), self.fonts['regular']),
+                    ('FONTSIZE', (0,1), (-1,-1), 9),
+                    ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+                    ('ALIGN', (1,1), (2,-1), 'CENTER'),
+                    ('ROWBACKGROUNDS', (0,1), (-1,-1), [self.colors['background'], colors.white])
+                ]),
+                'two_column': TableStyle([
+                    ('VALIGN', (0,0), (-1,-1), 'TOP'),
+                    ('ALIGN', (0,0), (0,0), 'LEFT'),
+                    ('ALIGN', (1,0), (1,0), 'RIGHT')
+                ]),
+                'two_column_centered': TableStyle([
+                    ('VALIGN', (0,0), (-1,-1), 'TOP'),
+                    ('ALIGN', (0,0), (-1,-1), 'CENTER'),
+                    ('BOTTOMPADDING', (0,0), (-1,-1), 10)
+                ])
+            }
+        return self._table_styles
 
     def get_styles(self) -> Dict[str, ParagraphStyle]:
-        """Get predefined paragraph styles."""
-        styles = getSampleStyleSheet()
+        """Get predefined paragraph styles (built once per font/color configuration)."""
+        if self._styles_cache is None:
+            key = (tuple(self.fonts.items()),
+                   tuple((name, color.hexval()) for name, color in self.colors.items()))
+            styles = ReportGenerator._styles_by_config.get(key)
+            if styles is None:
+                styles = ReportGenerator._styles_by_config[key] = self._build_styles()
+            self._styles_cache = styles
+        return self._styles_cache
+
+    def _build_styles(self) -> Dict[str, ParagraphStyle]:
+        """Build the paragraph styles used in reports."""
+        styles = ReportGenerator._sample_styles
+        if styles is None:
+            styles = ReportGenerator._sample_styles = getSampleStyleSheet()
         
         custom_styles = {
             'Heading1': ParagraphStyle(
@@ -909,43 +1295,24 @@ class ReportGenerator:
             )
         }
         
-        return {**styles, **custom_styles}
+        return {**styles.byName, **custom_styles}
 
     # Template creation methods
     def create_ple_template(self) -> Dict[str, Any]:
         """Create PLE standard template."""
-        return {
-            'name': 'PLE Standard Template',
-            'type': 'PLE',
-            'grading_system': 'division',
-            'subjects': ['English', 'Mathematics', 'Science', 'Social Studies'],
-            'show_aggregate': True,
-            'show_division': True
-        }
+        return dict(PLE_TEMPLATE)
 
     def create_uce_template(self) -> Dict[str, Any]:
         """Create UCE standard template."""
-        return {
-            'name': 'UCE Standard Template',
-            'type': 'UCE',
-            'grading_system': 'letter',
-            'subjects': ['English', 'Mathematics', 'Physics', 'Chemistry', 'Biology', 'History', 'Geography'],
-            'show_aggregate': False,
-            'show_division': False
-        }
+        return dict(UCE_TEMPLATE)
 
     def create_uace_template(self) -> Dict[str, Any]:
         """Create UACE standard template."""
-        return {
-            'name': 'UACE Standard Template',
-            'type': 'UACE',
-            'grading_system': 'points',
-            'subjects': [],  # Variable based on combination
-            'show_points': True,
-            'show_university_eligibility': True
-        }
+        return dict(UACE_TEMPLATE)
 
     def cleanup(self):
         """Clean up resources."""
         self.template_cache.clear()
+        self._section_cache = threading.local()
+        self._context_prefetch.clear()
         self.logger.info('ReportGenerator cleanup completed')
\ No newline at end of file
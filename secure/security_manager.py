@@ -1,18 +1,120 @@
 import os
+import re
 import json
+import time
+import heapq
+import struct
 import logging
-import sqlite3
+import threading
+import hmac
+import base64
 import hashlib
 import secrets
 import bcrypt
 import jwt
-import cryptography
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Tuple, Union, Any
+from typing import Optional, Dict, List, Tuple
 from pathlib import Path
 from PySide6.QtCore import QObject, Signal, QTimer
 
+# Marks hashes made from an HMAC-SHA256 prehash; unmarked hashes are legacy
+# raw bcrypt over password + pepper (truncated by bcrypt at 72 bytes)
+BCRYPT_SHA256_PREFIX = '$bcrypt-sha256$'
+
+# .marka_keys layout: magic, base64 Fernet key, hex JWT secret, generation time
+KEYS_MAGIC = b'MKEY\x01'
+FERNET_KEY_SIZE = 44
+JWT_SECRET_SIZE = 128  # secrets.token_hex(64)
+KEYS_FILE_SIZE = len(KEYS_MAGIC) + FERNET_KEY_SIZE + JWT_SECRET_SIZE + 8
+
+# encrypt_data output: base64url(version byte + 12-byte nonce + AES-GCM ciphertext).
+# Fernet tokens, written by older versions, decode to a leading 0x80 byte.
+AESGCM_VERSION = 0x01
+FERNET_VERSION = 0x80
+AESGCM_NONCE_SIZE = 12
+
+# sanitize_input tables: characters stripped for blacklist types, and for
+# whitelist types every byte outside the allowed ASCII set, for bytes.translate
+TEXT_STRIP_TABLE = str.maketrans('', '', '<>"\'&')
+SQL_STRIP_TABLE = str.maketrans('', '', '\'";\\')
+
+
+def _bytes_outside(allowed: str) -> bytes:
+    """Return every byte value not in allowed, for bytes.translate's delete argument."""
+    keep = set(allowed.encode())
+    return bytes(b for b in range(256) if b not in keep)
+
+
+_LETTERS_DIGITS = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
+_EMAIL_ALLOWED = 'abcdefghijklmnopqrstuvwxyz0123456789@._-'
+_FILENAME_ALLOWED = _LETTERS_DIGITS + '._-'
+EMAIL_DISALLOWED = _bytes_outside(_EMAIL_ALLOWED)
+ALPHANUMERIC_DISALLOWED = _bytes_outside(_LETTERS_DIGITS)
+FILENAME_DISALLOWED = _bytes_outside(_FILENAME_ALLOWED)
+
+# sanitize_inputs_bulk joins a batch with newlines, so its tables keep them
+BULK_DISALLOWED = {
+    'email': _bytes_outside(_EMAIL_ALLOWED + '\n'),
+    'alphanumeric': _bytes_outside(_LETTERS_DIGITS + '\n'),
+    'filename': _bytes_outside(_FILENAME_ALLOWED + '\n'),
+}
+
+# validate_input type checks
+EMAIL_PATTERN = re.compile(r'^[^\s@]+@[^\s@]+\.[^\s@]+$')
+PHONE_PATTERN = re.compile(r'^\+?[1-9]\d{1,14}$')
+
+# validate_password_strength character classes, as bit flags
+CHAR_UPPER, CHAR_LOWER, CHAR_DIGIT, CHAR_SPECIAL = 1, 2, 4, 8
+COMMON_PASSWORD_PATTERN = re.compile('123456|password|qwerty|abc123|admin')
+
+
+def _char_class(c: str) -> int:
+    """Return the strength-check class flags for one character."""
+    return ((CHAR_UPPER if c.isupper() else 0) | (CHAR_LOWER if c.islower() else 0)
+            | (CHAR_DIGIT if c.isdigit() else 0) | (0 if c.isalnum() else CHAR_SPECIAL))
+
+
+ASCII_CHAR_CLASS = bytes(_char_class(chr(i)) for i in range(128))
+
+
+class _RandomPool(threading.local):
+    """
+    Per-thread buffer of OS CSPRNG bytes handed out in slices, so token ids
+    cost one urandom call per 256 tokens. Refilled after fork so parent and
+    child never hand out the same bytes.
+    """
+    
+    POOL_SIZE = 4096
+    
+    def __init__(self):
+        self.buffer = b''
+        self.pos = 0
+        self.pid = None
+    
+    def token_hex(self, nbytes: int = 16) -> str:
+        """Return nbytes of randomness as hex, like secrets.token_hex."""
+        if self.pos + nbytes > len(self.buffer) or self.pid != os.getpid():
+            self.buffer = os.urandom(max(self.POOL_SIZE, nbytes))
+            self.pos = 0
+            self.pid = os.getpid()
+        start = self.pos
+        self.pos += nbytes
+        return self.buffer[start:self.pos].hex()
+
+
+_random_pool = _RandomPool()
+
+
+def _b64url_decode(segment: str) -> bytes:
+    """Decode an unpadded base64url JWT segment."""
+    return base64.urlsafe_b64decode(segment + '=' * (-len(segment) % 4))
+
 class SecurityManager(QObject):
     """
     A comprehensive security manager for handling encryption, authentication,
@@ -33,15 +135,31 @@ class SecurityManager(QObject):
         self.max_login_attempts = 5
         self.lockout_duration = timedelta(minutes=15)
         self.session_timeout = timedelta(minutes=30)
+        self.token_cache_size = 10000  # Verified tokens remembered at most
+        self.token_cache_ttl = 5  # Seconds a verified token is trusted without re-checking
         
         # State tracking
         self.active_sessions: Dict[str, dict] = {}
+        self._sessions_by_user: Dict[str, set] = {}
+        # Min-heap of (lastActivityMono, session_id); entries go stale when a
+        # session is touched or destroyed and are dropped lazily on cleanup
+        self._session_expiry: List[Tuple[float, str]] = []
         self.failed_attempts: Dict[str, dict] = {}
         self.rate_limiters: Dict[str, dict] = {}
+        self._token_cache: OrderedDict = OrderedDict()  # blake2b(token) -> (claims, expires_at)
         
         # Initialize security components
+        # Key material is held in bytearrays so cleanup() can overwrite it in place
         self.encryption_key = None
         self.jwt_secret = None
+        self._jwt_key = None  # jwt_secret as bytes for the HMAC fast path
+        self._hs256_headers = set()  # Encoded headers already seen on verified HS256 tokens
+        self._fernet = None  # Decrypts data written before the switch to AES-GCM
+        self._aead = None  # AES-256-GCM keyed from encryption_key
+        
+        # bcrypt releases the GIL, so hashing on worker threads keeps the UI responsive
+        self._bcrypt_pool = ThreadPoolExecutor(max_workers=os.cpu_count(),
+                                               thread_name_prefix='marka-bcrypt')
         
         self.initialize()
     
@@ -49,8 +167,7 @@ class SecurityManager(QObject):
         """Initialize the security manager components."""
         try:
             self._initialize_keys()
-            self._setup_session_cleanup()
-            self._setup_rate_limit_cleanup()
+            self._setup_cleanup_timer()
             self.logger.info("SecurityManager initialized successfully")
         except Exception as e:
             self.logger.error(f"Failed to initialize SecurityManager: {e}")
@@ -60,11 +177,35 @@ class SecurityManager(QObject):
         """Initialize or load encryption keys."""
         try:
             if self.keys_file.exists():
-                with open(self.keys_file, 'r') as f:
-                    keys = json.load(f)
-                self.encryption_key = keys['encryption_key'].encode()
-                self.jwt_secret = keys['jwt_secret']
+                # Read into a mutable buffer so the raw key bytes can be wiped
+                with open(self.keys_file, 'rb') as f:
+                    raw = bytearray(os.fstat(f.fileno()).st_size)
+                    f.readinto(raw)
+                try:
+                    if raw.startswith(KEYS_MAGIC) and len(raw) == KEYS_FILE_SIZE:
+                        offset = len(KEYS_MAGIC)
+                        self.encryption_key = raw[offset:offset + FERNET_KEY_SIZE]
+                        offset += FERNET_KEY_SIZE
+                        self._jwt_key = raw[offset:offset + JWT_SECRET_SIZE]
+                        self.jwt_secret = self._jwt_key.decode('ascii')
+                        legacy = False
+                    else:
+                        # Keys written by older versions as JSON
+                        keys = json.loads(raw)
+                        self.encryption_key = bytearray(keys['encryption_key'].encode())
+                        self.jwt_secret = keys['jwt_secret']
+                        self._jwt_key = bytearray(self.jwt_secret.encode())
+                        legacy = True
+                finally:
+                    raw[:] = bytes(len(raw))
+                self._build_ciphers()
                 self._verify_keys()
+                if legacy and len(self.encryption_key) == FERNET_KEY_SIZE \
+                        and len(self._jwt_key) == JWT_SECRET_SIZE:
+                    try:
+                        self._write_keys_file()
+                    except OSError as e:
+                        self.logger.warning(f"Could not convert keys file: {e}")
             else:
                 self._generate_new_keys()
         except Exception as e:
@@ -76,27 +217,51 @@ class SecurityManager(QObject):
         self.logger.info("Generating new security keys")
         
         # Generate encryption key
-        self.encryption_key = Fernet.generate_key()
+        self.encryption_key = bytearray(Fernet.generate_key())
+        self._build_ciphers()
         
         # Generate JWT secret
         self.jwt_secret = secrets.token_hex(64)
+        self._jwt_key = bytearray(self.jwt_secret.encode())
         
         # Save keys securely
-        key_data = {
-            'encryption_key': self.encryption_key.decode(),
-            'jwt_secret': self.jwt_secret,
-            'generated': datetime.utcnow().isoformat()
-        }
-        
         try:
-            with open(self.keys_file, 'w') as f:
-                json.dump(key_data, f)
-            self.keys_file.chmod(0o600)  # Restrict permissions
+            self._write_keys_file()
             self._verify_keys()
         except Exception as e:
             self.logger.error(f"Failed to save new keys: {e}")
             raise
     
+    def _write_keys_file(self) -> None:
+        """Write the keys in the fixed binary layout, replacing the file atomically."""
+        data = (KEYS_MAGIC + self.encryption_key + self._jwt_key
+                + struct.pack('<Q', int(time.time())))
+        tmp_path = self.keys_file.with_name(self.keys_file.name + '.tmp')
+        # Created owner-only, so the keys are never readable by others
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.keys_file)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    
+    def _build_ciphers(self) -> None:
+        """Build the ciphers for encryption_key, rebuilt whenever the key changes."""
+        key = bytes(self.encryption_key)
+        self._fernet = Fernet(key)
+        # A separate AES key is derived so no key bytes are shared between the schemes
+        aes_key = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=b'marka-aesgcm-v1'
+        ).derive(base64.urlsafe_b64decode(key))
+        self._aead = AESGCM(aes_key)
+    
     def _verify_keys(self) -> None:
         """Verify that the encryption keys are working correctly."""
         # Test encryption/decryption
@@ -121,8 +286,9 @@ class SecurityManager(QObject):
             return ""
             
         try:
-            f = Fernet(self.encryption_key)
-            return f.encrypt(data.encode()).decode()
+            nonce = os.urandom(AESGCM_NONCE_SIZE)
+            ciphertext = self._aead.encrypt(nonce, data.encode(), None)
+            return base64.urlsafe_b64encode(bytes((AESGCM_VERSION,)) + nonce + ciphertext).decode()
         except Exception as e:
             self.logger.error(f"Encryption error: {e}")
             raise ValueError("Failed to encrypt data") from e
@@ -133,19 +299,29 @@ class SecurityManager(QObject):
             return ""
             
         try:
-            f = Fernet(self.encryption_key)
-            return f.decrypt(encrypted_data.encode()).decode()
+            token = encrypted_data.encode()
+            raw = base64.urlsafe_b64decode(token)
+            if raw[0] == FERNET_VERSION:
+                return self._fernet.decrypt(token).decode()
+            if raw[0] != AESGCM_VERSION:
+                raise ValueError(f"Unknown ciphertext version {raw[0]}")
+            nonce = raw[1:1 + AESGCM_NONCE_SIZE]
+            return self._aead.decrypt(nonce, raw[1 + AESGCM_NONCE_SIZE:], None).decode()
         except Exception as e:
             self.logger.error(f"Decryption error: {e}")
             raise ValueError("Failed to decrypt data") from e
     
     # Password hashing
+    def _prehash_password(self, password: str) -> bytes:
+        """HMAC-SHA256 the password with the pepper so bcrypt sees a fixed 44 bytes."""
+        pepper = os.getenv('PASSWORD_PEPPER', 'marka_default_pepper_2025')
+        return base64.b64encode(hmac.new(pepper.encode(), password.encode(), hashlib.sha256).digest())
+    
     def hash_password(self, password: str) -> str:
-        """Hash a password with bcrypt and pepper."""
+        """Hash a password with bcrypt over a peppered SHA-256 prehash."""
         try:
-            pepper = os.getenv('PASSWORD_PEPPER', 'marka_default_pepper_2025')
-            peppered_password = password + pepper
-            return bcrypt.hashpw(peppered_password.encode(), bcrypt.gensalt(self.salt_rounds)).decode()
+            hashed = bcrypt.hashpw(self._prehash_password(password), bcrypt.gensalt(self.salt_rounds))
+            return BCRYPT_SHA256_PREFIX + hashed.decode()
         except Exception as e:
             self.logger.error(f"Password hashing error: {e}")
             raise ValueError("Failed to hash password") from e
@@ -153,6 +329,9 @@ class SecurityManager(QObject):
     def verify_password(self, password: str, hashed_password: str) -> bool:
         """Verify a password against its hash."""
         try:
+            if hashed_password.startswith(BCRYPT_SHA256_PREFIX):
+                return bcrypt.checkpw(self._prehash_password(password),
+                                      hashed_password[len(BCRYPT_SHA256_PREFIX):].encode())
             pepper = os.getenv('PASSWORD_PEPPER', 'marka_default_pepper_2025')
             peppered_password = password + pepper
             return bcrypt.checkpw(peppered_password.encode(), hashed_password.encode())
@@ -160,6 +339,19 @@ class SecurityManager(QObject):
             self.logger.error(f"Password verification error: {e}")
             return False
     
+    def hash_password_async(self, password: str) -> Future:
+        """
+        Hash a password on a worker thread.
+        
+        Returns a Future resolving to the hash. Done callbacks run on the worker
+        thread, so UI code should hand results back through a signal.
+        """
+        return self._bcrypt_pool.submit(self.hash_password, password)
+    
+    def verify_password_async(self, password: str, hashed_password: str) -> Future:
+        """Verify a password on a worker thread; returns a Future resolving to a bool."""
+        return self._bcrypt_pool.submit(self.verify_password, password, hashed_password)
+    
     # JWT token management
     def generate_token(self, payload: dict, expires_in: Optional[str] = None) -> str:
         """Generate a JWT token with the given payload."""
@@ -167,7 +359,7 @@ class SecurityManager(QObject):
             token_payload = {
                 **payload,
                 'iat': int(datetime.utcnow().timestamp()),
-                'jti': secrets.token_hex(16),  # Unique token ID
+                'jti': _random_pool.token_hex(16),  # Unique token ID
                 'iss': 'marka-app',
                 'aud': 'marka-users'
             }
@@ -184,8 +376,27 @@ class SecurityManager(QObject):
     
     def verify_token(self, token: str) -> dict:
         """Verify a JWT token and return its payload."""
+        if not isinstance(token, (str, bytes)):
+            raise ValueError("Invalid token")
+        
+        # Only successfully verified tokens are cached, never failures
+        # Keyed by a 128-bit digest so bearer tokens aren't kept in the cache
+        cache_key = hashlib.blake2b(token.encode() if isinstance(token, str) else token,
+                                    digest_size=16).digest()
+        cached = self._token_cache.get(cache_key)
+        if cached is not None:
+            claims, expires_at = cached
+            if time.time() < expires_at:
+                self._token_cache.move_to_end(cache_key)
+                return dict(claims)
+            del self._token_cache[cache_key]
+        
+        claims = self._verify_token_fast(token) if isinstance(token, str) else None
+        if claims is not None:
+            return self._cache_token_claims(cache_key, claims)
+        
         try:
-            return jwt.decode(
+            claims = jwt.decode(
                 token,
                 self.jwt_secret,
                 algorithms=['HS256'],
@@ -199,6 +410,55 @@ class SecurityManager(QObject):
         except Exception as e:
             self.logger.error(f"Token verification error: {e}")
             raise ValueError("Token verification failed") from e
+        
+        return self._cache_token_claims(cache_key, claims)
+    
+    def _verify_token_fast(self, token: str) -> Optional[dict]:
+        """
+        Verify one of our own HS256 tokens with a direct HMAC check.
+        
+        Returns the claims only when the token is valid in every respect
+        verify_token checks; anything else returns None so jwt.decode can
+        decide and raise the appropriate error.
+        """
+        try:
+            header_b64, payload_b64, signature_b64 = token.split('.')
+            # Every token we issue carries the same header, so it is only
+            # decoded until one verified token has vouched for it
+            known_header = header_b64 in self._hs256_headers
+            if not known_header and json.loads(_b64url_decode(header_b64)).get('alg') != 'HS256':
+                return None
+            expected = hmac.new(self._jwt_key, f"{header_b64}.{payload_b64}".encode(),
+                                hashlib.sha256).digest()
+            if not hmac.compare_digest(expected, _b64url_decode(signature_b64)):
+                return None
+            if not known_header:
+                self._hs256_headers.add(header_b64)
+            claims = json.loads(_b64url_decode(payload_b64))
+        except (ValueError, TypeError, AttributeError):
+            return None
+        
+        if not isinstance(claims, dict) or 'nbf' in claims:
+            return None
+        if claims.get('iss') != 'marka-app' or claims.get('aud') != 'marka-users':
+            return None
+        now = time.time()
+        exp, iat = claims.get('exp'), claims.get('iat')
+        if not isinstance(exp, (int, float)) or exp <= now:
+            return None
+        if iat is not None and (not isinstance(iat, int) or iat > now):
+            return None
+        return claims
+    
+    def _cache_token_claims(self, cache_key: bytes, claims: dict) -> dict:
+        """Remember verified claims briefly and return a copy for the caller."""
+        expires_at = time.time() + self.token_cache_ttl
+        if 'exp' in claims:
+            expires_at = min(expires_at, claims['exp'])
+        self._token_cache[cache_key] = (claims, expires_at)
+        if len(self._token_cache) > self.token_cache_size:
+            self._token_cache.popitem(last=False)
+        return dict(claims)
     
     def refresh_token(self, token: str) -> str:
         """Refresh an existing JWT token."""
@@ -216,18 +476,21 @@ class SecurityManager(QObject):
     # Session management
     def create_session(self, user_id: str, user_data: dict) -> dict:
         """Create a new user session."""
-        session_id = secrets.token_hex(16)
+        session_id = _random_pool.token_hex(16)
         session = {
             'id': session_id,
             'userId': user_id,
             'userData': user_data,
             'createdAt': datetime.utcnow(),
             'lastActivity': datetime.utcnow(),
+            'lastActivityMono': time.monotonic(),  # Expiry clock, immune to wall-clock changes
             'ipAddress': None,
             'userAgent': None
         }
         
         self.active_sessions[session_id] = session
+        self._sessions_by_user.setdefault(user_id, set()).add(session_id)
+        heapq.heappush(self._session_expiry, (session['lastActivityMono'], session_id))
         
         # Generate session token
         token = self.generate_token({
@@ -246,50 +509,82 @@ class SecurityManager(QObject):
             return None
         
         # Check if session has expired
-        if datetime.utcnow() - session['lastActivity'] > self.session_timeout:
+        now = time.monotonic()
+        if now - session['lastActivityMono'] > self.session_timeout.total_seconds():
             self.destroy_session(session_id)
             return None
         
         # Update last activity
         session['lastActivity'] = datetime.utcnow()
-        self.active_sessions[session_id] = session
+        session['lastActivityMono'] = now
+        heapq.heappush(self._session_expiry, (now, session_id))
+        if len(self._session_expiry) > 4 * len(self.active_sessions) + 64:
+            self._compact_session_expiry()
         
         return session
     
     def destroy_session(self, session_id: str) -> bool:
         """Destroy a session by its ID."""
-        return self.active_sessions.pop(session_id, None) is not None
+        session = self.active_sessions.pop(session_id, None)
+        if session is None:
+            return False
+        
+        user_sessions = self._sessions_by_user.get(session['userId'])
+        if user_sessions is not None:
+            user_sessions.discard(session_id)
+            if not user_sessions:
+                del self._sessions_by_user[session['userId']]
+        return True
     
     def destroy_all_user_sessions(self, user_id: str) -> int:
         """Destroy all sessions for a specific user."""
-        to_delete = [sid for sid, sess in self.active_sessions.items() 
-                    if sess['userId'] == user_id]
+        to_delete = self._sessions_by_user.pop(user_id, ())
         
         for sid in to_delete:
             self.active_sessions.pop(sid, None)
         
         return len(to_delete)
     
-    def _setup_session_cleanup(self) -> None:
-        """Set up periodic cleanup of expired sessions."""
-        self.session_cleanup_timer = QTimer()
-        self.session_cleanup_timer.timeout.connect(self._cleanup_expired_sessions)
-        self.session_cleanup_timer.start(5 * 60 * 1000)  # Every 5 minutes
+    def _compact_session_expiry(self) -> None:
+        """Rebuild the expiry heap with one live entry per active session."""
+        self._session_expiry = [(session['lastActivityMono'], session_id)
+                                for session_id, session in self.active_sessions.items()]
+        heapq.heapify(self._session_expiry)
+    
+    def _setup_cleanup_timer(self) -> None:
+        """Set up one periodic timer driving both the session and rate-limit sweeps."""
+        self._cleanup_ticks = 0
+        self.cleanup_timer = QTimer()
+        self.cleanup_timer.timeout.connect(self._on_cleanup_tick)
+        self.cleanup_timer.start(5 * 60 * 1000)  # Every 5 minutes
+    
+    def _on_cleanup_tick(self) -> None:
+        """Sweep sessions every tick and rate limiters every second tick (10 minutes)."""
+        self._cleanup_ticks += 1
+        self._cleanup_expired_sessions()
+        if self._cleanup_ticks % 2 == 0:
+            self._cleanup_rate_limiters()
     
     def _cleanup_expired_sessions(self) -> None:
         """Clean up expired sessions."""
-        now = datetime.utcnow()
-        expired = []
-        
-        for session_id, session in self.active_sessions.items():
-            if now - session['lastActivity'] > self.session_timeout:
-                expired.append(session_id)
-        
-        for session_id in expired:
-            self.active_sessions.pop(session_id, None)
+        if not self._session_expiry:
+            return
+        
+        cutoff = time.monotonic() - self.session_timeout.total_seconds()
+        expiry = self._session_expiry
+        expired = 0
+        
+        # Only entries older than the timeout are visited; an entry whose
+        # timestamp no longer matches its session has a newer one queued
+        while expiry and expiry[0][0] < cutoff:
+            last_activity, session_id = heapq.heappop(expiry)
+            session = self.active_sessions.get(session_id)
+            if session is not None and session['lastActivityMono'] == last_activity:
+                self.destroy_session(session_id)
+                expired += 1
         
         if expired:
-            self.logger.info(f"Cleaned up {len(expired)} expired sessions")
+            self.logger.info(f"Cleaned up {expired} expired sessions")
     
     # Authentication security
     def check_login_attempts(self, identifier: str) -> dict:
@@ -300,8 +595,10 @@ class SecurityManager(QObject):
             return {'allowed': True, 'remainingAttempts': self.max_login_attempts}
         
         # Check if account is locked
-        if attempts.get('lockedUntil') and datetime.utcnow() < attempts['lockedUntil']:
-            remaining_time = (attempts['lockedUntil'] - datetime.utcnow()).seconds // 60
+        locked_until = attempts.get('lockedUntilMono')
+        now = time.monotonic()
+        if locked_until and now < locked_until:
+            remaining_time = int(locked_until - now) // 60
             return {
                 'allowed': False,
                 'locked': True,
@@ -310,7 +607,7 @@ class SecurityManager(QObject):
             }
         
         # Reset if lockout period has passed
-        if attempts.get('lockedUntil') and datetime.utcnow() >= attempts['lockedUntil']:
+        if locked_until and now >= locked_until:
             self.failed_attempts.pop(identifier, None)
             return {'allowed': True, 'remainingAttempts': self.max_login_attempts}
         
@@ -319,7 +616,7 @@ class SecurityManager(QObject):
         if remaining_attempts <= 0:
             # Lock the account
             attempts['lockedUntil'] = datetime.utcnow() + self.lockout_duration
-            self.failed_attempts[identifier] = attempts
+            attempts['lockedUntilMono'] = now + self.lockout_duration.total_seconds()
             
             return {
                 'allowed': False,
@@ -332,10 +629,12 @@ class SecurityManager(QObject):
     
     def record_failed_login_attempt(self, identifier: str) -> None:
         """Record a failed login attempt."""
-        attempts = self.failed_attempts.get(identifier, {'count': 0, 'firstAttempt': datetime.utcnow()})
+        now = datetime.utcnow()
+        attempts = self.failed_attempts.get(identifier)
+        if attempts is None:
+            attempts = self.failed_attempts[identifier] = {'count': 0, 'firstAttempt': now}
         attempts['count'] += 1
-        attempts['lastAttempt'] = datetime.utcnow()
-        self.failed_attempts[identifier] = attempts
+        attempts['lastAttempt'] = now
         self.logger.warning(f"Failed login attempt for {identifier}. Count: {attempts['count']}")
         self.security_alert.emit(f"Failed login attempt for {identifier}", "warning")
     
@@ -348,65 +647,63 @@ class SecurityManager(QObject):
     def check_rate_limit(self, identifier: str, max_requests: int = 100, 
                         window_ms: int = 15 * 60 * 1000) -> dict:
         """Check and enforce rate limiting."""
-        now = datetime.utcnow()
-        window_start = now - timedelta(milliseconds=window_ms)
+        now_ns = time.monotonic_ns()
+        window_ns = window_ms * 1_000_000
         
         limiter = self.rate_limiters.get(identifier)
         if not limiter:
-            limiter = {'requests': [], 'firstRequest': now}
+            # Request times are monotonic nanoseconds, oldest first
+            limiter = {'requests': deque(), 'firstRequest': now_ns}
             self.rate_limiters[identifier] = limiter
         
         # Remove requests outside the window
-        limiter['requests'] = [t for t in limiter['requests'] if t > window_start]
+        requests = limiter['requests']
+        window_start = now_ns - window_ns
+        while requests and requests[0] <= window_start:
+            requests.popleft()
         
-        if len(limiter['requests']) >= max_requests:
-            oldest_request = min(limiter['requests'])
-            reset_time = oldest_request + timedelta(milliseconds=window_ms)
-            retry_after = (reset_time - now).total_seconds()
+        if len(requests) >= max_requests:
+            retry_after = (requests[0] + window_ns - now_ns) / 1e9
             
             return {
                 'allowed': False,
                 'limit': max_requests,
                 'remaining': 0,
-                'resetTime': reset_time,
+                'resetTime': datetime.utcnow() + timedelta(seconds=retry_after),
                 'retryAfter': max(0, int(retry_after))
             }
         
         # Add current request
-        limiter['requests'].append(now)
-        self.rate_limiters[identifier] = limiter
+        requests.append(now_ns)
         
         return {
             'allowed': True,
             'limit': max_requests,
-            'remaining': max_requests - len(limiter['requests']),
-            'resetTime': window_start + timedelta(milliseconds=window_ms)
+            'remaining': max_requests - len(requests),
+            'resetTime': datetime.utcnow()
         }
     
-    def _setup_rate_limit_cleanup(self) -> None:
-        """Set up periodic cleanup of old rate limit data."""
-        self.rate_limit_cleanup_timer = QTimer()
-        self.rate_limit_cleanup_timer.timeout.connect(self._cleanup_rate_limiters)
-        self.rate_limit_cleanup_timer.start(10 * 60 * 1000)  # Every 10 minutes
-    
     def _cleanup_rate_limiters(self) -> None:
         """Clean up old rate limit data."""
-        now = datetime.utcnow()
-        window = timedelta(milliseconds=15 * 60 * 1000)
+        if not self.rate_limiters:
+            return
+        
+        window_start = time.monotonic_ns() - 15 * 60 * 1_000_000_000
         cleaned_count = 0
         
         for identifier, limiter in list(self.rate_limiters.items()):
-            # Remove old requests
-            original_length = len(limiter['requests'])
-            limiter['requests'] = [t for t in limiter['requests'] 
-                                 if t > now - window]
+            # Remove old requests; a limiter idle for the whole window is
+            # emptied in one call instead of popping request by request
+            requests = limiter['requests']
+            if requests and requests[-1] <= window_start:
+                requests.clear()
+            while requests and requests[0] <= window_start:
+                requests.popleft()
             
             # Remove limiter if no recent requests
-            if not limiter['requests'] and now - limiter['firstRequest'] > window:
+            if not requests and limiter['firstRequest'] < window_start:
                 self.rate_limiters.pop(identifier, None)
                 cleaned_count += 1
-            elif len(limiter['requests']) < original_length:
-                self.rate_limiters[identifier] = limiter
         
         if cleaned_count > 0:
             self.logger.info(f"Cleaned up {cleaned_count} old rate limiters")
@@ -419,22 +716,42 @@ class SecurityManager(QObject):
         
         if input_type == 'text':
             # Remove potentially dangerous characters
-            return input_str.translate(str.maketrans('', '', '<>"\'&')).strip()
+            return input_str.translate(TEXT_STRIP_TABLE).strip()
         elif input_type == 'email':
             # Basic email sanitization
-            return input_str.lower().strip().translate(str.maketrans('', '', '^a-z0-9@._-'))
+            return self._keep_ascii(input_str.lower().strip(), EMAIL_DISALLOWED)
         elif input_type == 'alphanumeric':
             # Allow only letters and numbers
-            return input_str.translate(str.maketrans('', '', '^a-zA-Z0-9'))
+            return self._keep_ascii(input_str, ALPHANUMERIC_DISALLOWED)
         elif input_type == 'filename':
             # Safe filename characters
-            return input_str.translate(str.maketrans('', '', '^a-zA-Z0-9._-')).strip()
+            return self._keep_ascii(input_str, FILENAME_DISALLOWED).strip()
         elif input_type == 'sql':
             # Escape SQL-like characters (though we use parameterized queries)
-            return input_str.translate(str.maketrans('', '', '\'";\\'))
+            return input_str.translate(SQL_STRIP_TABLE)
         else:
             return input_str.strip()
     
+    @staticmethod
+    def _keep_ascii(input_str: str, disallowed: bytes) -> str:
+        """Keep only whitelisted ASCII characters, filtering bytes in C."""
+        return input_str.encode('ascii', 'ignore').translate(None, disallowed).decode('ascii')
+    
+    def sanitize_inputs_bulk(self, items: List[str], input_type: str = 'text') -> List[str]:
+        """Sanitize many inputs of the same type, filtering whitelist types in one pass."""
+        disallowed = BULK_DISALLOWED.get(input_type)
+        if disallowed is None or not all(isinstance(item, str) and '\n' not in item for item in items):
+            return [self.sanitize_input(item, input_type) for item in items]
+        if not items:
+            return []
+        
+        # Whitelist filters drop all whitespace, so the batch can be joined,
+        # translated once in C and split back on the newlines the tables keep
+        joined = '\n'.join(items)
+        if input_type == 'email':
+            joined = joined.lower()
+        return joined.encode('ascii', 'ignore').translate(None, disallowed).decode('ascii').split('\n')
+    
     def validate_input(self, input_data: dict, rules: dict) -> dict:
         """Validate input data against specified rules."""
         errors = []
@@ -454,13 +771,13 @@ class SecurityManager(QObject):
             # Type validation
             if field_rules.get('type'):
                 if field_rules['type'] == 'email':
-                    if not re.match(r'^[^\s@]+@[^\s@]+\.[^\s@]+$', str(value)):
+                    if not EMAIL_PATTERN.match(str(value)):
                         errors.append(f"{field} must be a valid email address")
                 elif field_rules['type'] == 'number':
                     if not str(value).isdigit():
                         errors.append(f"{field} must be a number")
                 elif field_rules['type'] == 'phone':
-                    if not re.match(r'^\+?[1-9]\d{1,14}$', str(value).replace(' ', '')):
+                    if not PHONE_PATTERN.match(str(value).replace(' ', '')):
                         errors.append(f"{field} must be a valid phone number")
                 elif field_rules['type'] == 'url':
                     try:
@@ -506,6 +823,15 @@ class SecurityManager(QObject):
             'isStrong': False
         }
         
+        # Collect every character class in one pass; ASCII goes through a table
+        char_classes = 0
+        if password.isascii():
+            for byte in password.encode():
+                char_classes |= ASCII_CHAR_CLASS[byte]
+        else:
+            for c in password:
+                char_classes |= _char_class(c)
+        
         # Length check
         if len(password) >= 8:
             result['score'] += 1
@@ -513,32 +839,31 @@ class SecurityManager(QObject):
             result['feedback'].append('Password must be at least 8 characters long')
         
         # Uppercase letter
-        if any(c.isupper() for c in password):
+        if char_classes & CHAR_UPPER:
             result['score'] += 1
         else:
             result['feedback'].append('Password must contain at least one uppercase letter')
         
         # Lowercase letter
-        if any(c.islower() for c in password):
+        if char_classes & CHAR_LOWER:
             result['score'] += 1
         else:
             result['feedback'].append('Password must contain at least one lowercase letter')
         
         # Number
-        if any(c.isdigit() for c in password):
+        if char_classes & CHAR_DIGIT:
             result['score'] += 1
         else:
             result['feedback'].append('Password must contain at least one number')
         
         # Special character
-        if any(not c.isalnum() for c in password):
+        if char_classes & CHAR_SPECIAL:
             result['score'] += 1
         else:
             result['feedback'].append('Password must contain at least one special character')
         
         # No common patterns
-        common_patterns = ['123456', 'password', 'qwerty', 'abc123', 'admin']
-        has_common_pattern = any(p in password.lower() for p in common_patterns)
+        has_common_pattern = COMMON_PASSWORD_PATTERN.search(password.lower()) is not None
         
         if has_common_pattern:
             result['score'] -= 2
@@ -552,18 +877,24 @@ class SecurityManager(QObject):
     # Cleanup methods
     def cleanup(self) -> None:
         """Clean up sensitive data from memory."""
-        if self.encryption_key:
-            # Overwrite the key in memory
-            self.encryption_key = b'\x00' * len(self.encryption_key)
+        # Overwrite key material in place; rebinding would leave the old bytes in memory
+        for key in (self.encryption_key, self._jwt_key):
+            if key:
+                key[:] = bytes(len(key))
+        self._fernet = None
+        self._aead = None
+        self.jwt_secret = None
         
         self.active_sessions.clear()
+        self._sessions_by_user.clear()
+        self._session_expiry.clear()
         self.failed_attempts.clear()
         self.rate_limiters.clear()
+        self._token_cache.clear()
         
-        if hasattr(self, 'session_cleanup_timer'):
-            self.session_cleanup_timer.stop()
+        if hasattr(self, 'cleanup_timer'):
+            self.cleanup_timer.stop()
         
-        if hasattr(self, 'rate_limit_cleanup_timer'):
-            self.rate_limit_cleanup_timer.stop()
+        self._bcrypt_pool.shutdown(wait=False)
         
         self.logger.info("SecurityManager cleanup completed")
\ No newline at end of file
@@ -0,0 +1,82 @@
+import base64
+import json
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest import mock
+
+try:
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import padding, rsa
+    from license.license_manager import LicenseManager
+except ImportError:  # PySide6 / cryptography not installed
+    LicenseManager = None
+
+
+class _FakeApp:
+    def __init__(self, data_dir):
+        self.data_dir = data_dir
+
+    def get_user_data_dir(self):
+        return self.data_dir
+
+    def get_version(self):
+        return 'test'
+
+
+@unittest.skipIf(LicenseManager is None, 'license manager dependencies not installed')
+class LegacyLicenseFileTest(unittest.TestCase):
+    """License files written before signed payloads must still load."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+        with mock.patch.object(LicenseManager, 'initialize'):
+            self.manager = LicenseManager(_FakeApp(self.tmp.name))
+        self.manager.public_key = self.private_key.public_key()
+
+    def _write_baseline_license(self, **overrides):
+        """Sign and save a license the way the baseline code expected it."""
+        license_data = {
+            'id': 'lic-1',
+            'type': 'PRO',
+            'machineId': self.manager.machine_id,
+            'expiry': (datetime.now(timezone.utc) + timedelta(days=30)).isoformat(),
+        }
+        signed = json.dumps(license_data, sort_keys=True).encode()
+        signature = self.private_key.sign(
+            signed,
+            padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.MAX_LENGTH),
+            hashes.SHA256()
+        )
+        license_data['signature'] = base64.b64encode(signature).decode()
+        license_data.update(overrides)
+        Path(self.manager.license_file).write_text(json.dumps(license_data))
+        return license_data
+
+    def test_baseline_license_file_loads(self):
+        saved = self._write_baseline_license()
+
+        self.manager._load_license()
+
+        self.assertIsNotNone(self.manager.current_license)
+        self.assertEqual(self.manager.current_license['type'], saved['type'])
+        self.assertTrue(self.manager._is_license_valid())
+
+    def test_tampered_baseline_license_is_rejected(self):
+        self._write_baseline_license(type='LIFETIME')
+
+        self.manager._load_license()
+
+        self.assertIsNone(self.manager.current_license)
+
+    def test_license_without_expiry_is_expired(self):
+        self.assertEqual(self.manager._parse_expiry(None), 0.0)
+        self.assertEqual(self.manager._parse_expiry(''), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()